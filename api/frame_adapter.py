@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import replace
 from pathlib import Path
 from typing import Any
@@ -13,9 +14,9 @@ from outofthisworld.api_models import (
     CraftSnapshot,
     Frame,
     SensorReading,
-    euler_rpy_to_quat,
+    euler_rpy_to_quats,
     frame_to_dict,
-    vec3_from_np,
+    vec3_rows,
 )
 from outofthisworld.physics.constants import C, G
 from outofthisworld.sim.experiments import ExperimentConfig, ExperimentResults, load_config_from_yaml
@@ -39,7 +40,7 @@ def _default_bodies() -> list[BodySnapshot]:
     r_s = float(2.0 * mu / (C**2))
     surface_r = 100_000.0
     surface_phi = -mu / surface_r
-    surface_dilation = float(np.sqrt(max(0.0, 1.0 + 2.0 * surface_phi / (C**2))))
+    surface_dilation = math.sqrt(max(0.0, 1.0 + 2.0 * surface_phi / (C**2)))
 
     return [
         BodySnapshot(
@@ -91,6 +92,21 @@ def _events_for_time(all_events: list[dict[str, object]], t_s: float) -> list[di
     return []
 
 
+def _row_norms(x: np.ndarray) -> np.ndarray:
+    return np.sqrt(np.einsum("ij,ij->i", x, x))
+
+
+def _potential_and_dilation(positions: np.ndarray, mu: float) -> tuple[np.ndarray, np.ndarray]:
+    # Newtonian potential and weak-field clock rate per row; rows at r <= 1e-6 m
+    # keep phi = 0 and a unit rate.
+    r = _row_norms(positions)
+    far = r > 1e-6
+    phi = np.zeros_like(r)
+    np.divide(-mu, r, out=phi, where=far)
+    dilation = np.sqrt(np.maximum(0.0, 1.0 + 2.0 * phi / (C**2)))
+    return phi, dilation
+
+
 def experiment_to_frames(
     results: ExperimentResults,
     *,
@@ -114,38 +130,46 @@ def experiment_to_frames(
         return []
 
     mu = float(r_s * (C**2) / 2.0)
-    tau_true = 0.0
-    tau_est = 0.0
 
-    frames: list[Frame] = []
-    for i, t in enumerate(time):
-        t_s = float(t)
-        dt_s = 0.0
-        if i > 0:
-            dt_s = float(time[i] - time[i - 1])
+    # Every per-frame quantity is computed column-wise up front; the loop only
+    # indexes these lists to assemble snapshots.
+    dt_s = np.diff(time, prepend=time[0])
+    times = time.tolist()
+
+    phi_true, dilation_true = _potential_and_dilation(results.true_position, mu)
+    tau_true = np.cumsum(dt_s * dilation_true).tolist()
+    true_pos = vec3_rows(results.true_position)
+    true_vel = vec3_rows(results.true_velocity)
+    true_quat = euler_rpy_to_quats(results.true_attitude)
+    phi_true_list = phi_true.tolist()
+    dilation_true_list = dilation_true.tolist()
+
+    if include_estimate:
+        phi_est, dilation_est = _potential_and_dilation(results.est_position, mu)
+        tau_est = np.cumsum(dt_s * dilation_est).tolist()
+        est_pos = vec3_rows(results.est_position)
+        est_vel = vec3_rows(results.est_velocity)
+        est_quat = euler_rpy_to_quats(results.est_attitude)
+        phi_est_list = phi_est.tolist()
+        dilation_est_list = dilation_est.tolist()
+        pos_err = results.pos_error_norm.tolist()
+        vel_err = results.vel_error_norm.tolist()
+        att_err = _row_norms(results.att_error).tolist()
+        pos_sigma_3 = (results.pos_sigma_norm * 3.0).tolist()
+        vel_sigma_3 = (results.vel_sigma_norm * 3.0).tolist()
+        att_sigma_3 = (_row_norms(results.att_sigma) * 3.0).tolist()
 
+    frames: list[Frame] = []
+    for i, t_s in enumerate(times):
         craft: list[CraftSnapshot] = []
 
-        true_pos = results.true_position[i]
-        true_vel = results.true_velocity[i]
-        true_att = results.true_attitude[i]
-
-        r_true = float(np.linalg.norm(true_pos))
-        phi_true = 0.0
-        dilation_true = 1.0
-        if r_true > 1e-6:
-            phi_true = float(-mu / r_true)
-            dilation_true = float(np.sqrt(max(0.0, 1.0 + 2.0 * phi_true / (C**2))))
-
-        tau_true = float(tau_true + dt_s * dilation_true)
-
         craft.append(
             CraftSnapshot(
                 id=f"{craft_id}.true",
                 name=f"{craft_name} (true)",
-                position_m=vec3_from_np(true_pos),
-                velocity_mps=vec3_from_np(true_vel),
-                attitude_quat=euler_rpy_to_quat(true_att),
+                position_m=true_pos[i],
+                velocity_mps=true_vel[i],
+                attitude_quat=true_quat[i],
                 sensors=[
                     SensorReading(
                         id=f"{craft_id}.truth",
@@ -153,57 +177,37 @@ def experiment_to_frames(
                         value={},
                     )
                 ],
-                proper_time_s=tau_true,
-                time_dilation_factor=dilation_true,
-                potential_phi=phi_true,
+                proper_time_s=tau_true[i],
+                time_dilation_factor=dilation_true_list[i],
+                potential_phi=phi_true_list[i],
             )
         )
 
         if include_estimate:
-            est_pos = results.est_position[i]
-            est_vel = results.est_velocity[i]
-            est_att = results.est_attitude[i]
-
-            r_est = float(np.linalg.norm(est_pos))
-            phi_est = 0.0
-            dilation_est = 1.0
-            if r_est > 1e-6:
-                phi_est = float(-mu / r_est)
-                dilation_est = float(np.sqrt(max(0.0, 1.0 + 2.0 * phi_est / (C**2))))
-
-            tau_est = float(tau_est + dt_s * dilation_est)
-
-            pos_err = results.pos_error[i]
-            vel_err = results.vel_error[i]
-            att_err = results.att_error[i]
-            pos_sigma = results.pos_sigma[i]
-            vel_sigma = results.vel_sigma[i]
-            att_sigma = results.att_sigma[i]
-
             craft.append(
                 CraftSnapshot(
                     id=f"{craft_id}.est",
                     name=f"{craft_name} (estimated)",
-                    position_m=vec3_from_np(est_pos),
-                    velocity_mps=vec3_from_np(est_vel),
-                    attitude_quat=euler_rpy_to_quat(est_att),
+                    position_m=est_pos[i],
+                    velocity_mps=est_vel[i],
+                    attitude_quat=est_quat[i],
                     sensors=[
                         SensorReading(
                             id=f"{craft_id}.ins_ekf",
                             kind="ins_ekf",
                             value={
-                                "pos_error_norm_m": float(np.linalg.norm(pos_err)),
-                                "vel_error_norm_mps": float(np.linalg.norm(vel_err)),
-                                "att_error_norm_rad": float(np.linalg.norm(att_err)),
-                                "pos_sigma_3_norm_m": float(np.linalg.norm(pos_sigma) * 3.0),
-                                "vel_sigma_3_norm_mps": float(np.linalg.norm(vel_sigma) * 3.0),
-                                "att_sigma_3_norm_rad": float(np.linalg.norm(att_sigma) * 3.0),
+                                "pos_error_norm_m": pos_err[i],
+                                "vel_error_norm_mps": vel_err[i],
+                                "att_error_norm_rad": att_err[i],
+                                "pos_sigma_3_norm_m": pos_sigma_3[i],
+                                "vel_sigma_3_norm_mps": vel_sigma_3[i],
+                                "att_sigma_3_norm_rad": att_sigma_3[i],
                             },
                         )
                     ],
-                    proper_time_s=tau_est,
-                    time_dilation_factor=dilation_est,
-                    potential_phi=phi_est,
+                    proper_time_s=tau_est[i],
+                    time_dilation_factor=dilation_est_list[i],
+                    potential_phi=phi_est_list[i],
                 )
             )
 
@@ -265,4 +269,3 @@ def with_overrides(
         updated = replace(updated, dt=float(dt_s))
 
     return updated
-
@@ -0,0 +1,35 @@
+"""Optional Numba JIT support.
+
+Kernels decorated with ``njit`` are compiled when numba is installed
+(``pip install .[perf]``) and run as plain Python otherwise, so results
+never depend on whether the extra is present.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import numba
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """numba.njit when available, else a no-op supporting ``@njit`` and ``@njit(...)``."""
+    if HAS_NUMBA:
+        return numba.njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
+
+
+# Parallel loop range inside njit(parallel=True) kernels; plain range otherwise
+prange: Any = numba.prange if HAS_NUMBA else range
+
+__all__ = ["HAS_NUMBA", "njit", "prange"]
@@ -106,6 +106,27 @@ def euler_rpy_to_quat(attitude_rpy_rad: np.ndarray) -> Quat:
     return (x, y, z, w)
 
 
+def euler_rpy_to_quats(attitude_rpy_rad: np.ndarray) -> list[Quat]:
+    """Convert (N, 3) roll/pitch/yaw rows (rad) to N quaternions, as euler_rpy_to_quat."""
+    half = 0.5 * np.asarray(attitude_rpy_rad, dtype=np.float64)
+    cr, cp, cy = np.cos(half).T
+    sr, sp, sy = np.sin(half).T
+
+    quats = np.column_stack(
+        [
+            sr * cp * cy - cr * sp * sy,
+            cr * sp * cy + sr * cp * sy,
+            cr * cp * sy - sr * sp * cy,
+            cr * cp * cy + sr * sp * sy,
+        ]
+    )
+    return [tuple(q) for q in quats.tolist()]
+
+
+def vec3_rows(v: np.ndarray) -> list[Vec3]:
+    """Convert (N, 3) rows to N Vec3 tuples in one pass."""
+    return [tuple(row) for row in np.asarray(v, dtype=np.float64).tolist()]
+
+
 def vec3_from_np(v: np.ndarray) -> Vec3:
     return (float(v[0]), float(v[1]), float(v[2]))
-
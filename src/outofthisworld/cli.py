@@ -42,6 +42,12 @@ def main() -> int:
         default=42,
         help="Random seed (default: 42)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Spawned worker processes for the cadence sweep, 0 for one per CPU (default: 1)",
+    )
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -60,6 +66,8 @@ def main() -> int:
     )
 
     args = parser.parse_args()
+    if args.workers < 0:
+        parser.error(f"--workers must be 0 or positive, got {args.workers}")
 
     # Import here to avoid slow startup for --help
     from outofthisworld.output.plots import (
@@ -257,6 +265,7 @@ def _run_sweep(
         intervals=intervals,
         duration_s=duration_s,
         seed=args.seed,
+        max_workers=args.workers or None,
     )
 
     print("Cadence Sweep Results:")
@@ -1,10 +1,16 @@
 """Gravitational measurement models for estimation."""
 
+import math
+
 import numpy as np
 from numpy.typing import NDArray
 
 from outofthisworld.estimation.measurement_types import MeasurementType
-from outofthisworld.physics.orbital import total_acceleration
+from outofthisworld.physics.orbital import (
+    total_acceleration,
+    total_acceleration_batch,
+    two_body_jacobian,
+)
 
 
 class GravityMeasurementModel:
@@ -79,12 +85,33 @@ class GravityMeasurementModel:
         accel = total_acceleration(pos, self.mu, self.j2, self.r_eq)
 
         if self.measurement_type == MeasurementType.GRAVITY_MAGNITUDE:
-            return np.array([np.linalg.norm(accel)])
+            return np.array([math.sqrt(accel @ accel)])
         if self.measurement_type == MeasurementType.GRAVITY_VECTOR_INERTIAL:
             return accel.copy()
 
         raise ValueError(f"Unknown measurement type: {self.measurement_type}")
 
+    def predict_measurement_batch(self, states: NDArray[np.float64]) -> NDArray[np.float64]:
+        """
+        Predict measurements for many states in one vectorized pass.
+
+        Args:
+            states: State vectors [position, velocity], shape (B, n)
+
+        Returns:
+            Predicted measurements, shape (B, m)
+        """
+        n_half = states.shape[1] // 2
+        accel = total_acceleration_batch(states[:, :n_half], self.mu, self.j2, self.r_eq)
+
+        if self.measurement_type == MeasurementType.GRAVITY_MAGNITUDE:
+            squares: NDArray[np.float64] = np.einsum("ij,ij->i", accel, accel)
+            return np.sqrt(squares)[:, np.newaxis]
+        if self.measurement_type == MeasurementType.GRAVITY_VECTOR_INERTIAL:
+            return accel
+
+        raise ValueError(f"Unknown measurement type: {self.measurement_type}")
+
     def measurement_jacobian(self, state: NDArray[np.float64]) -> NDArray[np.float64]:
         """
         Compute measurement Jacobian.
@@ -98,30 +125,29 @@ class GravityMeasurementModel:
         n = len(state)
         n_half = n // 2
         pos = state[:n_half]
-        r = np.linalg.norm(pos)
+        r = math.sqrt(pos @ pos)
 
         if self.measurement_type == MeasurementType.GRAVITY_MAGNITUDE:
             # h(x) = ||a(r)||
             # H = [d(||a||)/d(pos), 0]
             accel = total_acceleration(pos, self.mu, self.j2, self.r_eq)
-            accel_mag = np.linalg.norm(accel)
+            accel_mag = math.sqrt(accel @ accel)
 
+            H = np.zeros((1, n))
             if accel_mag < 1e-6:
-                return np.zeros((1, n))
+                return H
 
             # d(||a||)/d(pos) = (a^T / ||a||) * d(a)/d(pos)
             daccel_dpos = self._acceleration_jacobian(pos, r)
             dnorm_daccel = accel / accel_mag
-            dnorm_dpos = dnorm_daccel @ daccel_dpos
-
-            H = np.concatenate([dnorm_dpos.reshape(1, -1), np.zeros((1, n_half))], axis=1)
+            np.matmul(dnorm_daccel, daccel_dpos, out=H[0, :n_half])
             return H
 
         if self.measurement_type == MeasurementType.GRAVITY_VECTOR_INERTIAL:
             # h(x) = a(r)
-            # H = [d(a)/d(pos), 0]
-            daccel_dpos = self._acceleration_jacobian(pos, r)
-            H = np.block([[daccel_dpos, np.zeros((n_half, n_half))]])
+            # H = [d(a)/d(pos), 0], the gradient written into the left block
+            H = np.zeros((n_half, n))
+            self._acceleration_jacobian(pos, r, out=H[:, :n_half])
             return H
 
         raise ValueError(f"Unknown measurement type: {self.measurement_type}")
@@ -160,6 +186,7 @@ class GravityMeasurementModel:
         self,
         pos: NDArray[np.float64],
         r: float,
+        out: NDArray[np.float64] | None = None,
     ) -> NDArray[np.float64]:
         """
         Compute Jacobian of acceleration w.r.t. position.
@@ -167,21 +194,24 @@ class GravityMeasurementModel:
         Args:
             pos: Position vector
             r: Position magnitude (precomputed)
+            out: Optional zero-initialized (n_half x n_half) array (may be a
+                view) to write the result into
 
         Returns:
             Jacobian matrix (n_half x n_half)
         """
         n_half = len(pos)
-        I = np.eye(n_half)
+        if out is None:
+            out = np.zeros((n_half, n_half))
 
         if r < 1e-6:
-            return np.zeros((n_half, n_half))
+            return out
 
         r3 = r * r * r
         r5 = r3 * r * r
 
         # Two-body term: -mu/r^3 * I + 3*mu/(r^5) * pos*pos^T
-        daccel_dpos = -self.mu / r3 * I + 3 * self.mu / r5 * np.outer(pos, pos)
+        daccel_dpos = two_body_jacobian(pos, self.mu, out=out)
 
         # J2 term (simplified - for 2D case, J2 effect is minimal in equatorial plane)
         # For full 3D J2 Jacobian, would need more complex terms
@@ -201,6 +231,6 @@ class GravityMeasurementModel:
                     if i == 2 and j == 2:  # z-component
                         j2_terms[i, j] += (5 * z_over_r * z_over_r - 3) * pos[i] / r
                     j2_terms[i, j] += 5 * pos[i] * pos[j] * z_over_r / (r * r)
-            daccel_dpos = daccel_dpos + j2_factor * j2_terms
+            daccel_dpos += j2_factor * j2_terms
 
         return daccel_dpos
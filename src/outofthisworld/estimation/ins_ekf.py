@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
 from typing import Final
 
 import numpy as np
 from numpy.typing import NDArray
 
+from outofthisworld._jit import HAS_NUMBA, njit
 from outofthisworld.sensors.imu_profiles import IMUProfile
 
 # State indices
@@ -19,65 +20,352 @@ GYR_BIAS_IDX: Final[slice] = slice(12, 15)  # Gyro bias [12:15]
 
 STATE_DIM: Final[int] = 15
 
+# (row, col) index pairs of each 3x3 block's diagonal, for single-gather sigma reads
+_POS_DIAG_IDX: Final[tuple[NDArray[np.intp], NDArray[np.intp]]] = (np.arange(0, 3),) * 2
+_VEL_DIAG_IDX: Final[tuple[NDArray[np.intp], NDArray[np.intp]]] = (np.arange(3, 6),) * 2
+_ATT_DIAG_IDX: Final[tuple[NDArray[np.intp], NDArray[np.intp]]] = (np.arange(6, 9),) * 2
+
+# (row, col) index pairs of the dt-only diagonals in F: pos<-vel and att<-gyro bias
+_POS_VEL_DIAG_IDX: Final[tuple[NDArray[np.intp], NDArray[np.intp]]] = (
+    np.arange(0, 3),
+    np.arange(3, 6),
+)
+_ATT_GYR_DIAG_IDX: Final[tuple[NDArray[np.intp], NDArray[np.intp]]] = (
+    np.arange(6, 9),
+    np.arange(12, 15),
+)
+
+# Constant identity matrices shared by the hot predict/update paths (read-only)
+_I3: Final[NDArray[np.float64]] = np.eye(3)
+_I15: Final[NDArray[np.float64]] = np.eye(STATE_DIM)
+_I3.setflags(write=False)
+_I15.setflags(write=False)
+
+# Below this squared angle (0.1 rad) rotation_matrix uses its series form;
+# truncation error is O(φ⁶/5040) < 1e-9.
+_SMALL_ANGLE_SQ: Final[float] = 1e-2
+
 
-@dataclass
 class INSState:
-    """Navigation state container."""
-
-    position: NDArray[np.float64]  # [x, y, z] in meters
-    velocity: NDArray[np.float64]  # [vx, vy, vz] in m/s
-    attitude: NDArray[np.float64]  # [θx, θy, θz] rotation vector in rad
-    accel_bias: NDArray[np.float64]  # [bax, bay, baz] in m/s²
-    gyro_bias: NDArray[np.float64]  # [bωx, bωy, bωz] in rad/s
-
-    def to_vector(self) -> NDArray[np.float64]:
-        """Convert to 15-element state vector."""
-        return np.concatenate(
-            [
-                self.position,
-                self.velocity,
-                self.attitude,
-                self.accel_bias,
-                self.gyro_bias,
-            ]
+    """
+    Navigation state container.
+
+    All five quantities live in one contiguous 15-element buffer (laid out
+    as POS_IDX ... GYR_BIAS_IDX), and each attribute is a view of its slice.
+    Assigning an attribute copies into the buffer, so the filter corrects
+    the whole state with one in-place add instead of rebuilding five arrays.
+    """
+
+    __slots__ = ("vector",)
+
+    def __init__(
+        self,
+        position: NDArray[np.float64],
+        velocity: NDArray[np.float64],
+        attitude: NDArray[np.float64],
+        accel_bias: NDArray[np.float64],
+        gyro_bias: NDArray[np.float64],
+    ) -> None:
+        """
+        Initialize the state.
+
+        Args:
+            position: [x, y, z] in meters
+            velocity: [vx, vy, vz] in m/s
+            attitude: [θx, θy, θz] rotation vector in rad
+            accel_bias: [bax, bay, baz] in m/s²
+            gyro_bias: [bωx, bωy, bωz] in rad/s
+        """
+        self.vector: NDArray[np.float64] = np.empty(STATE_DIM)  # Live buffer, not a copy
+        self.vector[POS_IDX] = position
+        self.vector[VEL_IDX] = velocity
+        self.vector[ATT_IDX] = attitude
+        self.vector[ACC_BIAS_IDX] = accel_bias
+        self.vector[GYR_BIAS_IDX] = gyro_bias
+
+    @property
+    def position(self) -> NDArray[np.float64]:
+        """[x, y, z] in meters (view into the state buffer)."""
+        return self.vector[POS_IDX]
+
+    @position.setter
+    def position(self, value: NDArray[np.float64]) -> None:
+        self.vector[POS_IDX] = value
+
+    @property
+    def velocity(self) -> NDArray[np.float64]:
+        """[vx, vy, vz] in m/s (view into the state buffer)."""
+        return self.vector[VEL_IDX]
+
+    @velocity.setter
+    def velocity(self, value: NDArray[np.float64]) -> None:
+        self.vector[VEL_IDX] = value
+
+    @property
+    def attitude(self) -> NDArray[np.float64]:
+        """[θx, θy, θz] rotation vector in rad (view into the state buffer)."""
+        return self.vector[ATT_IDX]
+
+    @attitude.setter
+    def attitude(self, value: NDArray[np.float64]) -> None:
+        self.vector[ATT_IDX] = value
+
+    @property
+    def accel_bias(self) -> NDArray[np.float64]:
+        """[bax, bay, baz] in m/s² (view into the state buffer)."""
+        return self.vector[ACC_BIAS_IDX]
+
+    @accel_bias.setter
+    def accel_bias(self, value: NDArray[np.float64]) -> None:
+        self.vector[ACC_BIAS_IDX] = value
+
+    @property
+    def gyro_bias(self) -> NDArray[np.float64]:
+        """[bωx, bωy, bωz] in rad/s (view into the state buffer)."""
+        return self.vector[GYR_BIAS_IDX]
+
+    @gyro_bias.setter
+    def gyro_bias(self, value: NDArray[np.float64]) -> None:
+        self.vector[GYR_BIAS_IDX] = value
+
+    def __repr__(self) -> str:
+        """Field-by-field representation."""
+        return (
+            f"INSState(position={self.position!r}, velocity={self.velocity!r}, "
+            f"attitude={self.attitude!r}, accel_bias={self.accel_bias!r}, "
+            f"gyro_bias={self.gyro_bias!r})"
         )
 
+    def to_vector(self, out: NDArray[np.float64] | None = None) -> NDArray[np.float64]:
+        """
+        Convert to 15-element state vector.
+
+        Args:
+            out: Optional preallocated 15-element buffer (e.g. a history row)
+                to write into instead of allocating a new array
+
+        Returns:
+            Copy of the state buffer (``out`` itself when given)
+        """
+        if out is None:
+            return self.vector.copy()
+        np.copyto(out, self.vector)
+        return out
+
     @classmethod
     def from_vector(cls, x: NDArray[np.float64]) -> INSState:
-        """Create from 15-element state vector."""
-        return cls(
-            position=x[POS_IDX].copy(),
-            velocity=x[VEL_IDX].copy(),
-            attitude=x[ATT_IDX].copy(),
-            accel_bias=x[ACC_BIAS_IDX].copy(),
-            gyro_bias=x[GYR_BIAS_IDX].copy(),
-        )
+        """Create from 15-element state vector (copied into a new buffer)."""
+        state = cls.__new__(cls)
+        state.vector = np.array(x, dtype=np.float64)
+        return state
 
 
+@njit(cache=True)
 def skew(v: NDArray[np.float64]) -> NDArray[np.float64]:
     """Create skew-symmetric matrix from 3-vector."""
-    return np.array(
-        [
-            [0.0, -v[2], v[1]],
-            [v[2], 0.0, -v[0]],
-            [-v[1], v[0], 0.0],
-        ]
-    )
+    out = np.empty((3, 3))
+    out[0, 0], out[0, 1], out[0, 2] = 0.0, -v[2], v[1]
+    out[1, 0], out[1, 1], out[1, 2] = v[2], 0.0, -v[0]
+    out[2, 0], out[2, 1], out[2, 2] = -v[1], v[0], 0.0
+    return out
+
+
+@njit(cache=True)
+def _rodrigues_coefficients(angle_sq: float) -> tuple[float, float]:
+    """a = sin(φ)/φ and b = (1 - cos(φ))/φ², by Taylor series below the threshold."""
+    if angle_sq < _SMALL_ANGLE_SQ:
+        a = 1.0 - angle_sq / 6.0 * (1.0 - angle_sq / 20.0)
+        b = 0.5 - angle_sq / 24.0 * (1.0 - angle_sq / 30.0)
+        return a, b
+
+    angle = math.sqrt(angle_sq)
+    return math.sin(angle) / angle, (1.0 - math.cos(angle)) / angle_sq
 
 
 def rotation_matrix(theta: NDArray[np.float64]) -> NDArray[np.float64]:
     """
     Compute rotation matrix from rotation vector (Rodrigues formula).
 
-    For small angles, R ≈ I + [θ×].
+    Uses R = I + a·[θ×] + b·[θ×]² with a = sin(φ)/φ, b = (1 - cos(φ))/φ².
+    Below the small-angle threshold a and b come from their Taylor series in φ²,
+    which avoids the sqrt, sin/cos and divisions on the common IMU-step case.
+    The nine entries are formed from scalars ([θ×]² = θθᵀ - φ²I) rather than
+    by building [θ×] and multiplying 3x3 arrays.
+    """
+    x, y, z = theta.tolist()
+    C: NDArray[np.float64] = _rotation_matrix_into(x, y, z, np.empty((3, 3)))
+    return C
+
+
+@njit(cache=True)
+def _rotation_matrix_into(
+    x: float, y: float, z: float, out: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Write rotation_matrix([x, y, z]) into a 3x3 out and return it."""
+    xx, yy, zz = x * x, y * y, z * z
+    a, b = _rodrigues_coefficients(xx + yy + zz)
+    bxy, bxz, byz = b * x * y, b * x * z, b * y * z
+    out[0, 0], out[0, 1], out[0, 2] = 1.0 - b * (yy + zz), bxy - a * z, bxz + a * y
+    out[1, 0], out[1, 1], out[1, 2] = bxy + a * z, 1.0 - b * (xx + zz), byz - a * x
+    out[2, 0], out[2, 1], out[2, 2] = bxz - a * y, byz + a * x, 1.0 - b * (xx + yy)
+    return out
+
+
+@njit(cache=True)
+def _cholesky_gain3(
+    S: NDArray[np.float64],
+    PHt: NDArray[np.float64],
+    out: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Kalman gain K = P Hᵀ S⁻¹ for a 3x3 SPD S via closed-form Cholesky.
+
+    S = L Lᵀ is factored with scalar ops and each row of P Hᵀ is solved by
+    forward/back substitution, so no LAPACK call is made (numba only).
+
+    Args:
+        S: 3x3 innovation covariance (symmetric positive definite)
+        PHt: (n, 3) cross covariance P Hᵀ
+        out: (n, 3) array receiving K
+
+    Returns:
+        out
+    """
+    l00 = math.sqrt(S[0, 0])
+    l10 = S[1, 0] / l00
+    l20 = S[2, 0] / l00
+    l11 = math.sqrt(S[1, 1] - l10 * l10)
+    l21 = (S[2, 1] - l20 * l10) / l11
+    l22 = math.sqrt(S[2, 2] - l20 * l20 - l21 * l21)
+    for j in range(PHt.shape[0]):
+        # L y = b, then Lᵀ k = y (S is symmetric, so row j of K solves S k = PHt[j])
+        y0 = PHt[j, 0] / l00
+        y1 = (PHt[j, 1] - l10 * y0) / l11
+        y2 = (PHt[j, 2] - l20 * y0 - l21 * y1) / l22
+        k2 = y2 / l22
+        k1 = (y1 - l21 * k2) / l11
+        out[j, 0] = (y0 - l10 * k1 - l20 * k2) / l00
+        out[j, 1] = k1
+        out[j, 2] = k2
+    return out
+
+
+@njit(cache=True)
+def _axpy_row(f: float, src: NDArray[np.float64], k: int, dst: NDArray[np.float64], i: int) -> None:
+    """dst[i, :] += f * src[k, :] without a temporary."""
+    for j in range(dst.shape[1]):
+        dst[i, j] += f * src[k, j]
+
+
+@njit(cache=True)
+def _axpy_col(f: float, src: NDArray[np.float64], k: int, dst: NDArray[np.float64], j: int) -> None:
+    """dst[:, j] += f * src[:, k] without a temporary."""
+    for i in range(dst.shape[0]):
+        dst[i, j] += f * src[i, k]
+
+
+@njit(cache=True)
+def _predict_kernel(
+    x: NDArray[np.float64],
+    accel_meas: NDArray[np.float64],
+    omega_meas: NDArray[np.float64],
+    dt: float,
+    C: NDArray[np.float64],
+    F: NDArray[np.float64],
+    P: NDArray[np.float64],
+    Q_d: NDArray[np.float64],
+    FP: NDArray[np.float64],
+    P_out: NDArray[np.float64],
+) -> None:
     """
-    angle = np.linalg.norm(theta)
-    if angle < 1e-10:
-        return np.eye(3)
+    One compiled INSEKF.predict step: mechanization, F blocks and F P Fᵀ + Q_d.
 
-    axis = theta / angle
-    K = skew(axis)
-    return np.eye(3) + np.sin(angle) * K + (1 - np.cos(angle)) * (K @ K)
+    F must already hold the identity and dt-only blocks; its C_bn-dependent
+    blocks are rewritten here. The covariance products visit only F's known
+    off-identity entries (24 of 225) and the result is symmetrized in place.
+    P_out may be P itself: P is only read before P_out is written.
+
+    Args:
+        x: 15-element state vector, advanced in place
+        accel_meas: Measured specific force (3,)
+        omega_meas: Measured angular rate (3,)
+        dt: Time step in seconds
+        C: 3x3 workspace receiving C_bn
+        F: 15x15 transition workspace
+        P: 15x15 float64 covariance
+        Q_d: 15x15 discrete process noise
+        FP: 15x15 scratch for F P
+        P_out: 15x15 array receiving the symmetrized F P Fᵀ + Q_d
+    """
+    ax = accel_meas[0] - x[9]
+    ay = accel_meas[1] - x[10]
+    az = accel_meas[2] - x[11]
+
+    # C_bn from the attitude before it is advanced
+    _rotation_matrix_into(x[6], x[7], x[8], C)
+
+    for i in range(3):
+        x[6 + i] += (omega_meas[i] - x[12 + i]) * dt
+        accel_nav = C[i, 0] * ax + C[i, 1] * ay + C[i, 2] * az
+        x[3 + i] += accel_nav * dt
+        x[i] += x[3 + i] * dt
+
+        # -C_bn [a×] dt and -C_bn dt
+        F[3 + i, 6] = -(C[i, 1] * az - C[i, 2] * ay) * dt
+        F[3 + i, 7] = -(C[i, 2] * ax - C[i, 0] * az) * dt
+        F[3 + i, 8] = -(C[i, 0] * ay - C[i, 1] * ax) * dt
+        F[3 + i, 9] = -C[i, 0] * dt
+        F[3 + i, 10] = -C[i, 1] * dt
+        F[3 + i, 11] = -C[i, 2] * dt
+
+    # F = I plus the pos<-vel and att<-gyro-bias diagonals and the vel<-att and
+    # vel<-accel-bias blocks; F P and (F P) Fᵀ only touch those rows/columns
+    n = F.shape[0]
+    for i in range(n):
+        for j in range(n):
+            FP[i, j] = P[i, j]
+    for i in range(3):
+        _axpy_row(F[i, 3 + i], P, 3 + i, FP, i)
+        for k in range(6, 12):
+            _axpy_row(F[3 + i, k], P, k, FP, 3 + i)
+        _axpy_row(F[6 + i, 12 + i], P, 12 + i, FP, 6 + i)
+    for i in range(n):
+        for j in range(n):
+            P_out[i, j] = Q_d[i, j] + FP[i, j]
+    for j in range(3):
+        _axpy_col(F[j, 3 + j], FP, 3 + j, P_out, j)
+        for k in range(6, 12):
+            _axpy_col(F[3 + j, k], FP, k, P_out, 3 + j)
+        _axpy_col(F[6 + j, 12 + j], FP, 12 + j, P_out, 6 + j)
+    for i in range(n):
+        for j in range(i):
+            P_out[i, j] = P_out[j, i] = 0.5 * (P_out[i, j] + P_out[j, i])
+
+
+def _process_noise_spectral(imu_profile: IMUProfile) -> NDArray[np.float64]:
+    """Construct process noise spectral density matrix from an IMU profile."""
+    # Continuous-time process noise spectral density
+    # Q_c = diag(0, 0, 0, σ²_na, σ²_na, σ²_na, σ²_nω, σ²_nω, σ²_nω,
+    #            σ²_ba, σ²_ba, σ²_ba, σ²_bω, σ²_bω, σ²_bω)
+    return np.diag(
+        [
+            0.0,
+            0.0,
+            0.0,  # Position (no direct noise)
+            imu_profile.accel_white_noise**2,  # Velocity x
+            imu_profile.accel_white_noise**2,  # Velocity y
+            imu_profile.accel_white_noise**2,  # Velocity z
+            imu_profile.gyro_white_noise**2,  # Attitude x
+            imu_profile.gyro_white_noise**2,  # Attitude y
+            imu_profile.gyro_white_noise**2,  # Attitude z
+            imu_profile.accel_bias_instability**2,  # Accel bias x
+            imu_profile.accel_bias_instability**2,  # Accel bias y
+            imu_profile.accel_bias_instability**2,  # Accel bias z
+            imu_profile.gyro_bias_instability**2,  # Gyro bias x
+            imu_profile.gyro_bias_instability**2,  # Gyro bias y
+            imu_profile.gyro_bias_instability**2,  # Gyro bias z
+        ]
+    )
 
 
 class INSEKF:
@@ -94,6 +382,7 @@ class INSEKF:
         initial_state: INSState,
         initial_covariance: NDArray[np.float64],
         imu_profile: IMUProfile,
+        dtype: type[np.floating] = np.float64,
     ) -> None:
         """
         Initialize INS EKF.
@@ -102,38 +391,31 @@ class INSEKF:
             initial_state: Initial navigation state
             initial_covariance: Initial 15x15 covariance matrix
             imu_profile: IMU noise profile for process noise
+            dtype: Covariance storage dtype. Propagation and updates always
+                compute in float64; np.float32 halves the stored footprint.
         """
         self.state = initial_state
-        self.covariance = initial_covariance.copy()
+        self.dtype = np.dtype(dtype)
+        self.covariance = initial_covariance.astype(self.dtype)
         self.imu_profile = imu_profile
 
         # Build process noise from IMU profile
         self._build_process_noise()
 
+        # Workspace reused by predict/update to avoid per-step allocations
+        self._F = _I15.copy()  # Only the off-diagonal blocks are rewritten
+        self._Q_d = np.empty((STATE_DIM, STATE_DIM))
+        self._dt: float | None = None  # dt the dt-only F blocks and Q_d were built for
+        self._K = np.empty((STATE_DIM, 3))
+        self._tmp1 = np.empty((STATE_DIM, STATE_DIM))
+        self._tmp2 = np.empty((STATE_DIM, STATE_DIM))
+        self._accel_nav = np.empty(3)
+        self._C_bn = np.empty((3, 3))
+        self._dx = np.empty(STATE_DIM)
+
     def _build_process_noise(self) -> None:
         """Construct process noise spectral density matrix."""
-        # Continuous-time process noise spectral density
-        # Q_c = diag(0, 0, 0, σ²_na, σ²_na, σ²_na, σ²_nω, σ²_nω, σ²_nω,
-        #            σ²_ba, σ²_ba, σ²_ba, σ²_bω, σ²_bω, σ²_bω)
-        self.Q_spectral = np.diag(
-            [
-                0.0,
-                0.0,
-                0.0,  # Position (no direct noise)
-                self.imu_profile.accel_white_noise**2,  # Velocity x
-                self.imu_profile.accel_white_noise**2,  # Velocity y
-                self.imu_profile.accel_white_noise**2,  # Velocity z
-                self.imu_profile.gyro_white_noise**2,  # Attitude x
-                self.imu_profile.gyro_white_noise**2,  # Attitude y
-                self.imu_profile.gyro_white_noise**2,  # Attitude z
-                self.imu_profile.accel_bias_instability**2,  # Accel bias x
-                self.imu_profile.accel_bias_instability**2,  # Accel bias y
-                self.imu_profile.accel_bias_instability**2,  # Accel bias z
-                self.imu_profile.gyro_bias_instability**2,  # Gyro bias x
-                self.imu_profile.gyro_bias_instability**2,  # Gyro bias y
-                self.imu_profile.gyro_bias_instability**2,  # Gyro bias z
-            ]
-        )
+        self.Q_spectral = _process_noise_spectral(self.imu_profile)
 
     def predict(
         self,
@@ -149,25 +431,35 @@ class INSEKF:
             omega_meas: Measured angular velocity [ωx, ωy, ωz] in rad/s
             dt: Time step in seconds
         """
+        # dt-only terms are rebuilt only when the step size changes
+        if dt != self._dt:
+            self._set_dt(dt)
+
+        if HAS_NUMBA:
+            self._predict_compiled(accel_meas, omega_meas, dt)
+            return
+
+        # State blocks are advanced in place in the state buffer
+        x = self.state.vector
+
         # Bias-corrected measurements
-        accel_corr = accel_meas - self.state.accel_bias
-        omega_corr = omega_meas - self.state.gyro_bias
+        accel_corr = accel_meas - x[ACC_BIAS_IDX]
+        omega_corr = omega_meas - x[GYR_BIAS_IDX]
 
         # Current rotation matrix (body to nav)
-        C_bn = rotation_matrix(self.state.attitude)
+        C_bn = _rotation_matrix_into(*x[ATT_IDX].tolist(), self._C_bn)
 
         # --- State propagation (nonlinear) ---
 
         # Attitude update (first-order integration)
-        delta_theta = omega_corr * dt
-        self.state.attitude = self.state.attitude + delta_theta
+        x[ATT_IDX] += omega_corr * dt
 
         # Velocity update (nav frame acceleration)
-        accel_nav = C_bn @ accel_corr
-        self.state.velocity = self.state.velocity + accel_nav * dt
+        accel_nav = np.matmul(C_bn, accel_corr, out=self._accel_nav)
+        x[VEL_IDX] += accel_nav * dt
 
         # Position update
-        self.state.position = self.state.position + self.state.velocity * dt
+        x[POS_IDX] += x[VEL_IDX] * dt
 
         # Biases: constant (random walk handled via process noise)
         # No explicit update needed
@@ -178,13 +470,39 @@ class INSEKF:
         F = self._compute_state_transition(accel_corr, C_bn, dt)
 
         # Discrete process noise
-        Q_d = self.Q_spectral * dt
+        Q_d = self._Q_d
 
-        # Covariance propagation
-        self.covariance = F @ self.covariance @ F.T + Q_d
+        # Covariance propagation (float64 accumulation regardless of storage)
+        P = self.covariance.astype(np.float64, copy=False)
+        FP = np.matmul(F, P, out=self._tmp1)
+        P = np.matmul(FP, F.T, out=self._tmp2)
+        P += Q_d
 
         # Ensure symmetry
-        self.covariance = 0.5 * (self.covariance + self.covariance.T)
+        self._store_covariance(P)
+
+    def _predict_compiled(
+        self,
+        accel_meas: NDArray[np.float64],
+        omega_meas: NDArray[np.float64],
+        dt: float,
+    ) -> None:
+        """predict() as one numba kernel call; same steps as the NumPy path."""
+        P = self.covariance.astype(np.float64, copy=False)
+        _predict_kernel(
+            self.state.vector,
+            accel_meas,
+            omega_meas,
+            dt,
+            self._C_bn,
+            self._F,
+            P,
+            self._Q_d,
+            self._tmp1,
+            P,
+        )
+        if P is not self.covariance:
+            self.covariance[...] = P
 
     def _compute_state_transition(
         self,
@@ -192,22 +510,38 @@ class INSEKF:
         C_bn: NDArray[np.float64],
         dt: float,
     ) -> NDArray[np.float64]:
-        """Compute linearized state transition matrix."""
-        F = np.eye(STATE_DIM)
+        """
+        Compute linearized state transition matrix.
 
-        # Position from velocity
-        F[POS_IDX, VEL_IDX] = np.eye(3) * dt
+        Writes into the filter's F workspace. The identity diagonal is set at
+        construction and the dt-only blocks by _set_dt; only the C_bn-dependent
+        blocks are rewritten here.
+        """
+        F = self._F
 
-        # Velocity from attitude (cross product with acceleration)
-        F[VEL_IDX, ATT_IDX] = -C_bn @ skew(accel_corr) * dt
+        # Velocity from attitude (cross product with acceleration), -C_bn [a×] dt
+        vel_att = np.matmul(C_bn, skew(accel_corr), out=F[VEL_IDX, ATT_IDX])
+        vel_att *= -dt
 
         # Velocity from accel bias
-        F[VEL_IDX, ACC_BIAS_IDX] = -C_bn * dt
+        np.multiply(C_bn, -dt, out=F[VEL_IDX, ACC_BIAS_IDX])
+
+        return F
+
+    def _set_dt(self, dt: float) -> None:
+        """
+        Specialize the F and Q_d workspaces for a step size.
+
+        Fixed-rate IMUs call this once; the blocks below depend only on dt.
+        """
+        # Position from velocity (the blocks' off-diagonals stay zero)
+        self._F[_POS_VEL_DIAG_IDX] = dt
 
         # Attitude from gyro bias
-        F[ATT_IDX, GYR_BIAS_IDX] = -np.eye(3) * dt
+        self._F[_ATT_GYR_DIAG_IDX] = -dt
 
-        return F
+        np.multiply(self.Q_spectral, dt, out=self._Q_d)
+        self._dt = dt
 
     def update_attitude(
         self,
@@ -221,16 +555,12 @@ class INSEKF:
             attitude_meas: Measured attitude [θx, θy, θz] in radians
             R: 3x3 measurement noise covariance
         """
-        # Measurement matrix: H extracts attitude from state
-        H = np.zeros((3, STATE_DIM))
-        H[:, ATT_IDX] = np.eye(3)
-
-        # Innovation
+        # Innovation; H extracts the attitude block from the state
         z_pred = self.state.attitude
         y = attitude_meas - z_pred
 
         # --- Standard Kalman update ---
-        self._kalman_update(y, H, R)
+        self._kalman_update(y, ATT_IDX, R)
 
     def update_position(
         self,
@@ -244,61 +574,221 @@ class INSEKF:
             position_meas: Measured position [x, y, z] in meters
             R: 3x3 measurement noise covariance
         """
-        H = np.zeros((3, STATE_DIM))
-        H[:, POS_IDX] = np.eye(3)
-
         z_pred = self.state.position
         y = position_meas - z_pred
 
-        self._kalman_update(y, H, R)
+        self._kalman_update(y, POS_IDX, R)
 
     def _kalman_update(
         self,
         innovation: NDArray[np.float64],
-        H: NDArray[np.float64],
+        block: slice,
         R: NDArray[np.float64],
     ) -> None:
-        """Perform standard Kalman filter measurement update."""
-        # Innovation covariance
-        S = H @ self.covariance @ H.T + R
+        """
+        Perform standard Kalman filter measurement update.
+
+        The measurement observes one 3-state block directly (H = [0 I 0]), so
+        H P and H P Hᵀ are slices of P rather than matrix products.
+
+        Args:
+            innovation: Measurement residual (3,)
+            block: State slice the measurement observes (e.g. ATT_IDX)
+            R: 3x3 measurement noise covariance
+        """
+        P = self.covariance.astype(np.float64, copy=False)
 
-        # Kalman gain
-        K = self.covariance @ H.T @ np.linalg.inv(S)
+        # Innovation covariance S = H P Hᵀ + R
+        PHt = P[:, block]
+        S = PHt[block] + R
+
+        # Kalman gain K = P Hᵀ S⁻¹, solved against symmetric S (H P = (P Hᵀ)ᵀ)
+        # instead of forming the inverse: a compiled 3x3 Cholesky with numba,
+        # else one LAPACK solve
+        K = _cholesky_gain3(S, PHt, self._K) if HAS_NUMBA else np.linalg.solve(S, PHt.T).T
 
         # State correction
-        dx = K @ innovation
+        dx = np.matmul(K, innovation, out=self._dx)
         self._apply_correction(dx)
 
-        # Covariance update (Joseph form for numerical stability)
-        I_KH = np.eye(STATE_DIM) - K @ H
-        self.covariance = I_KH @ self.covariance @ I_KH.T + K @ R @ K.T
+        # Covariance update P - K S Kᵀ. K S = P Hᵀ, so K S Kᵀ = K (P Hᵀ)ᵀ: one
+        # 15x3 @ 3x15 product instead of the Joseph form's two 15x15 ones.
+        # Symmetrizing on store keeps P symmetric as the Joseph form did
+        KSKt = np.matmul(K, PHt.T, out=self._tmp1)
+        P = np.subtract(P, KSKt, out=self._tmp2)
 
         # Ensure symmetry
-        self.covariance = 0.5 * (self.covariance + self.covariance.T)
+        self._store_covariance(P)
+
+    def _store_covariance(self, P: NDArray[np.float64]) -> None:
+        """Symmetrize a float64 covariance result into the stored covariance in place."""
+        np.add(P, P.T, out=self.covariance)
+        self.covariance *= 0.5
 
     def _apply_correction(self, dx: NDArray[np.float64]) -> None:
         """Apply error-state correction to nominal state."""
-        self.state.position = self.state.position + dx[POS_IDX]
-        self.state.velocity = self.state.velocity + dx[VEL_IDX]
-        self.state.attitude = self.state.attitude + dx[ATT_IDX]
-        self.state.accel_bias = self.state.accel_bias + dx[ACC_BIAS_IDX]
-        self.state.gyro_bias = self.state.gyro_bias + dx[GYR_BIAS_IDX]
+        self.state.vector += dx
 
     def get_position_uncertainty(self) -> NDArray[np.float64]:
         """Get 1-σ position uncertainty per axis."""
-        return np.sqrt(np.diag(self.covariance[POS_IDX, POS_IDX]))
+        return np.sqrt(self.covariance[_POS_DIAG_IDX])
 
     def get_velocity_uncertainty(self) -> NDArray[np.float64]:
         """Get 1-σ velocity uncertainty per axis."""
-        return np.sqrt(np.diag(self.covariance[VEL_IDX, VEL_IDX]))
+        return np.sqrt(self.covariance[_VEL_DIAG_IDX])
 
     def get_attitude_uncertainty(self) -> NDArray[np.float64]:
         """Get 1-σ attitude uncertainty per axis (radians)."""
-        return np.sqrt(np.diag(self.covariance[ATT_IDX, ATT_IDX]))
+        return np.sqrt(self.covariance[_ATT_DIAG_IDX])
+
+    def get_sigmas(self) -> NDArray[np.float64]:
+        """Get 1-σ uncertainty for every state, shape (15,), in one pass."""
+        return np.sqrt(self.covariance.diagonal())
+
+    def get_state_vector(self, out: NDArray[np.float64] | None = None) -> NDArray[np.float64]:
+        """Get full 15-element state vector, optionally written into ``out``."""
+        return self.state.to_vector(out=out)
+
+
+def _skew_batch(v: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Create stacked skew-symmetric matrices (N, 3, 3) from (N, 3) vectors."""
+    K = np.zeros((v.shape[0], 3, 3))
+    K[:, 0, 1] = -v[:, 2]
+    K[:, 0, 2] = v[:, 1]
+    K[:, 1, 0] = v[:, 2]
+    K[:, 1, 2] = -v[:, 0]
+    K[:, 2, 0] = -v[:, 1]
+    K[:, 2, 1] = v[:, 0]
+    return K
+
+
+def _rotation_matrix_batch(theta: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Stacked rotation_matrix for (N, 3) rotation vectors."""
+    angle_sq = np.einsum("ni,ni->n", theta, theta)
+    small = angle_sq < _SMALL_ANGLE_SQ
+
+    # Exact coefficients; the small-angle rows are replaced by the series below
+    angle = np.sqrt(np.where(small, 1.0, angle_sq))
+    a = np.sin(angle) / angle
+    b = (1.0 - np.cos(angle)) / (angle * angle)
+    a = np.where(small, 1.0 - angle_sq / 6.0 * (1.0 - angle_sq / 20.0), a)
+    b = np.where(small, 0.5 - angle_sq / 24.0 * (1.0 - angle_sq / 30.0), b)
+
+    K = _skew_batch(theta)
+    return _I3 + a[:, None, None] * K + b[:, None, None] * (K @ K)
+
+
+class INSEKFBatch:
+    """
+    Bank of N independent INS EKFs propagated as stacked arrays.
+
+    Every filter shares the IMU profile and IMU measurement stream (the usual
+    case for parameter sweeps such as update cadence), so one predict call
+    advances all N filters with batched matmuls instead of N small ones.
+
+    State: (N, 15) array, covariance: (N, 15, 15) array.
+    """
+
+    def __init__(
+        self,
+        initial_state: INSState,
+        initial_covariance: NDArray[np.float64],
+        imu_profile: IMUProfile,
+        n_filters: int,
+    ) -> None:
+        """
+        Initialize filter bank with identical initial conditions.
+
+        Args:
+            initial_state: Initial navigation state (shared by all filters)
+            initial_covariance: Initial 15x15 covariance matrix
+            imu_profile: IMU noise profile for process noise
+            n_filters: Number of filters in the bank
+        """
+        self.n_filters = n_filters
+        self.state = np.tile(initial_state.to_vector(), (n_filters, 1))
+        self.covariance = np.tile(initial_covariance, (n_filters, 1, 1))
+        self.imu_profile = imu_profile
+        self.Q_spectral = _process_noise_spectral(imu_profile)
+
+        self._F = np.tile(_I15, (n_filters, 1, 1))
+        self._Q_d = np.empty((STATE_DIM, STATE_DIM))
+        self._dt: float | None = None
+
+    def predict(
+        self,
+        accel_meas: NDArray[np.float64],
+        omega_meas: NDArray[np.float64],
+        dt: float,
+    ) -> None:
+        """
+        IMU mechanization and covariance propagation for every filter.
+
+        Args:
+            accel_meas: Measured specific force, (3,) shared or (N, 3)
+            omega_meas: Measured angular velocity, (3,) shared or (N, 3)
+            dt: Time step in seconds
+        """
+        x = self.state
+        accel_corr = accel_meas - x[:, ACC_BIAS_IDX]
+        omega_corr = omega_meas - x[:, GYR_BIAS_IDX]
+        C_bn = _rotation_matrix_batch(x[:, ATT_IDX])
+
+        x[:, ATT_IDX] += omega_corr * dt
+        x[:, VEL_IDX] += np.einsum("nij,nj->ni", C_bn, accel_corr) * dt
+        x[:, POS_IDX] += x[:, VEL_IDX] * dt
+
+        F = self._F
+        if dt != self._dt:
+            F[:, _POS_VEL_DIAG_IDX[0], _POS_VEL_DIAG_IDX[1]] = dt
+            F[:, _ATT_GYR_DIAG_IDX[0], _ATT_GYR_DIAG_IDX[1]] = -dt
+            np.multiply(self.Q_spectral, dt, out=self._Q_d)
+            self._dt = dt
+        F[:, VEL_IDX, ATT_IDX] = -(C_bn @ _skew_batch(accel_corr)) * dt
+        F[:, VEL_IDX, ACC_BIAS_IDX] = -C_bn * dt
+
+        # Dense stacked matmuls on purpose: splitting F P Fᵀ into F's 3x3 blocks
+        # costs more NumPy calls than the BLAS work it saves at 15x15
+        P = F @ self.covariance @ F.transpose(0, 2, 1) + self._Q_d
+        self.covariance = 0.5 * (P + P.transpose(0, 2, 1))
+
+    def update_attitude(
+        self,
+        attitude_meas: NDArray[np.float64],
+        R: NDArray[np.float64],
+        mask: NDArray[np.bool_] | None = None,
+    ) -> None:
+        """
+        Attitude update for the filters selected by mask.
+
+        Args:
+            attitude_meas: Measured attitude, (N, 3) or (3,) shared
+            R: 3x3 measurement noise covariance
+            mask: Boolean (N,) selecting filters to update (default: all)
+        """
+        idx = np.arange(self.n_filters) if mask is None else np.flatnonzero(mask)
+        if idx.size == 0:
+            return
+
+        meas = np.broadcast_to(attitude_meas, (self.n_filters, 3))[idx]
+        P = self.covariance[idx]
+        x = self.state[idx]
+
+        # H selects the attitude block, as in INSEKF._kalman_update
+        y = meas - x[:, ATT_IDX]
+        PHt = P[:, :, ATT_IDX]
+        S = PHt[:, ATT_IDX] + R
+        K = np.linalg.solve(S, PHt.transpose(0, 2, 1)).transpose(0, 2, 1)
+
+        self.state[idx] = x + np.einsum("nij,nj->ni", K, y)
+
+        # P - K S Kᵀ with K S = P Hᵀ, as in INSEKF._kalman_update
+        P -= K @ PHt.transpose(0, 2, 1)
+        self.covariance[idx] = 0.5 * (P + P.transpose(0, 2, 1))
 
-    def get_state_vector(self) -> NDArray[np.float64]:
-        """Get full 15-element state vector."""
-        return self.state.to_vector()
+    def get_sigmas(self) -> NDArray[np.float64]:
+        """Get 1-σ uncertainty for every state, shape (N, 15)."""
+        return np.sqrt(np.diagonal(self.covariance, axis1=1, axis2=2))
 
 
 def create_default_initial_covariance(
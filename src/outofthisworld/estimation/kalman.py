@@ -78,9 +78,13 @@ class KalmanFilter:
         # State update
         self.state = self.state + K @ y
 
-        # Covariance update (Joseph form for numerical stability)
+        # Covariance update, symmetrized in place so round-off in (I - KH) P
+        # cannot accumulate into an asymmetric (eventually non-SPD) matrix
         I = np.eye(self.covariance.shape[0])
-        self.covariance = (I - K @ H) @ self.covariance
+        P = (I - K @ H) @ self.covariance
+        P += P.T
+        P *= 0.5
+        self.covariance = P
 
 
 class ExtendedKalmanFilter:
@@ -141,20 +145,15 @@ class ExtendedKalmanFilter:
         Update step with nonlinear measurements.
 
         Args:
-            z: Measurement (m x 1)
+            z: Measurement, shape (m,) or (m x 1)
             h: Nonlinear measurement function: z_pred = h(x)
             H: Jacobian of h with respect to state (m x n)
         """
         # Predicted measurement
         z_pred = h(self.state)
 
-        # Innovation
-        # Ensure both are column vectors
-        if z.ndim == 1:
-            z = z.reshape(-1, 1)
-        if z_pred.ndim == 1:
-            z_pred = z_pred.reshape(-1, 1)
-        y = z - z_pred
+        # Innovation, kept 1-D whatever the measurement layout
+        y = np.ravel(z) - np.ravel(z_pred)
 
         # Innovation covariance
         S = H @ self.covariance @ H.T + self.R
@@ -163,8 +162,11 @@ class ExtendedKalmanFilter:
         K = self.covariance @ H.T @ np.linalg.inv(S)
 
         # State update
-        self.state = self.state + (K @ y).flatten()
+        self.state = self.state + K @ y
 
-        # Covariance update
+        # Covariance update, symmetrized in place as in KalmanFilter.update
         I = np.eye(self.covariance.shape[0])
-        self.covariance = (I - K @ H) @ self.covariance
+        P = (I - K @ H) @ self.covariance
+        P += P.T
+        P *= 0.5
+        self.covariance = P
@@ -9,6 +9,7 @@ from outofthisworld.output.reports import (
     generate_markdown_report,
     save_results_csv,
     save_results_json,
+    save_results_parquet,
 )
 
 __all__ = [
@@ -17,5 +18,6 @@ __all__ = [
     "plot_cadence_sweep",
     "save_results_json",
     "save_results_csv",
+    "save_results_parquet",
     "generate_markdown_report",
 ]
@@ -30,8 +30,8 @@ def plot_error_vs_time(
     time_min = results.time / 60.0  # Convert to minutes
 
     # Position error
-    pos_err_norm = np.linalg.norm(results.pos_error, axis=1)
-    pos_3sig = 3.0 * np.linalg.norm(results.pos_sigma, axis=1)
+    pos_err_norm = results.pos_error_norm
+    pos_3sig = 3.0 * results.pos_sigma_norm
 
     ax1 = axes[0]
     ax1.semilogy(time_min, pos_err_norm, "b-", label="Position Error", linewidth=1.5)
@@ -43,8 +43,8 @@ def plot_error_vs_time(
     ax1.set_ylim(bottom=1e-3)
 
     # Velocity error
-    vel_err_norm = np.linalg.norm(results.vel_error, axis=1)
-    vel_3sig = 3.0 * np.linalg.norm(results.vel_sigma, axis=1)
+    vel_err_norm = results.vel_error_norm
+    vel_3sig = 3.0 * results.vel_sigma_norm
 
     ax2 = axes[1]
     ax2.semilogy(time_min, vel_err_norm, "r-", label="Velocity Error", linewidth=1.5)
@@ -91,7 +91,7 @@ def plot_error_comparison(
 
     for results, label, color in zip(results_list, labels, colors):
         time_min = results.time / 60.0
-        pos_err_norm = np.linalg.norm(results.pos_error, axis=1)
+        pos_err_norm = results.pos_error_norm
         ax.semilogy(time_min, pos_err_norm, label=label, color=color, linewidth=1.5)
 
     ax.set_xlabel("Time (minutes)")
@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
-import csv
 import json
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 import numpy as np
+from numpy.typing import NDArray
 
 if TYPE_CHECKING:
     from outofthisworld.sim.experiments import ExperimentResults
 
+# Column formats for save_results_csv: time to 0.01 s, norms in 6-digit scientific
+_CSV_FORMATS: Final[list[str]] = ["%.2f", "%.6e", "%.6e", "%.6e", "%.6e"]
+
 
 def save_results_json(
     results: ExperimentResults,
@@ -34,6 +37,17 @@ def save_results_json(
         json.dump(data, f, indent=2)
 
 
+def _timeseries_columns(results: ExperimentResults) -> dict[str, NDArray[np.float64]]:
+    """Per-step error and 3σ norms exported by the CSV and Parquet writers."""
+    return {
+        "time_s": results.time,
+        "pos_error_m": results.pos_error_norm,
+        "vel_error_m_s": results.vel_error_norm,
+        "pos_3sigma_m": 3.0 * results.pos_sigma_norm,
+        "vel_3sigma_m_s": 3.0 * results.vel_sigma_norm,
+    }
+
+
 def save_results_csv(
     results: ExperimentResults,
     output_path: Path,
@@ -47,33 +61,49 @@ def save_results_csv(
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    pos_err_norm = np.linalg.norm(results.pos_error, axis=1)
-    vel_err_norm = np.linalg.norm(results.vel_error, axis=1)
-    pos_sig_norm = np.linalg.norm(results.pos_sigma, axis=1)
-    vel_sig_norm = np.linalg.norm(results.vel_sigma, axis=1)
+    columns = _timeseries_columns(results)
 
+    # One bulk formatted write; matches csv.writer's "\r\n" line endings.
+    # newline="" stops text mode translating them to "\r\r\n" on Windows
     with open(output_path, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "time_s",
-                "pos_error_m",
-                "vel_error_m_s",
-                "pos_3sigma_m",
-                "vel_3sigma_m_s",
-            ]
+        np.savetxt(
+            f,
+            np.column_stack(list(columns.values())),
+            fmt=_CSV_FORMATS,
+            delimiter=",",
+            newline="\r\n",
+            header=",".join(columns),
+            comments="",
         )
 
-        for i in range(len(results.time)):
-            writer.writerow(
-                [
-                    f"{results.time[i]:.2f}",
-                    f"{pos_err_norm[i]:.6e}",
-                    f"{vel_err_norm[i]:.6e}",
-                    f"{3.0 * pos_sig_norm[i]:.6e}",
-                    f"{3.0 * vel_sig_norm[i]:.6e}",
-                ]
-            )
+
+def save_results_parquet(
+    results: ExperimentResults,
+    output_path: Path,
+) -> None:
+    """
+    Save time-series results to a zstd-compressed Parquet file.
+
+    Same columns as save_results_csv, stored as full-precision float64.
+    Requires the optional pyarrow dependency (``pip install .[parquet]``).
+
+    Args:
+        results: Experiment results
+        output_path: Path to output Parquet file
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("save_results_parquet requires pyarrow: pip install pyarrow") from e
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    table = pa.Table.from_pydict(_timeseries_columns(results))
+    pq.write_table(table, output_path, compression="zstd")
 
 
 def generate_markdown_report(
@@ -2,10 +2,18 @@
 
 from outofthisworld.physics.constants import M_EARTH, R_EARTH, C, G
 from outofthisworld.physics.orbital import (
+    IntegrationMethod,
     j2_acceleration,
+    propagate_many_orbits,
     propagate_orbit,
+    propagate_orbit_adaptive,
+    propagate_orbit_batch,
+    propagate_trajectory,
+    propagate_trajectory_batch,
     total_acceleration,
+    total_acceleration_batch,
     two_body_acceleration,
+    two_body_jacobian,
 )
 from outofthisworld.physics.units import convert_units
 
@@ -14,9 +22,17 @@ __all__ = [
     "G",
     "M_EARTH",
     "R_EARTH",
+    "IntegrationMethod",
     "propagate_orbit",
+    "propagate_orbit_adaptive",
+    "propagate_many_orbits",
+    "propagate_orbit_batch",
+    "propagate_trajectory",
+    "propagate_trajectory_batch",
     "two_body_acceleration",
+    "two_body_jacobian",
     "j2_acceleration",
     "total_acceleration",
+    "total_acceleration_batch",
     "convert_units",
 ]
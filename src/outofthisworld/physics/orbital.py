@@ -1,9 +1,60 @@
 """Orbital mechanics: two-body propagation, perturbations."""
 
+import math
+from collections.abc import Callable
+from enum import IntEnum
+from typing import Final
+
 import numpy as np
 from numpy.typing import NDArray
 
+from outofthisworld._jit import HAS_NUMBA, njit, prange
+
+# Squared-radius guard shared by all acceleration models (r < 1e-6 m)
+_MIN_R_SQ: Final[float] = 1e-12
+
+# Satellites per AoSoA tile in propagate_many_orbits (one AVX-512 / two AVX2 lanes of f64)
+_TILE: Final[int] = 8
+
+# SABA2 drift coefficients (kicks are both 1/2): c1 = 1/2 - sqrt(3)/6, c2 = 1/sqrt(3)
+_SABA2_C1: Final[float] = 0.5 - math.sqrt(3.0) / 6.0
+_SABA2_C2: Final[float] = 1.0 / math.sqrt(3.0)
+
+# RK4 combine weight: (k1 + 2 k2 + 2 k3 + k4) * dt / 6 as a multiply
+_RK4_SIXTH: Final[float] = 1.0 / 6.0
+
+# Dormand-Prince 5(4) tableau. Row i holds a_ij for stage i; the last row is
+# the 5th-order solution weights b, so its stage is the next step's first (FSAL)
+_DP_A: Final[NDArray[np.float64]] = np.array(
+    [
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [1 / 5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [3 / 40, 9 / 40, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [44 / 45, -56 / 15, 32 / 9, 0.0, 0.0, 0.0, 0.0],
+        [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729, 0.0, 0.0, 0.0],
+        [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656, 0.0, 0.0],
+        [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0],
+    ]
+)
+# Error weights b - b_hat (5th minus embedded 4th order)
+_DP_E: Final[NDArray[np.float64]] = np.array(
+    [71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40]
+)
+
+
+class IntegrationMethod(IntEnum):
+    """Fixed-step integrators; hot loops pass these instead of method names."""
 
+    EULER = 0
+    RK4 = 1
+    LEAPFROG = 2
+    SABA2 = 3
+
+
+_METHOD_BY_NAME: Final[dict[str, int]] = {m.name.lower(): m.value for m in IntegrationMethod}
+
+
+@njit(cache=True)
 def two_body_acceleration(
     position: NDArray[np.float64],
     mu: float,
@@ -11,6 +62,9 @@ def two_body_acceleration(
     """
     Compute two-body gravitational acceleration.
 
+    Compiled with numba when available: a small-vector call is dominated by
+    NumPy dispatch, which the kernel replaces with scalar loops.
+
     Args:
         position: Position vector [x, y, z] in meters
         mu: Gravitational parameter (G * M) in m^3/s^2
@@ -18,11 +72,56 @@ def two_body_acceleration(
     Returns:
         Acceleration vector [ax, ay, az] in m/s^2
     """
-    r = np.linalg.norm(position)
-    if r < 1e-6:  # Guard against division by zero
-        return np.zeros(3)
+    n_dim = position.shape[0]
+    r_sq = 0.0
+    for i in range(n_dim):
+        r_sq += position[i] * position[i]
+    accel = np.zeros(n_dim)
+    if r_sq < _MIN_R_SQ:  # Guard against division by zero (r < 1e-6 m)
+        return accel
+
+    # One sqrt for 1/r³ instead of norm() followed by pow()
+    k = -mu / (r_sq * math.sqrt(r_sq))
+    for i in range(n_dim):
+        accel[i] = k * position[i]
+    return accel
+
+
+def two_body_jacobian(
+    position: NDArray[np.float64],
+    mu: float,
+    out: NDArray[np.float64] | None = None,
+) -> NDArray[np.float64]:
+    """
+    Compute the two-body gravity gradient d(accel)/d(position).
 
-    return -mu * position / (r**3)
+    Args:
+        position: Position vector (2D or 3D) in meters
+        mu: Gravitational parameter (G * M) in m^3/s^2
+        out: Optional (n x n) array (may be a view) to write the result into,
+            avoiding a fresh allocation per call
+
+    Returns:
+        Jacobian matrix (n x n) in 1/s^2: -mu/r³ I + 3 mu/r⁵ p pᵀ
+    """
+    n = len(position)
+    if out is None:
+        out = np.empty((n, n))
+
+    r = math.sqrt(position @ position)
+    if r < 1e-6:
+        out[...] = 0.0
+        return out
+
+    r3 = r * r * r
+    r5 = r3 * r * r
+    np.multiply.outer(position, position, out=out)
+    out *= 3 * mu / r5
+    # Scalar diagonal writes also work when out is a strided view
+    diag = -mu / r3
+    for i in range(n):
+        out[i, i] += diag
+    return out
 
 
 def j2_acceleration(
@@ -43,16 +142,15 @@ def j2_acceleration(
     Returns:
         J2 perturbation acceleration vector (same dimension as position) in m/s^2
     """
-    r = np.linalg.norm(position)
-    if r < 1e-6:
+    r_sq = float(position @ position)
+    if r_sq < _MIN_R_SQ:
         return np.zeros_like(position)
 
     n_dim = len(position)
-    r_sq = r * r
     r_eq_sq = r_eq * r_eq
 
-    # J2 perturbation formula
-    factor = 1.5 * j2 * mu * r_eq_sq / (r_sq * r_sq * r)
+    # J2 perturbation formula (1/r⁵ from the squared radius, single sqrt)
+    factor = 1.5 * j2 * mu * r_eq_sq / (r_sq * r_sq * math.sqrt(r_sq))
 
     if n_dim == 2:
         # 2D case: assume z=0 (equatorial plane)
@@ -63,10 +161,10 @@ def j2_acceleration(
         return np.array([ax, ay])
     if n_dim == 3:
         x, y, z = position[0], position[1], position[2]
-        z_over_r = z / r
-        ax = factor * x * (5 * z_over_r * z_over_r - 1)
-        ay = factor * y * (5 * z_over_r * z_over_r - 1)
-        az = factor * z * (5 * z_over_r * z_over_r - 3)
+        z_sq_over_r_sq = z * z / r_sq
+        ax = factor * x * (5 * z_sq_over_r_sq - 1)
+        ay = factor * y * (5 * z_sq_over_r_sq - 1)
+        az = factor * z * (5 * z_sq_over_r_sq - 3)
         return np.array([ax, ay, az])
 
     raise ValueError(f"Unsupported position dimension: {n_dim}")
@@ -90,44 +188,338 @@ def total_acceleration(
     Returns:
         Total acceleration vector [ax, ay, az] in m/s^2
     """
-    accel = two_body_acceleration(position, mu)
+    if j2 is None or r_eq is None:
+        two_body: NDArray[np.float64] = two_body_acceleration(position, mu)
+        return two_body
 
-    if j2 is not None and r_eq is not None:
-        accel = accel + j2_acceleration(position, mu, j2, r_eq)
+    n_dim = len(position)
+    if n_dim not in (2, 3):
+        raise ValueError(f"Unsupported position dimension: {n_dim}")
 
+    accel: NDArray[np.float64] = _total_acceleration_j2(position, mu, j2, r_eq)
     return accel
 
 
+@njit(cache=True)
+def _total_acceleration_j2(
+    position: NDArray[np.float64],
+    mu: float,
+    j2: float,
+    r_eq: float,
+) -> NDArray[np.float64]:
+    """Two-body + J2 acceleration for a 2- or 3-vector in one compiled pass."""
+    n_dim = position.shape[0]
+    r_sq = 0.0
+    for i in range(n_dim):
+        r_sq += position[i] * position[i]
+    accel = np.zeros(n_dim)
+    if r_sq < _MIN_R_SQ:
+        return accel
+
+    # Two-body and J2 share r² and r³ and are accumulated into one array:
+    # a = p · (-μ/r³ + f (5 z²/r² - 1)), with -3 instead of -1 on the z axis
+    r_cubed = r_sq * math.sqrt(r_sq)
+    factor = 1.5 * j2 * mu * r_eq * r_eq / (r_sq * r_cubed)
+    z_sq_ratio_5 = 5.0 * position[2] * position[2] / r_sq if n_dim == 3 else 0.0
+
+    k = factor * (z_sq_ratio_5 - 1.0) - mu / r_cubed
+    for i in range(n_dim):
+        accel[i] = position[i] * k
+    if n_dim == 3:
+        accel[2] -= 2.0 * factor * position[2]
+    return accel
+
+
+def total_acceleration_batch(
+    positions: NDArray[np.float64],
+    mu: float,
+    j2: float | None = None,
+    r_eq: float | None = None,
+) -> NDArray[np.float64]:
+    """
+    Compute total acceleration for many positions in one vectorized pass.
+
+    Args:
+        positions: Positions, shape (N, 2) or (N, 3), in meters
+        mu: Gravitational parameter (G * M) in m^3/s^2
+        j2: J2 coefficient (optional)
+        r_eq: Equatorial radius in meters (required if j2 is provided)
+
+    Returns:
+        Accelerations, same shape as positions, in m/s^2
+    """
+    n_dim = positions.shape[1]
+    if n_dim not in (2, 3):
+        raise ValueError(f"Unsupported position dimension: {n_dim}")
+
+    pos = np.ascontiguousarray(positions.T, dtype=np.float64)
+    return _total_acceleration_soa(pos, mu, j2, r_eq).T.copy()
+
+
 def propagate_orbit(
     position: NDArray[np.float64],
     velocity: NDArray[np.float64],
     mu: float,
     dt: float,
-    method: str = "rk4",
+    method: str | IntegrationMethod = "rk4",
     j2: float | None = None,
     r_eq: float | None = None,
+    n_steps: int = 1,
 ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
     """
     Propagate orbit using numerical integration.
 
+    Multi-step calls go through propagate_trajectory, so 3D RK4 runs the
+    whole loop compiled instead of one Python call per step.
+
     Args:
         position: Initial position [x, y, z] in meters
         velocity: Initial velocity [vx, vy, vz] in m/s
         mu: Gravitational parameter (G * M) in m^3/s^2
         dt: Time step in seconds
-        method: Integration method ('euler' or 'rk4')
+        method: Integration method ('euler', 'rk4', 'leapfrog', 'saba2' or an IntegrationMethod)
         j2: J2 coefficient for perturbations (optional)
         r_eq: Equatorial radius for J2 (required if j2 provided)
+        n_steps: Number of steps of size dt
 
     Returns:
         Tuple of (new_position, new_velocity)
     """
-    if method == "euler":
-        return _propagate_euler(position, velocity, mu, dt, j2, r_eq)
-    if method == "rk4":
-        return _propagate_rk4(position, velocity, mu, dt, j2, r_eq)
+    propagate = _PROPAGATORS[_method_index(method)]
+    if n_steps == 1:
+        return propagate(position, velocity, mu, dt, j2, r_eq)
+
+    n_dim = len(position)
+    final = propagate_trajectory(position, velocity, mu, dt, n_steps, method, j2, r_eq)[-1]
+    return final[:n_dim].copy(), final[n_dim:].copy()
+
+
+def propagate_orbit_batch(
+    positions: NDArray[np.float64],
+    velocities: NDArray[np.float64],
+    mu: float,
+    dt: float,
+    method: str | IntegrationMethod = "rk4",
+    j2: float | None = None,
+    r_eq: float | None = None,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Propagate N independent 3D orbits one step in a single vectorized pass.
+
+    States are transposed to structure-of-arrays form (3, N) so every
+    arithmetic op runs over a contiguous length-N row.
+
+    Args:
+        positions: Initial positions, shape (N, 3), in meters
+        velocities: Initial velocities, shape (N, 3), in m/s
+        mu: Gravitational parameter (G * M) in m^3/s^2
+        dt: Time step in seconds
+        method: Integration method ('euler', 'rk4', 'leapfrog', 'saba2' or an IntegrationMethod)
+        j2: J2 coefficient for perturbations (optional)
+        r_eq: Equatorial radius for J2 (required if j2 provided)
+
+    Returns:
+        Tuple of (new_positions, new_velocities), each shape (N, 3)
+    """
+    step = _BATCH_STEPS[_method_index(method)]
+    pos = np.ascontiguousarray(positions.T, dtype=np.float64)
+    vel = np.ascontiguousarray(velocities.T, dtype=np.float64)
+    new_pos, new_vel = step(pos, vel, dt, lambda p: _total_acceleration_soa(p, mu, j2, r_eq))
+    return new_pos.T.copy(), new_vel.T.copy()
+
+
+def propagate_many_orbits(
+    positions: NDArray[np.float64],
+    velocities: NDArray[np.float64],
+    mu: float,
+    dt: float,
+    n_steps: int = 1,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Propagate many two-body orbits n_steps RK4 steps in AoSoA tiles.
+
+    States are packed as (n_tiles, 3, 8) so each tile keeps eight satellites
+    in adjacent lanes; with numba the tiles run in parallel threads. Without
+    numba this falls back to stepping propagate_orbit_batch, which gives
+    bit-identical results.
+
+    Args:
+        positions: Initial positions, shape (N, 3), in meters
+        velocities: Initial velocities, shape (N, 3), in m/s
+        mu: Gravitational parameter (G * M) in m^3/s^2
+        dt: Time step in seconds
+        n_steps: Number of RK4 steps
+
+    Returns:
+        Tuple of (new_positions, new_velocities), each shape (N, 3)
+    """
+    if not HAS_NUMBA:
+        for _ in range(n_steps):
+            positions, velocities = propagate_orbit_batch(positions, velocities, mu, dt)
+        return positions, velocities
+
+    n = len(positions)
+    pos_tiles = _to_tiles(positions)
+    vel_tiles = _to_tiles(velocities)
+    _rk4_tiles(pos_tiles, vel_tiles, mu, dt, n_steps)
+    return _from_tiles(pos_tiles, n), _from_tiles(vel_tiles, n)
+
+
+def propagate_trajectory(
+    position: NDArray[np.float64],
+    velocity: NDArray[np.float64],
+    mu: float,
+    dt: float,
+    n_steps: int,
+    method: str | IntegrationMethod = "rk4",
+    j2: float | None = None,
+    r_eq: float | None = None,
+    accel_out: NDArray[np.float64] | None = None,
+) -> NDArray[np.float64]:
+    """
+    Propagate one orbit n_steps fixed steps and return every state.
+
+    3D RK4 runs as a single compiled loop over the scalar step kernel
+    (with numba); other methods and dimensions step propagate_orbit. Both
+    give the same states as calling propagate_orbit in a loop. RK4 already
+    evaluates the acceleration at each state as its first stage, so filling
+    accel_out costs one extra evaluation (the final state) in total.
+
+    Args:
+        position: Initial position [x, y, z] in meters
+        velocity: Initial velocity [vx, vy, vz] in m/s
+        mu: Gravitational parameter (G * M) in m^3/s^2
+        dt: Time step in seconds
+        n_steps: Number of steps
+        method: Integration method ('euler', 'rk4', 'leapfrog', 'saba2' or an IntegrationMethod)
+        j2: J2 coefficient for perturbations (optional)
+        r_eq: Equatorial radius for J2 (required if j2 provided)
+        accel_out: Optional (n_steps + 1, dim) array filled with the total
+            acceleration at every returned state
+
+    Returns:
+        (n_steps + 1, 2 * dim) states; row k is [position, velocity] after k steps
+    """
+    index = _method_index(method)
+    n_dim = len(position)
+    states = np.empty((n_steps + 1, 2 * n_dim))
+    states[0, :n_dim] = position
+    states[0, n_dim:] = velocity
+
+    if index == IntegrationMethod.RK4 and n_dim == 3:
+        accels = np.empty((0, 3)) if accel_out is None else accel_out
+        _rk4_trajectory(states, accels, mu, dt, *_j2_args(j2, r_eq))
+        return states
+
+    propagate = _PROPAGATORS[index]
+    for step in range(n_steps):
+        position, velocity = propagate(position, velocity, mu, dt, j2, r_eq)
+        states[step + 1, :n_dim] = position
+        states[step + 1, n_dim:] = velocity
+    if accel_out is None:
+        return states
+
+    for step in range(n_steps + 1):
+        accel_out[step] = total_acceleration(states[step, :n_dim], mu, j2, r_eq)
+    return states
+
+
+def propagate_trajectory_batch(
+    positions: NDArray[np.float64],
+    velocities: NDArray[np.float64],
+    mu: float,
+    dt: float,
+    n_steps: int,
+    method: str | IntegrationMethod = "rk4",
+    j2: float | None = None,
+    r_eq: float | None = None,
+) -> NDArray[np.float64]:
+    """
+    Propagate K independent orbits n_steps fixed steps and return every state.
+
+    The fleet stays in structure-of-arrays form (dim, K) for the whole run,
+    so each step is one vectorized pass over all craft; rows are transposed
+    only when stored. States match stepping propagate_orbit_batch.
+
+    Args:
+        positions: Initial positions, shape (K, 2) or (K, 3), in meters
+        velocities: Initial velocities, same shape as positions, in m/s
+        mu: Gravitational parameter (G * M) in m^3/s^2
+        dt: Time step in seconds
+        n_steps: Number of steps
+        method: Integration method ('euler', 'rk4', 'leapfrog', 'saba2' or an IntegrationMethod)
+        j2: J2 coefficient for perturbations (optional)
+        r_eq: Equatorial radius for J2 (required if j2 provided)
+
+    Returns:
+        (n_steps + 1, K, 2 * dim) states; [k, i] is craft i's [position, velocity]
+        after k steps
+    """
+    n_dim = positions.shape[1]
+    if n_dim not in (2, 3):
+        raise ValueError(f"Unsupported position dimension: {n_dim}")
+
+    step = _BATCH_STEPS[_method_index(method)]
+    pos = np.ascontiguousarray(positions.T, dtype=np.float64)
+    vel = np.ascontiguousarray(velocities.T, dtype=np.float64)
+    states = np.empty((n_steps + 1, len(positions), 2 * n_dim))
+    states[0, :, :n_dim] = positions
+    states[0, :, n_dim:] = velocities
+    for k in range(n_steps):
+        pos, vel = step(pos, vel, dt, lambda p: _total_acceleration_soa(p, mu, j2, r_eq))
+        states[k + 1, :, :n_dim] = pos.T
+        states[k + 1, :, n_dim:] = vel.T
+    return states
+
+
+def propagate_orbit_adaptive(
+    position: NDArray[np.float64],
+    velocity: NDArray[np.float64],
+    mu: float,
+    dt_max: float,
+    t_final: float,
+    rtol: float = 1e-9,
+    atol: float = 1e-12,
+    j2: float | None = None,
+    r_eq: float | None = None,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Propagate an orbit to t_final with adaptive Dormand-Prince 5(4) steps.
+
+    Steps grow up to dt_max wherever the embedded 4th-order error estimate
+    allows, so smooth arcs take far fewer force evaluations than fixed-step
+    RK4 at the same accuracy. The step loop is one compiled kernel over the
+    scalar acceleration (with numba).
+
+    Args:
+        position: Initial position [x, y] or [x, y, z] in meters
+        velocity: Initial velocity in m/s (same dimension as position)
+        mu: Gravitational parameter (G * M) in m^3/s^2
+        dt_max: Largest allowed step in seconds
+        t_final: Propagation time in seconds
+        rtol: Relative error tolerance per step
+        atol: Absolute error tolerance per step
+        j2: J2 coefficient for perturbations (optional)
+        r_eq: Equatorial radius for J2 (required if j2 provided)
+
+    Returns:
+        Tuple of (position, velocity) at t_final
+    """
+    if dt_max <= 0.0:
+        raise ValueError(f"dt_max must be positive, got {dt_max}")
+    if t_final < 0.0:
+        raise ValueError(f"t_final must be non-negative, got {t_final}")
+
+    n_dim = len(position)
+    if n_dim not in (2, 3):
+        raise ValueError(f"Unsupported position dimension: {n_dim}")
 
-    raise ValueError(f"Unknown integration method: {method}")
+    y = np.concatenate((position, velocity)).astype(np.float64)
+    t = _dopri5(y, mu, dt_max, t_final, rtol, atol, *_j2_args(j2, r_eq))
+    if t < t_final:
+        raise RuntimeError(f"Step size underflow at t = {t} s")
+
+    return y[:n_dim].copy(), y[n_dim:].copy()
 
 
 def _propagate_euler(
@@ -139,6 +531,12 @@ def _propagate_euler(
     r_eq: float | None = None,
 ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
     """Euler integration (first-order, simple but less accurate)."""
+    if position.shape == (3,):
+        px, py, pz, vx, vy, vz = _euler_step_scalar(
+            *position.tolist(), *velocity.tolist(), mu, dt, *_j2_args(j2, r_eq)
+        )
+        return np.array([px, py, pz]), np.array([vx, vy, vz])
+
     acceleration = total_acceleration(position, mu, j2, r_eq)
     new_velocity = velocity + acceleration * dt
     new_position = position + velocity * dt
@@ -154,35 +552,416 @@ def _propagate_rk4(
     r_eq: float | None = None,
 ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
     """Runge-Kutta 4th order integration."""
-    # k1
-    a1 = total_acceleration(position, mu, j2, r_eq)
-    v1 = velocity
-    k1_pos = v1 * dt
-    k1_vel = a1 * dt
-
-    # k2
-    pos2 = position + 0.5 * k1_pos
-    vel2 = velocity + 0.5 * k1_vel
-    a2 = total_acceleration(pos2, mu, j2, r_eq)
-    k2_pos = vel2 * dt
-    k2_vel = a2 * dt
-
-    # k3
-    pos3 = position + 0.5 * k2_pos
-    vel3 = velocity + 0.5 * k2_vel
-    a3 = total_acceleration(pos3, mu, j2, r_eq)
-    k3_pos = vel3 * dt
-    k3_vel = a3 * dt
-
-    # k4
-    pos4 = position + k3_pos
-    vel4 = velocity + k3_vel
-    a4 = total_acceleration(pos4, mu, j2, r_eq)
-    k4_pos = vel4 * dt
-    k4_vel = a4 * dt
-
-    # Combine
-    new_position = position + (k1_pos + 2 * k2_pos + 2 * k3_pos + k4_pos) / 6.0
-    new_velocity = velocity + (k1_vel + 2 * k2_vel + 2 * k3_vel + k4_vel) / 6.0
+    if position.shape == (3,):
+        px, py, pz, vx, vy, vz = _rk4_step_scalar(
+            *position.tolist(), *velocity.tolist(), mu, dt, *_j2_args(j2, r_eq)
+        )
+        return np.array([px, py, pz]), np.array([vx, vy, vz])
 
-    return new_position, new_velocity
+    return _rk4_step(position, velocity, dt, lambda p: total_acceleration(p, mu, j2, r_eq))
+
+
+def _propagate_leapfrog(
+    position: NDArray[np.float64],
+    velocity: NDArray[np.float64],
+    mu: float,
+    dt: float,
+    j2: float | None = None,
+    r_eq: float | None = None,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Kick-drift-kick leapfrog integration (symplectic, 2nd order)."""
+    return _leapfrog_step(position, velocity, dt, lambda p: total_acceleration(p, mu, j2, r_eq))
+
+
+def _propagate_saba2(
+    position: NDArray[np.float64],
+    velocity: NDArray[np.float64],
+    mu: float,
+    dt: float,
+    j2: float | None = None,
+    r_eq: float | None = None,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """SABA2 integration (symplectic, 2nd order, smaller error constant)."""
+    return _saba2_step(position, velocity, dt, lambda p: total_acceleration(p, mu, j2, r_eq))
+
+
+def _method_index(method: str | int) -> int:
+    """Resolve a method name or IntegrationMethod to its dispatch index."""
+    index = method if isinstance(method, int) else _METHOD_BY_NAME.get(method, -1)
+    if not 0 <= index < len(_PROPAGATORS):
+        raise ValueError(f"Unknown integration method: {method}")
+    return index
+
+
+def _j2_args(j2: float | None, r_eq: float | None) -> tuple[float, float]:
+    """J2 arguments for the scalar kernels; j2 = 0 selects pure two-body."""
+    if j2 is None or r_eq is None:
+        return 0.0, 0.0
+    return float(j2), float(r_eq)
+
+
+@njit(cache=True)
+def _accel_scalar(
+    px: float, py: float, pz: float, mu: float, j2: float, r_eq: float
+) -> tuple[float, float, float]:
+    """Two-body (+ J2 unless j2 == 0) acceleration on scalar components, without array allocation."""
+    r2 = px * px + py * py + pz * pz
+    if r2 < _MIN_R_SQ:
+        return 0.0, 0.0, 0.0
+
+    r3 = r2 * math.sqrt(r2)
+    if j2 == 0.0:
+        k = -mu / r3
+        return k * px, k * py, k * pz
+
+    # Same fused form as total_acceleration
+    factor = 1.5 * j2 * mu * r_eq * r_eq / (r2 * r3)
+    k = factor * (5.0 * pz * pz / r2 - 1.0) - mu / r3
+    return k * px, k * py, k * pz - 2.0 * factor * pz
+
+
+@njit(cache=True)
+def _euler_step_scalar(
+    px: float,
+    py: float,
+    pz: float,
+    vx: float,
+    vy: float,
+    vz: float,
+    mu: float,
+    dt: float,
+    j2: float,
+    r_eq: float,
+) -> tuple[float, float, float, float, float, float]:
+    """One Euler step on scalar position/velocity components."""
+    ax, ay, az = _accel_scalar(px, py, pz, mu, j2, r_eq)
+    return px + vx * dt, py + vy * dt, pz + vz * dt, vx + ax * dt, vy + ay * dt, vz + az * dt
+
+
+@njit(cache=True)
+def _rk4_step_scalar(
+    px: float,
+    py: float,
+    pz: float,
+    vx: float,
+    vy: float,
+    vz: float,
+    mu: float,
+    dt: float,
+    j2: float,
+    r_eq: float,
+) -> tuple[float, float, float, float, float, float]:
+    """
+    One RK4 step on scalar position/velocity components.
+
+    Same stages as _rk4_step; stage velocities are carried as scalars so
+    no temporaries are allocated (and the whole step compiles under numba).
+    """
+    a1x, a1y, a1z = _accel_scalar(px, py, pz, mu, j2, r_eq)
+    new_state: tuple[float, float, float, float, float, float] = _rk4_step_scalar_from(
+        px, py, pz, vx, vy, vz, a1x, a1y, a1z, mu, dt, j2, r_eq
+    )
+    return new_state
+
+
+@njit(cache=True)
+def _rk4_step_scalar_from(
+    px: float,
+    py: float,
+    pz: float,
+    vx: float,
+    vy: float,
+    vz: float,
+    a1x: float,
+    a1y: float,
+    a1z: float,
+    mu: float,
+    dt: float,
+    j2: float,
+    r_eq: float,
+) -> tuple[float, float, float, float, float, float]:
+    """RK4 step given the first-stage acceleration a1 at (px, py, pz)."""
+    h = 0.5 * dt
+
+    v2x, v2y, v2z = vx + h * a1x, vy + h * a1y, vz + h * a1z
+    a2x, a2y, a2z = _accel_scalar(px + h * vx, py + h * vy, pz + h * vz, mu, j2, r_eq)
+
+    v3x, v3y, v3z = vx + h * a2x, vy + h * a2y, vz + h * a2z
+    a3x, a3y, a3z = _accel_scalar(px + h * v2x, py + h * v2y, pz + h * v2z, mu, j2, r_eq)
+
+    v4x, v4y, v4z = vx + dt * a3x, vy + dt * a3y, vz + dt * a3z
+    a4x, a4y, a4z = _accel_scalar(px + dt * v3x, py + dt * v3y, pz + dt * v3z, mu, j2, r_eq)
+
+    w = dt * _RK4_SIXTH
+    return (
+        px + w * (vx + 2.0 * v2x + 2.0 * v3x + v4x),
+        py + w * (vy + 2.0 * v2y + 2.0 * v3y + v4y),
+        pz + w * (vz + 2.0 * v2z + 2.0 * v3z + v4z),
+        vx + w * (a1x + 2.0 * a2x + 2.0 * a3x + a4x),
+        vy + w * (a1y + 2.0 * a2y + 2.0 * a3y + a4y),
+        vz + w * (a1z + 2.0 * a2z + 2.0 * a3z + a4z),
+    )
+
+
+@njit(cache=True)
+def _rk4_trajectory(
+    states: NDArray[np.float64],
+    accels: NDArray[np.float64],
+    mu: float,
+    dt: float,
+    j2: float,
+    r_eq: float,
+) -> None:
+    """
+    Fill rows 1..N of (N + 1, 6) states in place with RK4 steps from row 0.
+
+    Each step's first-stage acceleration is the acceleration at its starting
+    row; it is kept in (N + 1, 3) accels unless accels has no rows.
+    """
+    n_rows = states.shape[0]
+    keep = accels.shape[0] > 0
+    for step in range(n_rows):
+        px, py, pz = states[step, 0], states[step, 1], states[step, 2]
+        ax, ay, az = _accel_scalar(px, py, pz, mu, j2, r_eq)
+        if keep:
+            accels[step, 0], accels[step, 1], accels[step, 2] = ax, ay, az
+        if step == n_rows - 1:
+            break
+        vx, vy, vz = states[step, 3], states[step, 4], states[step, 5]
+        px, py, pz, vx, vy, vz = _rk4_step_scalar_from(
+            px, py, pz, vx, vy, vz, ax, ay, az, mu, dt, j2, r_eq
+        )
+        states[step + 1, 0], states[step + 1, 1], states[step + 1, 2] = px, py, pz
+        states[step + 1, 3], states[step + 1, 4], states[step + 1, 5] = vx, vy, vz
+
+
+@njit(cache=True)
+def _dopri5_derivative(
+    y: NDArray[np.float64], n: int, mu: float, j2: float, r_eq: float, out: NDArray[np.float64]
+) -> None:
+    """Write d/dt of a (2 * n,) state [position, velocity] into out; 2D runs at z = 0."""
+    pz = y[2] if n == 3 else 0.0
+    ax, ay, az = _accel_scalar(y[0], y[1], pz, mu, j2, r_eq)
+    for i in range(n):
+        out[i] = y[n + i]
+    out[n], out[n + 1] = ax, ay
+    if n == 3:
+        out[5] = az
+
+
+@njit(cache=True)
+def _dopri5(
+    y: NDArray[np.float64],
+    mu: float,
+    dt_max: float,
+    t_final: float,
+    rtol: float,
+    atol: float,
+    j2: float,
+    r_eq: float,
+) -> float:
+    """
+    Advance the (2 * dim,) state y in place to t_final with DOPRI5 steps.
+
+    Returns the time reached, which is short of t_final only if the step
+    size underflowed.
+    """
+    m = y.shape[0]
+    n = m // 2
+    k = np.empty((7, m))
+    y_stage = np.empty(m)
+    _dopri5_derivative(y, n, mu, j2, r_eq, k[0])
+
+    t = 0.0
+    dt = min(dt_max, t_final)
+    while t < t_final:
+        dt = min(dt, t_final - t)
+        for stage in range(1, 7):
+            for i in range(m):
+                acc = 0.0
+                for j in range(stage):
+                    acc += _DP_A[stage, j] * k[j, i]
+                y_stage[i] = y[i] + dt * acc
+            _dopri5_derivative(y_stage, n, mu, j2, r_eq, k[stage])
+
+        # y_stage is now the 5th-order solution; scale the error by tolerance
+        err_sq = 0.0
+        for i in range(m):
+            e = 0.0
+            for j in range(7):
+                e += _DP_E[j] * k[j, i]
+            scale = atol + rtol * max(abs(y[i]), abs(y_stage[i]))
+            err_sq += (dt * e / scale) ** 2
+        err = math.sqrt(err_sq / m)
+        if err <= 1.0:
+            t += dt
+            for i in range(m):
+                y[i] = y_stage[i]
+                k[0, i] = k[6, i]
+
+        growth = 5.0 if err == 0.0 else min(5.0, max(0.1, 0.9 * err**-0.2))
+        dt = min(dt * growth, dt_max)
+        if t + dt == t:
+            break
+    return t
+
+
+def _total_acceleration_soa(
+    pos: NDArray[np.float64],
+    mu: float,
+    j2: float | None,
+    r_eq: float | None,
+) -> NDArray[np.float64]:
+    """Two-body (+ optional J2) acceleration for (dim, N) positions, dim 2 or 3."""
+    n_dim = len(pos)
+    r2 = pos[0] * pos[0] + pos[1] * pos[1]
+    if n_dim == 3:
+        r2 += pos[2] * pos[2]
+    valid = r2 >= _MIN_R_SQ
+
+    # Same rounding as _accel_scalar, so batched and scalar paths agree bitwise
+    k: NDArray[np.float64] = np.divide(-mu, r2 * np.sqrt(r2), out=np.zeros_like(r2), where=valid)
+    accel = pos * k
+    if j2 is None or r_eq is None:
+        return accel
+
+    # J2: factor = 1.5 J2 μ R² / r⁵, z-terms via (z/r)² = z² / r²
+    inv_r2 = np.divide(1.0, r2, out=np.zeros_like(r2), where=valid)
+    inv_r3 = inv_r2 * np.sqrt(inv_r2)
+    factor = 1.5 * j2 * mu * r_eq * r_eq * inv_r3 * inv_r2
+    if n_dim == 2:
+        accel -= factor * pos
+        return accel
+
+    z_sq_ratio_5 = 5.0 * pos[2] * pos[2] * inv_r2
+    accel[0] += factor * pos[0] * (z_sq_ratio_5 - 1.0)
+    accel[1] += factor * pos[1] * (z_sq_ratio_5 - 1.0)
+    accel[2] += factor * pos[2] * (z_sq_ratio_5 - 3.0)
+    return accel
+
+
+def _euler_step(
+    pos: NDArray[np.float64],
+    vel: NDArray[np.float64],
+    dt: float,
+    accel: Callable[[NDArray[np.float64]], NDArray[np.float64]],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Explicit Euler step for any acceleration model and array layout."""
+    return pos + vel * dt, vel + accel(pos) * dt
+
+
+def _rk4_step(
+    pos: NDArray[np.float64],
+    vel: NDArray[np.float64],
+    dt: float,
+    accel: Callable[[NDArray[np.float64]], NDArray[np.float64]],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    RK4 step for any acceleration model and array layout.
+
+    Position stages use the previous stage velocity directly and the weighted
+    k-sums are accumulated in place, so no per-stage k arrays are allocated.
+    """
+    h = 0.5 * dt
+
+    a = accel(pos)
+    sum_v = vel.copy()
+    sum_a = a.copy()
+
+    v = vel + h * a
+    a = accel(pos + h * vel)
+    sum_v += 2.0 * v
+    sum_a += 2.0 * a
+
+    v_prev = v
+    v = vel + h * a
+    a = accel(pos + h * v_prev)
+    sum_v += 2.0 * v
+    sum_a += 2.0 * a
+
+    v_prev = v
+    v = vel + dt * a
+    a = accel(pos + dt * v_prev)
+    sum_v += v
+    sum_a += a
+
+    w = dt * _RK4_SIXTH
+    return pos + w * sum_v, vel + w * sum_a
+
+
+def _leapfrog_step(
+    pos: NDArray[np.float64],
+    vel: NDArray[np.float64],
+    dt: float,
+    accel: Callable[[NDArray[np.float64]], NDArray[np.float64]],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Kick-drift-kick leapfrog step (symplectic, 2nd order, 2 force evaluations).
+
+    Bounded orbits keep a bounded energy error instead of RK4's secular drift.
+    """
+    h = 0.5 * dt
+    v_half = vel + h * accel(pos)
+    new_pos = pos + dt * v_half
+    return new_pos, v_half + h * accel(new_pos)
+
+
+def _saba2_step(
+    pos: NDArray[np.float64],
+    vel: NDArray[np.float64],
+    dt: float,
+    accel: Callable[[NDArray[np.float64]], NDArray[np.float64]],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """SABA2 step: drift c1, kick 1/2, drift c2, kick 1/2, drift c1 (2 force evaluations)."""
+    h = 0.5 * dt
+    p = pos + _SABA2_C1 * dt * vel
+    v = vel + h * accel(p)
+    p = p + _SABA2_C2 * dt * v
+    v = v + h * accel(p)
+    return p + _SABA2_C1 * dt * v, v
+
+
+def _to_tiles(states: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Pack (N, 3) states into zero-padded (n_tiles, 3, _TILE) AoSoA blocks."""
+    n_tiles = -(-len(states) // _TILE)
+    padded = np.zeros((n_tiles * _TILE, 3))
+    padded[: len(states)] = states
+    return np.ascontiguousarray(padded.reshape(n_tiles, _TILE, 3).transpose(0, 2, 1))
+
+
+def _from_tiles(tiles: NDArray[np.float64], n: int) -> NDArray[np.float64]:
+    """Unpack (n_tiles, 3, _TILE) blocks back to the first n (N, 3) states."""
+    return tiles.transpose(0, 2, 1).reshape(-1, 3)[:n].copy()
+
+
+@njit(cache=True, parallel=True)
+def _rk4_tiles(
+    pos: NDArray[np.float64],
+    vel: NDArray[np.float64],
+    mu: float,
+    dt: float,
+    n_steps: int,
+) -> None:
+    """In-place two-body RK4 on (n_tiles, 3, _TILE) blocks, one thread per tile."""
+    for t in prange(pos.shape[0]):
+        for _ in range(n_steps):
+            for lane in range(pos.shape[2]):
+                px, py, pz, vx, vy, vz = _rk4_step_scalar(
+                    pos[t, 0, lane],
+                    pos[t, 1, lane],
+                    pos[t, 2, lane],
+                    vel[t, 0, lane],
+                    vel[t, 1, lane],
+                    vel[t, 2, lane],
+                    mu,
+                    dt,
+                    0.0,
+                    0.0,
+                )
+                pos[t, 0, lane], pos[t, 1, lane], pos[t, 2, lane] = px, py, pz
+                vel[t, 0, lane], vel[t, 1, lane], vel[t, 2, lane] = vx, vy, vz
+
+
+# Dispatch tables indexed by IntegrationMethod
+_PROPAGATORS: Final = (_propagate_euler, _propagate_rk4, _propagate_leapfrog, _propagate_saba2)
+_BATCH_STEPS: Final = (_euler_step, _rk4_step, _leapfrog_step, _saba2_step)
@@ -1,14 +1,21 @@
 """Relativistic effects: post-Newtonian corrections, time dilation."""
 
-import numpy as np
+import math
+from typing import Final
 
-from outofthisworld.physics.constants import C
+from outofthisworld.physics.constants import C, G
+
+_INV_C2: Final[float] = 1.0 / (C * C)
+# Largest |phi/c^2| evaluated with the weak-field series
+_WEAK_FIELD_MAX: Final[float] = 1e-5
+_TWO_OVER_C2: Final[float] = 2.0 * _INV_C2
 
 
 def gravitational_redshift(
     r1: float,
     r2: float,
     mu: float,
+    exact: bool = False,
 ) -> float:
     """
     Compute gravitational redshift factor between two radii.
@@ -17,16 +24,36 @@ def gravitational_redshift(
         r1: Inner radius (meters)
         r2: Outer radius (meters)
         mu: Gravitational parameter (G * M) in m^3/s^2
+        exact: Evaluate the closed form instead of the weak-field series.
+            Potentials with |phi/c^2| >= 1e-5 always use the closed form.
 
     Returns:
         Frequency ratio f2/f1 (f2 is observed at r2, f1 emitted at r1)
+
+    Raises:
+        ValueError: If r1 or r2 is at or inside the Schwarzschild radius
     """
     if r1 < 1e-6 or r2 < 1e-6:
         return 1.0
 
-    phi1 = -mu / r1
-    phi2 = -mu / r2
-    return np.sqrt((1 + 2 * phi2 / (C**2)) / (1 + 2 * phi1 / (C**2)))
+    x1 = -mu / r1 * _INV_C2
+    x2 = -mu / r2 * _INV_C2
+    if exact or max(abs(x1), abs(x2)) >= _WEAK_FIELD_MAX:
+        phi1 = -mu / r1
+        phi2 = -mu / r2
+        g1 = 1 + 2 * phi1 / (C**2)
+        g2 = 1 + 2 * phi2 / (C**2)
+        if g1 <= 0.0:
+            raise ValueError(f"r1 = {r1} m is at or inside the horizon r_s = {2 * mu * _INV_C2} m")
+        if g2 <= 0.0:
+            raise ValueError(f"r2 = {r2} m is at or inside the horizon r_s = {2 * mu * _INV_C2} m")
+        return math.sqrt(g2 / g1)
+
+    # Second-order series of sqrt((1 + 2 x2) / (1 + 2 x1)): the O(x^3)
+    # truncation is below double precision for |x| < 1e-5, and no sqrt
+    # is needed
+    dx = x2 - x1
+    return 1.0 + dx * (1.0 + 0.5 * dx - (x1 + x2))
 
 
 def schwarzschild_radius(mass: float) -> float:
@@ -39,6 +66,4 @@ def schwarzschild_radius(mass: float) -> float:
     Returns:
         Schwarzschild radius in meters
     """
-    from outofthisworld.physics.constants import G
-
-    return 2 * G * mass / (C**2)
+    return _TWO_OVER_C2 * G * mass
@@ -1,11 +1,32 @@
 """Unit conversions and dimensional analysis."""
 
+from typing import Final
+
 # Unit conversion factors (to SI)
-KM_TO_M: float = 1000.0
-AU_TO_M: float = 1.496e11  # Astronomical unit
-DEG_TO_RAD: float = 0.017453292519943295
-HOUR_TO_SEC: float = 3600.0
-DAY_TO_SEC: float = 86400.0
+KM_TO_M: Final[float] = 1000.0
+AU_TO_M: Final[float] = 1.496e11  # Astronomical unit
+DEG_TO_RAD: Final[float] = 0.017453292519943295
+HOUR_TO_SEC: Final[float] = 3600.0
+DAY_TO_SEC: Final[float] = 86400.0
+
+# (from_unit, to_unit) -> multiplicative factor, one direction per pair
+_FORWARD_FACTORS: Final[dict[tuple[str, str], float]] = {
+    # Length
+    ("km", "m"): KM_TO_M,
+    ("au", "m"): AU_TO_M,
+    # Angle
+    ("deg", "rad"): DEG_TO_RAD,
+    # Time
+    ("hour", "s"): HOUR_TO_SEC,
+    ("day", "s"): DAY_TO_SEC,
+}
+
+# Both directions, built once at import; reverse directions use the
+# precomputed reciprocal so every conversion is one lookup and one multiply
+_CONVERSION_FACTORS: Final[dict[tuple[str, str], float]] = {
+    **_FORWARD_FACTORS,
+    **{(dst, src): 1.0 / factor for (src, dst), factor in _FORWARD_FACTORS.items()},
+}
 
 
 def convert_units(
@@ -30,30 +51,8 @@ def convert_units(
     if from_unit == to_unit:
         return value
 
-    # Length conversions
-    if from_unit == "km" and to_unit == "m":
-        return value * KM_TO_M
-    if from_unit == "m" and to_unit == "km":
-        return value / KM_TO_M
-    if from_unit == "au" and to_unit == "m":
-        return value * AU_TO_M
-    if from_unit == "m" and to_unit == "au":
-        return value / AU_TO_M
-
-    # Angle conversions
-    if from_unit == "deg" and to_unit == "rad":
-        return value * DEG_TO_RAD
-    if from_unit == "rad" and to_unit == "deg":
-        return value / DEG_TO_RAD
-
-    # Time conversions
-    if from_unit == "hour" and to_unit == "s":
-        return value * HOUR_TO_SEC
-    if from_unit == "s" and to_unit == "hour":
-        return value / HOUR_TO_SEC
-    if from_unit == "day" and to_unit == "s":
-        return value * DAY_TO_SEC
-    if from_unit == "s" and to_unit == "day":
-        return value / DAY_TO_SEC
-
-    raise ValueError(f"Unsupported unit conversion: {from_unit} -> {to_unit}")
+    factor = _CONVERSION_FACTORS.get((from_unit, to_unit))
+    if factor is None:
+        raise ValueError(f"Unsupported unit conversion: {from_unit} -> {to_unit}")
+
+    return value * factor
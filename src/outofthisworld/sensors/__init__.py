@@ -5,6 +5,8 @@ from outofthisworld.sensors.interferometer import Interferometer
 from outofthisworld.sensors.noise import (
     generate_random_walk,
     generate_white_noise,
+    make_rng,
+    spawn_rngs,
 )
 
 __all__ = [
@@ -12,4 +14,6 @@ __all__ = [
     "Interferometer",
     "generate_white_noise",
     "generate_random_walk",
+    "make_rng",
+    "spawn_rngs",
 ]
@@ -1,5 +1,7 @@
 """IMU sensor model: bias, noise, random walk."""
 
+import math
+
 import numpy as np
 from numpy.typing import NDArray
 
@@ -8,6 +10,7 @@ from outofthisworld.config import (
     DEFAULT_IMU_BIAS_STABILITY,
     DEFAULT_IMU_NOISE_STD,
 )
+from outofthisworld.sensors.noise import BitGeneratorName, make_rng
 
 
 class IMU:
@@ -23,6 +26,7 @@ class IMU:
         noise_std: float = DEFAULT_IMU_NOISE_STD,
         bias_stability: float = DEFAULT_IMU_BIAS_STABILITY,
         seed: int | None = None,
+        bit_generator: BitGeneratorName = "pcg64",
     ) -> None:
         """
         Initialize IMU model.
@@ -32,12 +36,14 @@ class IMU:
             noise_std: White noise standard deviation (m/s^2)
             bias_stability: Bias random walk step size (m/s^2 per sqrt(second))
             seed: Random seed for reproducibility
+            bit_generator: RNG bit generator ("pcg64", "philox" or "sfc64")
         """
         self.bias = bias
         self.noise_std = noise_std
         self.bias_stability = bias_stability
         self.seed = seed
-        self._rng = np.random.default_rng(seed)
+        self.bit_generator = bit_generator
+        self._rng = make_rng(seed, bit_generator)
         self._current_bias = float(bias)
 
     def measure(
@@ -54,19 +60,78 @@ class IMU:
 
         Returns:
             Measured acceleration with bias and noise
-        """
-        # Update bias (random walk)
-        bias_step = self._rng.normal(0.0, self.bias_stability * np.sqrt(dt))
-        self._current_bias += bias_step
 
-        # Add white noise
+        Dispatches on the input type; hot loops that know it should call
+        measure_scalar or measure_array directly.
+        """
         if isinstance(true_acceleration, np.ndarray):
-            noise = self._rng.normal(0.0, self.noise_std, size=true_acceleration.shape)
-        else:
-            noise = self._rng.normal(0.0, self.noise_std)
+            return self.measure_array(true_acceleration, dt)
+        return self.measure_scalar(true_acceleration, dt)
+
+    def measure_scalar(self, true_acceleration: float, dt: float = 1.0) -> float:
+        """
+        Generate one noisy scalar acceleration measurement.
+
+        Args:
+            true_acceleration: True acceleration (m/s^2)
+            dt: Time step (seconds) for bias drift
 
+        Returns:
+            Measured acceleration with bias and noise
+        """
+        # One draw per call: bias step first, then the white-noise sample
+        z = self._rng.standard_normal(2)
+        self._current_bias += float(z[0]) * (self.bias_stability * math.sqrt(dt))
+        return true_acceleration + self._current_bias + float(z[1]) * self.noise_std
+
+    def measure_array(
+        self,
+        true_acceleration: NDArray[np.float64],
+        dt: float = 1.0,
+    ) -> NDArray[np.float64]:
+        """
+        Generate a noisy measurement with one shared bias step and per-element noise.
+
+        Args:
+            true_acceleration: True acceleration array (m/s^2)
+            dt: Time step (seconds) for bias drift
+
+        Returns:
+            Measured acceleration array with bias and noise
+        """
+        # One draw per call: bias step first, then the white-noise samples
+        z = self._rng.standard_normal(1 + true_acceleration.size)
+        self._current_bias += float(z[0]) * (self.bias_stability * math.sqrt(dt))
+        noise = z[1:].reshape(true_acceleration.shape) * self.noise_std
         return true_acceleration + self._current_bias + noise
 
+    def measure_series(
+        self,
+        true_acceleration: NDArray[np.float64],
+        dt: float = 1.0,
+    ) -> NDArray[np.float64]:
+        """
+        Generate N consecutive scalar measurements in one vectorized pass.
+
+        Consumes the RNG stream exactly like N scalar calls to measure(), so
+        results are identical to the per-step loop.
+
+        Args:
+            true_acceleration: True acceleration per step, shape (N,), in m/s^2
+            dt: Time step (seconds) for bias drift
+
+        Returns:
+            Measured accelerations, shape (N,)
+        """
+        z = self._rng.standard_normal((len(true_acceleration), 2))
+
+        # Prepend the current bias so cumsum accumulates in the same order as measure()
+        steps = z[:, 0] * (self.bias_stability * math.sqrt(dt))
+        biases = np.cumsum(np.concatenate([[self._current_bias], steps]))[1:]
+        self._current_bias = float(biases[-1])
+
+        return true_acceleration + biases + z[:, 1] * self.noise_std
+
     def get_bias(self) -> float:
         """Get current bias value."""
         return self._current_bias
@@ -81,4 +146,4 @@ class IMU:
         self._current_bias = float(self.bias)
         if seed is not None:
             self.seed = seed
-            self._rng = np.random.default_rng(seed)
+            self._rng = make_rng(seed, self.bit_generator)
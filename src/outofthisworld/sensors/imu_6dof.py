@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 from numpy.typing import NDArray
 
 from outofthisworld.sensors.imu_profiles import CLASSICAL_IMU, IMUProfile
+from outofthisworld.sensors.noise import BitGeneratorName, make_rng
 
 
 class IMU6DOF:
@@ -23,6 +26,7 @@ class IMU6DOF:
         self,
         profile: IMUProfile = CLASSICAL_IMU,
         seed: int | None = None,
+        bit_generator: BitGeneratorName = "pcg64",
     ) -> None:
         """
         Initialize 6-DOF IMU.
@@ -30,10 +34,12 @@ class IMU6DOF:
         Args:
             profile: IMU noise/error profile specification
             seed: Random seed for reproducibility
+            bit_generator: RNG bit generator ("pcg64", "philox" or "sfc64")
         """
         self.profile = profile
         self.seed = seed
-        self._rng = np.random.default_rng(seed)
+        self.bit_generator = bit_generator
+        self._rng = make_rng(seed, bit_generator)
 
         # Initialize turn-on biases (drawn from Gaussian)
         self._accel_bias = self._rng.normal(0.0, profile.accel_turn_on_bias, size=3)
@@ -47,6 +53,16 @@ class IMU6DOF:
         self._initial_accel_bias = self._accel_bias.copy()
         self._initial_gyro_bias = self._gyro_bias.copy()
 
+        # (dt, sqrt(dt), sqrt(1/dt)) for the last step size; fixed-dt runs compute it once.
+        # NaN never compares equal, so the first call always computes (and dt=0 still raises)
+        self._dt_cache: tuple[float, float, float] = (math.nan, 0.0, 0.0)
+
+    def _dt_terms(self, dt: float) -> tuple[float, float]:
+        """Return (sqrt(dt), sqrt(1/dt)), recomputed only when dt changes."""
+        if dt != self._dt_cache[0]:
+            self._dt_cache = (dt, math.sqrt(dt), math.sqrt(1.0 / dt))
+        return self._dt_cache[1], self._dt_cache[2]
+
     def measure(
         self,
         true_accel: NDArray[np.float64],
@@ -64,8 +80,13 @@ class IMU6DOF:
         Returns:
             Tuple of (measured_accel, measured_omega)
         """
+        # One draw per step, in the order of the former per-term normal() calls:
+        # accel walk, gyro walk, accel noise, gyro noise
+        z = self._rng.standard_normal(12)
+        sqrt_dt, inv_sqrt_dt = self._dt_terms(dt)
+
         # Update biases via random walk
-        self._update_biases(dt)
+        self._update_biases(sqrt_dt, z[0:3], z[3:6])
 
         # Apply scale factor, bias, and white noise
         meas_accel = self._apply_errors(
@@ -73,7 +94,8 @@ class IMU6DOF:
             self._accel_scale,
             self._accel_bias,
             self.profile.accel_white_noise,
-            dt,
+            inv_sqrt_dt,
+            z[6:9],
         )
 
         meas_omega = self._apply_errors(
@@ -81,21 +103,64 @@ class IMU6DOF:
             self._gyro_scale,
             self._gyro_bias,
             self.profile.gyro_white_noise,
-            dt,
+            inv_sqrt_dt,
+            z[9:12],
         )
 
         return meas_accel, meas_omega
 
-    def _update_biases(self, dt: float) -> None:
-        """Update biases via random walk (bias instability)."""
-        sqrt_dt = np.sqrt(dt)
+    def measure_series(
+        self,
+        true_accel: NDArray[np.float64],
+        true_omega: NDArray[np.float64],
+        dt: float,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Generate N consecutive measurements in one vectorized pass.
+
+        Consumes the RNG stream exactly like N calls to measure(), so results
+        are identical to the per-step loop.
+
+        Args:
+            true_accel: True specific force per step, shape (N, 3), in m/s²
+            true_omega: True angular velocity per step, shape (N, 3), in rad/s
+            dt: Time step in seconds
+
+        Returns:
+            Tuple of (measured_accel, measured_omega), each shape (N, 3)
+        """
+        z = self._rng.standard_normal((len(true_accel), 12))
+        sqrt_dt, inv_sqrt_dt = self._dt_terms(dt)
+
+        accel_bias = _random_walk(
+            self._accel_bias, z[:, 0:3] * (self.profile.accel_bias_instability * sqrt_dt)
+        )
+        gyro_bias = _random_walk(
+            self._gyro_bias, z[:, 3:6] * (self.profile.gyro_bias_instability * sqrt_dt)
+        )
+        self._accel_bias = accel_bias[-1].copy()
+        self._gyro_bias = gyro_bias[-1].copy()
+
+        accel_noise = z[:, 6:9] * (self.profile.accel_white_noise * inv_sqrt_dt)
+        gyro_noise = z[:, 9:12] * (self.profile.gyro_white_noise * inv_sqrt_dt)
+        meas_accel = self._accel_scale * true_accel + accel_bias + accel_noise
+        meas_omega = self._gyro_scale * true_omega + gyro_bias + gyro_noise
+        return meas_accel, meas_omega
+
+    def _update_biases(
+        self,
+        sqrt_dt: float,
+        accel_z: NDArray[np.float64],
+        gyro_z: NDArray[np.float64],
+    ) -> None:
+        """Update biases via random walk from pre-drawn standard normals."""
 
         # Accelerometer bias random walk
-        accel_walk = self._rng.normal(0.0, self.profile.accel_bias_instability * sqrt_dt, size=3)
+        accel_walk = accel_z * (self.profile.accel_bias_instability * sqrt_dt)
         self._accel_bias = self._accel_bias + accel_walk
 
         # Gyroscope bias random walk
-        gyro_walk = self._rng.normal(0.0, self.profile.gyro_bias_instability * sqrt_dt, size=3)
+        gyro_walk = gyro_z * (self.profile.gyro_bias_instability * sqrt_dt)
         self._gyro_bias = self._gyro_bias + gyro_walk
 
     def _apply_errors(
@@ -104,9 +169,10 @@ class IMU6DOF:
         scale: NDArray[np.float64],
         bias: NDArray[np.float64],
         white_noise_density: float,
-        dt: float,
+        inv_sqrt_dt: float,
+        noise_z: NDArray[np.float64],
     ) -> NDArray[np.float64]:
-        """Apply scale factor, bias, and white noise to measurement."""
+        """Apply scale factor, bias, and white noise (from pre-drawn normals)."""
         # Scale factor: y = (1 + s) * x ≈ scale * x
         scaled = scale * true_value
 
@@ -114,8 +180,8 @@ class IMU6DOF:
         biased = scaled + bias
 
         # Add white noise (scaled by sqrt(1/dt) for proper spectral density)
-        noise_std = white_noise_density * np.sqrt(1.0 / dt)
-        noise = self._rng.normal(0.0, noise_std, size=3)
+        noise_std = white_noise_density * inv_sqrt_dt
+        noise = noise_z * noise_std
 
         return biased + noise
 
@@ -136,7 +202,7 @@ class IMU6DOF:
         """
         if seed is not None:
             self.seed = seed
-        self._rng = np.random.default_rng(self.seed)
+        self._rng = make_rng(self.seed, self.bit_generator)
 
         # Re-draw turn-on biases
         self._accel_bias = self._rng.normal(0.0, self.profile.accel_turn_on_bias, size=3)
@@ -148,3 +214,11 @@ class IMU6DOF:
 
         self._initial_accel_bias = self._accel_bias.copy()
         self._initial_gyro_bias = self._gyro_bias.copy()
+
+
+def _random_walk(
+    start: NDArray[np.float64],
+    steps: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """States after each of the (N, k) steps, summed sequentially from start."""
+    return np.cumsum(np.vstack([start, steps]), axis=0)[1:]
@@ -115,6 +115,12 @@ QUANTUM_IMU: Final[IMUProfile] = IMUProfile.from_specs(
     gyro_scale_factor_ppm=1.0,  # 1 ppm
 )
 
+# Named profiles accepted by get_profile
+_PROFILES: Final[dict[str, IMUProfile]] = {
+    "classical": CLASSICAL_IMU,
+    "quantum": QUANTUM_IMU,
+}
+
 
 def get_profile(name: str) -> IMUProfile:
     """
@@ -129,11 +135,7 @@ def get_profile(name: str) -> IMUProfile:
     Raises:
         ValueError: If profile name not recognized
     """
-    profiles = {
-        "classical": CLASSICAL_IMU,
-        "quantum": QUANTUM_IMU,
-    }
-    if name not in profiles:
-        valid = ", ".join(profiles.keys())
+    if name not in _PROFILES:
+        valid = ", ".join(_PROFILES.keys())
         raise ValueError(f"Unknown IMU profile '{name}'. Valid profiles: {valid}")
-    return profiles[name]
+    return _PROFILES[name]
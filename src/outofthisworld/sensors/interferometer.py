@@ -51,15 +51,22 @@ class Interferometer:
 
         Returns:
             Measured phase (radians)
-        """
-        phase_signal = acceleration / self.sensitivity
 
+        Dispatches on the input type; hot loops that know it should call
+        measure_phase_scalar or measure_phase_array directly.
+        """
         if isinstance(acceleration, np.ndarray):
-            noise = self._rng.normal(0.0, self.noise_std, size=acceleration.shape)
-        else:
-            noise = self._rng.normal(0.0, self.noise_std)
+            return self.measure_phase_array(acceleration)
+        return self.measure_phase_scalar(acceleration)
+
+    def measure_phase_scalar(self, acceleration: float) -> float:
+        """Generate one phase measurement (radians) from a scalar acceleration."""
+        return acceleration / self.sensitivity + self._rng.normal(0.0, self.noise_std)
 
-        return phase_signal + noise
+    def measure_phase_array(self, acceleration: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Generate phase measurements (radians) with independent noise per element."""
+        noise = self._rng.normal(0.0, self.noise_std, size=acceleration.shape)
+        return acceleration / self.sensitivity + noise
 
     def phase_to_acceleration(
         self,
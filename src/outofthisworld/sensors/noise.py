@@ -1,8 +1,71 @@
 """Noise generators: white noise, random walk, colored noise."""
 
+from typing import Final, Literal
+
 import numpy as np
 from numpy.typing import NDArray
 
+type BitGeneratorName = Literal["pcg64", "philox", "sfc64"]
+
+_BIT_GENERATORS: Final[dict[str, type[np.random.BitGenerator]]] = {
+    "pcg64": np.random.PCG64,
+    "philox": np.random.Philox,
+    "sfc64": np.random.SFC64,
+}
+
+
+def _bit_generator_class(name: str) -> type[np.random.BitGenerator]:
+    """Look up a bit generator class by name."""
+    bitgen_cls = _BIT_GENERATORS.get(name)
+    if bitgen_cls is None:
+        raise ValueError(f"Unknown bit generator: {name}. Use one of {sorted(_BIT_GENERATORS)}")
+    return bitgen_cls
+
+
+def make_rng(
+    seed: int | None = None, bit_generator: BitGeneratorName = "pcg64"
+) -> np.random.Generator:
+    """
+    Create a random generator backed by the named bit generator.
+
+    "pcg64" reproduces np.random.default_rng(seed) exactly; "sfc64" and
+    "philox" are faster for Gaussian-heavy workloads but give different
+    streams for the same seed.
+
+    Args:
+        seed: Random seed (optional)
+        bit_generator: Bit generator name ("pcg64", "philox" or "sfc64")
+
+    Returns:
+        Random generator
+    """
+    return np.random.Generator(_bit_generator_class(bit_generator)(seed))
+
+
+def spawn_rngs(
+    seed: int | None,
+    n: int,
+    bit_generator: BitGeneratorName = "pcg64",
+) -> list[np.random.Generator]:
+    """
+    Create n statistically independent generators from one seed.
+
+    Streams come from SeedSequence.spawn, which works for every bit
+    generator (SFC64 has no jumped()), so Monte-Carlo workers can each
+    take one without managing a seed tree by hand.
+
+    Args:
+        seed: Root random seed (optional)
+        n: Number of generators
+        bit_generator: Bit generator name ("pcg64", "philox" or "sfc64")
+
+    Returns:
+        List of n independent random generators
+    """
+    bitgen_cls = _bit_generator_class(bit_generator)
+    children = np.random.SeedSequence(seed).spawn(n)
+    return [np.random.Generator(bitgen_cls(child)) for child in children]
+
 
 def generate_white_noise(
     size: int | tuple[int, ...],
@@ -20,12 +83,14 @@ def generate_white_noise(
     Returns:
         Noise array
     """
-    if seed is not None:
-        rng = np.random.default_rng(seed)
-    else:
-        rng = np.random.default_rng()
+    rng = np.random.default_rng(seed)
 
-    return rng.normal(0.0, std, size=size)
+    # Same stream as rng.normal(0.0, std, size); filling and scaling the one
+    # output array in place avoids normal()'s loc/scale broadcasting
+    noise = np.empty(size)
+    rng.standard_normal(out=noise)
+    noise *= std
+    return noise
 
 
 def generate_random_walk(
@@ -46,14 +111,12 @@ def generate_random_walk(
     Returns:
         Random walk array of length n_steps
     """
-    if seed is not None:
-        rng = np.random.default_rng(seed)
-    else:
-        rng = np.random.default_rng()
+    rng = np.random.default_rng(seed)
 
-    steps = rng.normal(0.0, step_std, size=n_steps)
-    walk = np.zeros(n_steps)
-    walk[0] = initial_value
-    if n_steps > 1:
-        walk[1:] = initial_value + np.cumsum(steps[1:])
+    # The walk starts at initial_value, so the first step is zeroed; one
+    # cumsum then produces the whole walk without a prefilled output array
+    steps = rng.standard_normal(n_steps) * step_std
+    steps[:1] = 0.0
+    walk = np.cumsum(steps)
+    walk += initial_value
     return walk
@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Final
 
 import numpy as np
 from numpy.typing import NDArray
 
+from outofthisworld.sensors.noise import BitGeneratorName, make_rng
+
 # Conversion constants
 ARCSEC_TO_RAD: Final[float] = 4.848136811095360e-6  # arcsec to radians
 
+# Standard-normal triples drawn per RNG call for single measurements
+_NOISE_BLOCK_ROWS: Final[int] = 4096
+
 
 @dataclass(frozen=True)
 class StarTrackerConfig:
@@ -21,16 +27,24 @@ class StarTrackerConfig:
     fov_deg: float  # Field of view (degrees)
     name: str = "default"
 
-    @property
+    @cached_property
     def accuracy_rad(self) -> float:
-        """Accuracy in radians."""
+        """Accuracy in radians (computed once; read on every measurement)."""
         return self.accuracy_arcsec * ARCSEC_TO_RAD
 
-    @property
+    @cached_property
     def update_period_s(self) -> float:
-        """Update period in seconds."""
+        """Update period in seconds (computed once; read on every measure call)."""
         return 1.0 / self.update_rate_hz
 
+    @cached_property
+    def noise_cov(self) -> NDArray[np.float64]:
+        """3x3 diagonal measurement noise covariance (rad²), built once and read-only."""
+        variance = self.accuracy_rad**2
+        cov = np.diag([variance, variance, variance])
+        cov.setflags(write=False)
+        return cov
+
 
 # Standard star tracker (representative of flight-proven systems)
 STANDARD_STAR_TRACKER: Final[StarTrackerConfig] = StarTrackerConfig(
@@ -48,6 +62,12 @@ HIGH_ACCURACY_STAR_TRACKER: Final[StarTrackerConfig] = StarTrackerConfig(
     name="high_accuracy",
 )
 
+# Named configurations accepted by get_star_tracker_config
+_STAR_TRACKER_CONFIGS: Final[dict[str, StarTrackerConfig]] = {
+    "standard": STANDARD_STAR_TRACKER,
+    "high_accuracy": HIGH_ACCURACY_STAR_TRACKER,
+}
+
 
 class StarTracker:
     """
@@ -61,6 +81,7 @@ class StarTracker:
         self,
         config: StarTrackerConfig = STANDARD_STAR_TRACKER,
         seed: int | None = None,
+        bit_generator: BitGeneratorName = "pcg64",
     ) -> None:
         """
         Initialize star tracker.
@@ -68,11 +89,27 @@ class StarTracker:
         Args:
             config: Star tracker configuration
             seed: Random seed for reproducibility
+            bit_generator: RNG bit generator ("pcg64", "philox" or "sfc64")
         """
         self.config = config
         self.seed = seed
-        self._rng = np.random.default_rng(seed)
+        self.bit_generator = bit_generator
+        self._rng = make_rng(seed, bit_generator)
+        self._rng_start = self._rng.bit_generator.state  # Restored by reset()
         self._last_measurement_time: float = -float("inf")
+        # Pre-drawn noise rows; every measurement method consumes this buffer
+        # before the RNG, so the noise stream is the same however it is read
+        self._noise_buf = np.empty((0, 3))
+        self._noise_idx = 0
+
+    def _next_noise_row(self) -> NDArray[np.float64]:
+        """Next standard-normal triple, refilling the buffer in one RNG call."""
+        if self._noise_idx == self._noise_buf.shape[0]:
+            self._noise_buf = self._rng.standard_normal((_NOISE_BLOCK_ROWS, 3))
+            self._noise_idx = 0
+        row: NDArray[np.float64] = self._noise_buf[self._noise_idx]
+        self._noise_idx += 1
+        return row
 
     def measure(
         self,
@@ -100,8 +137,7 @@ class StarTracker:
         self._last_measurement_time = time
 
         # Add Gaussian noise to each axis
-        noise = self._rng.normal(0.0, self.config.accuracy_rad, size=3)
-        return true_attitude + noise
+        return true_attitude + self._next_noise_row() * self.config.accuracy_rad
 
     def force_measure(
         self,
@@ -118,7 +154,31 @@ class StarTracker:
         Returns:
             Measured attitude with noise
         """
-        noise = self._rng.normal(0.0, self.config.accuracy_rad, size=3)
+        return true_attitude + self._next_noise_row() * self.config.accuracy_rad
+
+    def force_measure_series(
+        self,
+        true_attitude: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        """
+        Generate N measurements regardless of update rate in one RNG call.
+
+        Consumes the RNG stream exactly like N calls to force_measure(), so
+        row k is identical to the k-th standalone measurement.
+
+        Args:
+            true_attitude: True attitudes, shape (N, 3), in radians
+
+        Returns:
+            Measured attitudes with noise, shape (N, 3)
+        """
+        n_rows = true_attitude.shape[0]
+        buffered = self._noise_buf[self._noise_idx : self._noise_idx + n_rows]
+        self._noise_idx += buffered.shape[0]
+        noise = self._rng.standard_normal((n_rows - buffered.shape[0], 3))
+        if buffered.shape[0]:
+            noise = np.concatenate([buffered, noise])
+        noise *= self.config.accuracy_rad
         return true_attitude + noise
 
     def is_available(self, time: float) -> bool:
@@ -138,22 +198,33 @@ class StarTracker:
         Get measurement noise covariance matrix.
 
         Returns:
-            3x3 diagonal covariance matrix (rad²)
+            3x3 diagonal covariance matrix (rad²), shared and read-only
         """
-        variance = self.config.accuracy_rad**2
-        return np.diag([variance, variance, variance])
+        return self.config.noise_cov
 
     def reset(self, seed: int | None = None) -> None:
         """
         Reset star tracker state.
 
+        A seeded tracker rewinds its existing generator to the start of the
+        stream; an unseeded one has no stream to replay and keeps drawing from
+        the current one (as random as fresh entropy, without a new generator).
+
         Args:
             seed: New random seed (optional)
         """
+        self._last_measurement_time = -float("inf")
+        if seed is None and self.seed is None:
+            return
+
         if seed is not None:
             self.seed = seed
-        self._rng = np.random.default_rng(self.seed)
-        self._last_measurement_time = -float("inf")
+            self._rng = make_rng(seed, self.bit_generator)
+            self._rng_start = self._rng.bit_generator.state
+        else:
+            self._rng.bit_generator.state = self._rng_start
+        self._noise_buf = np.empty((0, 3))
+        self._noise_idx = 0
 
 
 def get_star_tracker_config(name: str) -> StarTrackerConfig:
@@ -169,11 +240,7 @@ def get_star_tracker_config(name: str) -> StarTrackerConfig:
     Raises:
         ValueError: If name not recognized
     """
-    configs = {
-        "standard": STANDARD_STAR_TRACKER,
-        "high_accuracy": HIGH_ACCURACY_STAR_TRACKER,
-    }
-    if name not in configs:
-        valid = ", ".join(configs.keys())
+    if name not in _STAR_TRACKER_CONFIGS:
+        valid = ", ".join(_STAR_TRACKER_CONFIGS.keys())
         raise ValueError(f"Unknown star tracker config '{name}'. Valid: {valid}")
-    return configs[name]
+    return _STAR_TRACKER_CONFIGS[name]
@@ -2,8 +2,12 @@
 
 from outofthisworld.sim.runner import SimulationRunner
 from outofthisworld.sim.scenario import Scenario
+from outofthisworld.sim.sinks import FrameSink, InMemorySink, NpyMemmapSink
 
 __all__ = [
+    "FrameSink",
+    "InMemorySink",
+    "NpyMemmapSink",
     "Scenario",
     "SimulationRunner",
 ]
@@ -2,26 +2,38 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import Any, Final, Literal
 
 import numpy as np
 from numpy.typing import NDArray
 
+from outofthisworld._jit import njit
 from outofthisworld.estimation.ins_ekf import (
     INSEKF,
+    INSEKFBatch,
     INSState,
     create_default_initial_covariance,
 )
 from outofthisworld.sensors.imu_6dof import IMU6DOF
 from outofthisworld.sensors.imu_profiles import IMUProfile, get_profile
+from outofthisworld.sensors.noise import BitGeneratorName
 from outofthisworld.sensors.star_tracker import (
     StarTracker,
     StarTrackerConfig,
     get_star_tracker_config,
 )
 
+type HistoryDType = Literal["float64", "float32"]
+
+# Rows of float64 estimates and P diagonals staged before each store into the histories
+_HISTORY_BLOCK: Final[int] = 256
+
 
 @dataclass
 class ExperimentConfig:
@@ -40,6 +52,9 @@ class ExperimentConfig:
     initial_covariance: NDArray[np.float64]
     output_dir: Path = field(default_factory=lambda: Path("results"))
     output_prefix: str = "experiment"
+    bit_generator: BitGeneratorName = "pcg64"  # Sensor RNG; "sfc64" is faster
+    # Result storage precision; simulation always runs in float64
+    history_dtype: HistoryDType = "float64"
 
 
 @dataclass
@@ -62,17 +77,37 @@ class ExperimentResults:
     att_sigma: NDArray[np.float64]
     n_updates: int = 0
 
+    @cached_property
+    def pos_error_norm(self) -> NDArray[np.float64]:
+        """Per-step position error magnitude (m)."""
+        return _row_norms(self.pos_error)
+
+    @cached_property
+    def vel_error_norm(self) -> NDArray[np.float64]:
+        """Per-step velocity error magnitude (m/s)."""
+        return _row_norms(self.vel_error)
+
+    @cached_property
+    def pos_sigma_norm(self) -> NDArray[np.float64]:
+        """Per-step position 1σ magnitude (m)."""
+        return _row_norms(self.pos_sigma)
+
+    @cached_property
+    def vel_sigma_norm(self) -> NDArray[np.float64]:
+        """Per-step velocity 1σ magnitude (m/s)."""
+        return _row_norms(self.vel_sigma)
+
     def get_final_pos_error_rms(self) -> float:
         """Get final position error RMS."""
-        return float(np.linalg.norm(self.pos_error[-1]))
+        return float(self.pos_error_norm[-1])
 
     def get_final_vel_error_rms(self) -> float:
         """Get final velocity error RMS."""
-        return float(np.linalg.norm(self.vel_error[-1]))
+        return float(self.vel_error_norm[-1])
 
     def get_max_pos_error(self) -> float:
         """Get maximum position error magnitude."""
-        return float(np.max(np.linalg.norm(self.pos_error, axis=1)))
+        return float(np.max(self.pos_error_norm))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON export."""
@@ -92,12 +127,18 @@ class ExperimentResults:
                 "n_updates": self.n_updates,
             },
             "time_s": self.time.tolist(),
-            "pos_error_norm_m": np.linalg.norm(self.pos_error, axis=1).tolist(),
-            "vel_error_norm_m_s": np.linalg.norm(self.vel_error, axis=1).tolist(),
-            "pos_sigma_norm_m": np.linalg.norm(self.pos_sigma, axis=1).tolist(),
+            "pos_error_norm_m": self.pos_error_norm.tolist(),
+            "vel_error_norm_m_s": self.vel_error_norm.tolist(),
+            "pos_sigma_norm_m": self.pos_sigma_norm.tolist(),
         }
 
 
+def _row_norms(x: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Euclidean norm of each row, without the squared temporary of linalg.norm."""
+    squares: NDArray[np.float64] = np.einsum("ij,ij->i", x, x)
+    return np.sqrt(squares)
+
+
 def run_coast_scenario(
     imu_profile: IMUProfile,
     duration_s: float = 3600.0,
@@ -153,9 +194,21 @@ def run_updates_scenario(
     Returns:
         ExperimentResults with error time histories
     """
+    config = _updates_config(imu_profile, update_interval, duration_s, dt, seed)
+    return _run_experiment(config)
+
+
+def _updates_config(
+    imu_profile: IMUProfile,
+    update_interval: float,
+    duration_s: float,
+    dt: float,
+    seed: int,
+) -> ExperimentConfig:
+    """Build the star tracker updates scenario configuration."""
     st_config = get_star_tracker_config("standard")
 
-    config = ExperimentConfig(
+    return ExperimentConfig(
         name=f"updates_{imu_profile.name}_{update_interval:.0f}s",
         duration_s=duration_s,
         dt=dt,
@@ -169,8 +222,6 @@ def run_updates_scenario(
         initial_covariance=create_default_initial_covariance(),
     )
 
-    return _run_experiment(config)
-
 
 def run_cadence_sweep(
     imu_profile: IMUProfile,
@@ -178,16 +229,28 @@ def run_cadence_sweep(
     duration_s: float = 3600.0,
     dt: float = 1.0,
     seed: int = 42,
+    max_workers: int | None = 1,
 ) -> list[ExperimentResults]:
     """
     Sweep star tracker update cadence and collect final errors.
 
+    All intervals share the seed, so the truth trajectory and IMU stream are
+    identical; the sweep runs every interval at once as an INSEKFBatch.
+    With max_workers > 1 the intervals are split into contiguous groups, each
+    run as its own filter bank in a spawned worker process (never forked, since
+    the parent may already run numba/BLAS threads). Filters in a bank are
+    independent, so results are the same either way; this only pays off for
+    long sweeps, since each worker re-imports the package and regenerates
+    the shared truth.
+
     Args:
         imu_profile: IMU noise profile to use
         intervals: List of update intervals to test (seconds)
         duration_s: Simulation duration
         dt: Time step
         seed: Random seed
+        max_workers: Number of worker processes (1 runs in-process, None
+            uses one per CPU)
 
     Returns:
         List of ExperimentResults, one per interval
@@ -195,18 +258,18 @@ def run_cadence_sweep(
     if intervals is None:
         intervals = [10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0]
 
-    results = []
-    for interval in intervals:
-        result = run_updates_scenario(
-            imu_profile=imu_profile,
-            update_interval=interval,
-            duration_s=duration_s,
-            dt=dt,
-            seed=seed,
-        )
-        results.append(result)
+    configs = [
+        _updates_config(imu_profile, interval, duration_s, dt, seed) for interval in intervals
+    ]
+    n_groups = min(max_workers or os.cpu_count() or 1, len(configs))
+    if n_groups <= 1:
+        return _run_experiment_batch(configs)
 
-    return results
+    bounds = np.linspace(0, len(configs), n_groups + 1).astype(int)
+    groups = [configs[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:], strict=True)]
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_groups, mp_context=spawn) as pool:
+        return [r for group in pool.map(_run_experiment_batch, groups) for r in group]
 
 
 def _run_experiment(config: ExperimentConfig) -> ExperimentResults:
@@ -220,25 +283,16 @@ def _run_experiment(config: ExperimentConfig) -> ExperimentResults:
     rotated incorrectly into the navigation frame, leading to velocity and
     position errors even with perfect accelerometer measurements.
     """
-    from outofthisworld.estimation.ins_ekf import rotation_matrix
-
     n_steps = int(config.duration_s / config.dt)
-
-    # Initialize sensors
-    imu = IMU6DOF(profile=config.imu_profile, seed=config.seed)
+    dt = config.dt
 
     star_tracker = None
     if config.star_tracker_config is not None:
-        star_tracker = StarTracker(config=config.star_tracker_config, seed=config.seed + 1)
-
-    # Initialize true state
-    true_pos = config.initial_position.copy()
-    true_vel = config.initial_velocity.copy()
-    true_att = config.initial_attitude.copy()
-
-    # Constant thrust in body frame (simulates deep-space maneuvering)
-    # This makes attitude errors matter - they cause wrong nav-frame acceleration
-    BODY_FRAME_THRUST = np.array([0.1, 0.0, 0.0])  # 0.1 m/s² along body x-axis
+        star_tracker = StarTracker(
+            config=config.star_tracker_config,
+            seed=config.seed + 1,
+            bit_generator=config.bit_generator,
+        )
 
     # Initialize EKF
     initial_state = INSState(
@@ -254,106 +308,346 @@ def _run_experiment(config: ExperimentConfig) -> ExperimentResults:
         imu_profile=config.imu_profile,
     )
 
-    # Storage
-    time_hist = np.zeros(n_steps + 1)
-    true_pos_hist = np.zeros((n_steps + 1, 3))
-    true_vel_hist = np.zeros((n_steps + 1, 3))
-    true_att_hist = np.zeros((n_steps + 1, 3))
-    est_pos_hist = np.zeros((n_steps + 1, 3))
-    est_vel_hist = np.zeros((n_steps + 1, 3))
-    est_att_hist = np.zeros((n_steps + 1, 3))
-    pos_sigma_hist = np.zeros((n_steps + 1, 3))
-    vel_sigma_hist = np.zeros((n_steps + 1, 3))
-    att_sigma_hist = np.zeros((n_steps + 1, 3))
+    streams = _precompute_truth_and_imu(config)
+    time_hist = streams.time
+    true_att_hist = streams.true_attitude
+    accel_meas_hist = streams.accel_meas
+    omega_meas_hist = streams.omega_meas
+
+    # Star tracker cadence is fixed up front, so the update steps, their
+    # measurements (one batched draw, the k-th update uses row k) and the
+    # constant noise covariance are all prepared before the loop.
+    update_due = np.zeros(n_steps, dtype=np.bool_)
+    att_meas_hist = np.empty((0, 3))
+    R = np.zeros((3, 3))
+    if star_tracker is not None:
+        update_due = _update_schedule(time_hist, config.star_tracker_interval)
+        att_meas_hist = star_tracker.force_measure_series(true_att_hist[1:][update_due])
+        R = star_tracker.get_measurement_noise_cov()
+
+    # Storage at history_dtype: estimates laid out like the truth block
+    # (position | velocity | attitude), their errors and 1σ in the same layout.
+    # Rows are staged in float64 blocks and stored by _store_history_block.
+    dtype = config.history_dtype
+    est_hist = np.empty((n_steps + 1, 9), dtype=dtype)
+    error_hist = np.empty((n_steps + 1, 9), dtype=dtype)
+    sigma_hist = np.empty((n_steps + 1, 9), dtype=dtype)
+    est_block = np.empty((_HISTORY_BLOCK, 9))
+    var_block = np.empty((_HISTORY_BLOCK, 9))
 
     # Store initial
-    time_hist[0] = 0.0
-    true_pos_hist[0] = true_pos
-    true_vel_hist[0] = true_vel
-    true_att_hist[0] = true_att
-    est_pos_hist[0] = ekf.state.position
-    est_vel_hist[0] = ekf.state.velocity
-    est_att_hist[0] = ekf.state.attitude
-    pos_sigma_hist[0] = ekf.get_position_uncertainty()
-    vel_sigma_hist[0] = ekf.get_velocity_uncertainty()
-    att_sigma_hist[0] = ekf.get_attitude_uncertainty()
+    est_block[0] = ekf.state.vector[:9]
+    var_block[0] = ekf.covariance.diagonal()[:9]
+    block_start = 0
 
     n_updates = 0
-    last_update_time = 0.0
 
     for step in range(n_steps):
-        t = (step + 1) * config.dt
-
-        # --- True state propagation ---
-        # True rotation matrix (body to nav)
-        C_true = rotation_matrix(true_att)
-
-        # True nav-frame acceleration from body-frame thrust
-        true_accel_nav = C_true @ BODY_FRAME_THRUST
-
-        # Integrate true state
-        true_vel = true_vel + true_accel_nav * config.dt
-        true_pos = true_pos + true_vel * config.dt
-        # Attitude constant (no rotation in this scenario)
-
-        # --- Generate IMU measurements ---
-        # IMU measures the thrust in body frame (specific force)
-        true_accel_body = BODY_FRAME_THRUST
-        true_omega = np.zeros(3)
-
-        accel_meas, omega_meas = imu.measure(true_accel_body, true_omega, config.dt)
-
         # --- EKF prediction ---
         # The EKF uses its ESTIMATED attitude to rotate accel to nav frame
         # If attitude has error, the nav-frame acceleration is wrong,
         # causing velocity and position errors
-        ekf.predict(accel_meas, omega_meas, config.dt)
+        ekf.predict(accel_meas_hist[step], omega_meas_hist[step], dt)
 
         # --- Star tracker update ---
-        if star_tracker is not None:
-            if (t - last_update_time) >= config.star_tracker_interval:
-                att_meas = star_tracker.force_measure(true_att)
-                R = star_tracker.get_measurement_noise_cov()
-                ekf.update_attitude(att_meas, R)
-                last_update_time = t
-                n_updates += 1
+        if update_due[step]:
+            ekf.update_attitude(att_meas_hist[n_updates], R)
+            n_updates += 1
 
         # --- Store ---
-        time_hist[step + 1] = t
-        true_pos_hist[step + 1] = true_pos
-        true_vel_hist[step + 1] = true_vel
-        true_att_hist[step + 1] = true_att
-        est_pos_hist[step + 1] = ekf.state.position
-        est_vel_hist[step + 1] = ekf.state.velocity
-        est_att_hist[step + 1] = ekf.state.attitude
-        pos_sigma_hist[step + 1] = ekf.get_position_uncertainty()
-        vel_sigma_hist[step + 1] = ekf.get_velocity_uncertainty()
-        att_sigma_hist[step + 1] = ekf.get_attitude_uncertainty()
-
-    # Compute errors
-    pos_error = est_pos_hist - true_pos_hist
-    vel_error = est_vel_hist - true_vel_hist
-    att_error = est_att_hist - true_att_hist
+        row = step + 1 - block_start
+        if row == _HISTORY_BLOCK:
+            _store_history_block(
+                est_block, var_block, streams.truth, est_hist, error_hist, sigma_hist, block_start
+            )
+            block_start += row
+            row = 0
+        est_block[row] = ekf.state.vector[:9]
+        var_block[row] = ekf.covariance.diagonal()[:9]
+
+    _store_history_block(
+        est_block, var_block, streams.truth, est_hist, error_hist, sigma_hist, block_start
+    )
+
+    # The per-quantity arrays are column views
+    truth = streams.truth.astype(dtype, copy=False)
 
     return ExperimentResults(
         config=config,
         time=time_hist,
-        true_position=true_pos_hist,
-        true_velocity=true_vel_hist,
-        true_attitude=true_att_hist,
-        est_position=est_pos_hist,
-        est_velocity=est_vel_hist,
-        est_attitude=est_att_hist,
-        pos_error=pos_error,
-        vel_error=vel_error,
-        att_error=att_error,
-        pos_sigma=pos_sigma_hist,
-        vel_sigma=vel_sigma_hist,
-        att_sigma=att_sigma_hist,
+        true_position=truth[:, 0:3],
+        true_velocity=truth[:, 3:6],
+        true_attitude=truth[:, 6:9],
+        est_position=est_hist[:, 0:3],
+        est_velocity=est_hist[:, 3:6],
+        est_attitude=est_hist[:, 6:9],
+        pos_error=error_hist[:, 0:3],
+        vel_error=error_hist[:, 3:6],
+        att_error=error_hist[:, 6:9],
+        pos_sigma=sigma_hist[:, 0:3],
+        vel_sigma=sigma_hist[:, 3:6],
+        att_sigma=sigma_hist[:, 6:9],
         n_updates=n_updates,
     )
 
 
+def _store_history_block(
+    est_block: NDArray[np.float64],
+    var_block: NDArray[np.float64],
+    truth: NDArray[np.float64],
+    est_hist: NDArray[Any],
+    error_hist: NDArray[Any],
+    sigma_hist: NDArray[Any],
+    start: int,
+) -> None:
+    """
+    Store staged float64 rows into the history arrays from row start on.
+
+    Works on (rows, 9) or per-filter (n_filters, rows, 9) histories; the row
+    count is whatever is left, up to a full block. Errors and 1σ are formed in
+    float64 and rounded once on store, so float32 histories never difference
+    rounded positions.
+    """
+    stop = min(start + est_block.shape[-2], est_hist.shape[-2])
+    n = stop - start
+    est_hist[..., start:stop, :] = est_block[..., :n, :]
+    np.subtract(est_block[..., :n, :], truth[start:stop], out=error_hist[..., start:stop, :])
+    np.sqrt(var_block[..., :n, :], out=sigma_hist[..., start:stop, :])
+
+
+@dataclass
+class _TruthAndIMU:
+    """Truth trajectory and IMU measurement stream shared by experiment runners."""
+
+    time: NDArray[np.float64]  # (N + 1,)
+    truth: NDArray[np.float64]  # (N + 1, 9): position | velocity | attitude
+    accel_meas: NDArray[np.float64]  # (N, 3)
+    omega_meas: NDArray[np.float64]  # (N, 3)
+
+    @property
+    def true_position(self) -> NDArray[np.float64]:
+        """(N + 1, 3) view of the true position."""
+        return self.truth[:, 0:3]
+
+    @property
+    def true_velocity(self) -> NDArray[np.float64]:
+        """(N + 1, 3) view of the true velocity."""
+        return self.truth[:, 3:6]
+
+    @property
+    def true_attitude(self) -> NDArray[np.float64]:
+        """(N + 1, 3) view of the true attitude."""
+        return self.truth[:, 6:9]
+
+
+def _precompute_truth_and_imu(config: ExperimentConfig) -> _TruthAndIMU:
+    """
+    Propagate the true state and draw the IMU stream for a whole run.
+
+    Truth never depends on the filter, so it is integrated up front by a
+    compiled kernel, and the IMU noise is drawn in one batch that consumes the
+    RNG exactly like per-step measure() calls. Attitude is constant (no
+    rotation in these scenarios), so the true nav-frame acceleration is too.
+
+    Args:
+        config: Experiment configuration (duration, dt, seed, IMU profile and
+            initial conditions are used)
+
+    Returns:
+        _TruthAndIMU for the configured run
+    """
+    from outofthisworld.estimation.ins_ekf import rotation_matrix
+
+    n_steps = int(config.duration_s / config.dt)
+    dt = config.dt
+
+    # Constant thrust in body frame (simulates deep-space maneuvering)
+    # This makes attitude errors matter - they cause wrong nav-frame acceleration
+    BODY_FRAME_THRUST = np.array([0.1, 0.0, 0.0])  # 0.1 m/s² along body x-axis
+
+    time_hist = np.arange(n_steps + 1, dtype=np.float64) * dt
+    true_att = config.initial_attitude.copy()
+    true_accel_nav = rotation_matrix(true_att) @ BODY_FRAME_THRUST
+    # One contiguous (N + 1, 9) block so errors are a single subtraction
+    truth = np.empty((n_steps + 1, 9))
+    truth[:, 6:9] = true_att
+    truth[0, 0:3] = config.initial_position
+    truth[0, 3:6] = config.initial_velocity
+    _integrate_truth(truth[:, 0:3], truth[:, 3:6], np.tile(true_accel_nav, (n_steps, 1)), dt)
+
+    # IMU measures the thrust in body frame (specific force)
+    imu = IMU6DOF(profile=config.imu_profile, seed=config.seed, bit_generator=config.bit_generator)
+    accel_meas_hist, omega_meas_hist = imu.measure_series(
+        np.tile(BODY_FRAME_THRUST, (n_steps, 1)), np.zeros((n_steps, 3)), dt
+    )
+
+    return _TruthAndIMU(
+        time=time_hist,
+        truth=truth,
+        accel_meas=accel_meas_hist,
+        omega_meas=omega_meas_hist,
+    )
+
+
+@njit(cache=True)
+def _integrate_truth(
+    pos_hist: NDArray[np.float64],
+    vel_hist: NDArray[np.float64],
+    accel_nav: NDArray[np.float64],
+    dt: float,
+) -> None:
+    """
+    Integrate the true trajectory in place (semi-implicit Euler).
+
+    Fills rows 1..N of the (N + 1, 3) position/velocity histories from row 0,
+    given the (N, 3) nav-frame acceleration applied over each step.
+    """
+    for step in range(accel_nav.shape[0]):
+        for axis in range(3):
+            vel_hist[step + 1, axis] = vel_hist[step, axis] + accel_nav[step, axis] * dt
+            pos_hist[step + 1, axis] = pos_hist[step, axis] + vel_hist[step + 1, axis] * dt
+
+
+@njit(cache=True)
+def _update_schedule(time_hist: NDArray[np.float64], interval: float) -> NDArray[np.bool_]:
+    """
+    Mark the steps at which a fixed-cadence sensor update fires.
+
+    An update is due at step k when time_hist[k + 1] is at least ``interval``
+    past the previous update (the first counts from t = 0). The comparison is
+    done on the same float times the step loop uses, so the schedule matches
+    checking the cadence inside the loop exactly.
+
+    Returns:
+        (N,) boolean mask over the N steps of an (N + 1,) time history
+    """
+    n_steps = time_hist.shape[0] - 1
+    due = np.zeros(n_steps, dtype=np.bool_)
+    last_update_time = 0.0
+    for step in range(n_steps):
+        t = time_hist[step + 1]
+        if (t - last_update_time) >= interval:
+            due[step] = True
+            last_update_time = t
+    return due
+
+
+def _run_experiment_batch(configs: list[ExperimentConfig]) -> list[ExperimentResults]:
+    """
+    Run experiments that differ only in star tracker cadence as one filter bank.
+
+    All configs must share duration, dt, seed, IMU profile, initial conditions
+    and star tracker config; only star_tracker_interval may vary.
+
+    Truth propagation and IMU measurements are generated once and shared; each
+    filter in the INSEKFBatch keeps its own star tracker (same seed, so the k-th
+    update of every filter sees the same noise draw as a standalone run).
+    """
+    base = configs[0]
+    n_filters = len(configs)
+    n_steps = int(base.duration_s / base.dt)
+    dt = base.dt
+
+    streams = _precompute_truth_and_imu(base)
+    time_hist = streams.time
+    true_att_hist = streams.true_attitude
+
+    # Per-filter update schedules and star tracker draws, fixed up front
+    update_due = np.zeros((n_filters, n_steps), dtype=np.bool_)
+    att_meas_rows = [np.empty((0, 3)) for _ in configs]
+    for i, c in enumerate(configs):
+        if c.star_tracker_config is None:
+            continue
+        update_due[i] = _update_schedule(time_hist, c.star_tracker_interval)
+        star_tracker = StarTracker(
+            config=c.star_tracker_config, seed=c.seed + 1, bit_generator=c.bit_generator
+        )
+        att_meas_rows[i] = star_tracker.force_measure_series(true_att_hist[1:][update_due[i]])
+    update_any = update_due.any(axis=0)
+    # Never used when no filter has a tracker
+    R = np.zeros((3, 3))
+    if base.star_tracker_config is not None:
+        R = StarTracker(config=base.star_tracker_config).get_measurement_noise_cov()
+
+    initial_state = INSState(
+        position=base.initial_position.copy(),
+        velocity=base.initial_velocity.copy(),
+        attitude=base.initial_attitude.copy(),
+        accel_bias=np.zeros(3),
+        gyro_bias=np.zeros(3),
+    )
+    bank = INSEKFBatch(
+        initial_state=initial_state,
+        initial_covariance=base.initial_covariance,
+        imu_profile=base.imu_profile,
+        n_filters=n_filters,
+    )
+
+    # Storage at history_dtype: per-filter estimates, errors and 1σ, staged in
+    # float64 blocks like _run_experiment
+    dtype = base.history_dtype
+    est_hist = np.empty((n_filters, n_steps + 1, 9), dtype=dtype)
+    error_hist = np.empty((n_filters, n_steps + 1, 9), dtype=dtype)
+    sigma_hist = np.empty((n_filters, n_steps + 1, 9), dtype=dtype)
+    est_block = np.empty((n_filters, _HISTORY_BLOCK, 9))
+    var_block = np.empty((n_filters, _HISTORY_BLOCK, 9))
+    est_block[:, 0] = bank.state[:, :9]
+    var_block[:, 0] = np.diagonal(bank.covariance, axis1=1, axis2=2)[:, :9]
+    block_start = 0
+
+    n_updates = np.zeros(n_filters, dtype=int)
+    att_meas = np.empty((n_filters, 3))
+
+    for step in range(n_steps):
+        bank.predict(streams.accel_meas[step], streams.omega_meas[step], dt)
+
+        if update_any[step]:
+            due = update_due[:, step]
+            for idx in np.flatnonzero(due).tolist():
+                att_meas[idx] = att_meas_rows[idx][n_updates[idx]]
+            bank.update_attitude(att_meas, R, mask=due)
+            n_updates[due] += 1
+
+        row = step + 1 - block_start
+        if row == _HISTORY_BLOCK:
+            _store_history_block(
+                est_block, var_block, streams.truth, est_hist, error_hist, sigma_hist, block_start
+            )
+            block_start += row
+            row = 0
+        est_block[:, row] = bank.state[:, :9]
+        var_block[:, row] = np.diagonal(bank.covariance, axis1=1, axis2=2)[:, :9]
+
+    _store_history_block(
+        est_block, var_block, streams.truth, est_hist, error_hist, sigma_hist, block_start
+    )
+    truth = streams.truth.astype(dtype, copy=False)
+
+    results = []
+    for i, config in enumerate(configs):
+        results.append(
+            ExperimentResults(
+                config=config,
+                time=time_hist,
+                true_position=truth[:, 0:3],
+                true_velocity=truth[:, 3:6],
+                true_attitude=truth[:, 6:9],
+                est_position=est_hist[i, :, 0:3],
+                est_velocity=est_hist[i, :, 3:6],
+                est_attitude=est_hist[i, :, 6:9],
+                pos_error=error_hist[i, :, 0:3],
+                vel_error=error_hist[i, :, 3:6],
+                att_error=error_hist[i, :, 6:9],
+                pos_sigma=sigma_hist[i, :, 0:3],
+                vel_sigma=sigma_hist[i, :, 3:6],
+                att_sigma=sigma_hist[i, :, 6:9],
+                n_updates=int(n_updates[i]),
+            )
+        )
+
+    return results
+
+
 def load_config_from_yaml(path: Path) -> ExperimentConfig:
     """
     Load experiment configuration from YAML file.
@@ -414,4 +708,6 @@ def load_config_from_yaml(path: Path) -> ExperimentConfig:
         initial_covariance=initial_cov,
         output_dir=Path(out.get("directory", "results")),
         output_prefix=out.get("prefix", "experiment"),
+        bit_generator=sim.get("bit_generator", "pcg64"),
+        history_dtype=out.get("history_dtype", "float64"),
     )
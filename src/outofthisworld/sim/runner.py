@@ -1,13 +1,50 @@
 """Simulation runner: orchestrates physics, sensors, estimation."""
 
+import math
+from typing import Final
+
 import numpy as np
 from numpy.typing import NDArray
 
 from outofthisworld.estimation.gravity_measurements import GravityMeasurementModel
 from outofthisworld.estimation.kalman import ExtendedKalmanFilter
-from outofthisworld.physics.orbital import propagate_orbit, total_acceleration
+from outofthisworld.physics.orbital import (
+    IntegrationMethod,
+    propagate_trajectory,
+    propagate_trajectory_batch,
+    total_acceleration,
+    two_body_jacobian,
+)
 from outofthisworld.sensors.imu import IMU
+from outofthisworld.sensors.noise import make_rng
 from outofthisworld.sim.scenario import Scenario
+from outofthisworld.sim.sinks import FrameSink
+
+# Estimator history rows buffered between writes when streaming to a sink
+_SINK_CHUNK_ROWS: Final[int] = 1024
+
+
+def _gaussian_noise(
+    rng: np.random.Generator,
+    n_samples: int,
+    cov: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Draw zero-mean Gaussian samples with a fixed covariance in one call.
+
+    Args:
+        rng: Random generator
+        n_samples: Number of samples
+        cov: (m x m) covariance
+
+    Returns:
+        (n_samples, m) samples
+    """
+    z = rng.standard_normal((n_samples, cov.shape[0]))
+    if np.count_nonzero(cov - np.diag(np.diagonal(cov))) == 0:
+        z *= np.sqrt(np.diagonal(cov))
+        return z
+    return z @ np.linalg.cholesky(cov).T
 
 
 class SimulationRunner:
@@ -23,6 +60,8 @@ class SimulationRunner:
         imu: IMU | None = None,
         estimator: ExtendedKalmanFilter | None = None,
         measurement_model: GravityMeasurementModel | None = None,
+        seed: int | None = None,
+        sink: FrameSink | None = None,
     ) -> None:
         """
         Initialize simulation runner.
@@ -32,149 +71,253 @@ class SimulationRunner:
             imu: IMU sensor model (optional, for legacy magnitude mode)
             estimator: State estimator (optional)
             measurement_model: Gravitational measurement model (optional)
+            seed: Seed for measurement-model noise; each run() restarts the
+                stream, so seeded runs are repeatable
+            sink: Optional destination for the histories. Estimator histories
+                are then streamed in blocks of rows instead of held for the
+                whole run
         """
         self.scenario = scenario
         self.imu = imu
         self.estimator = estimator
         self.measurement_model = measurement_model
-
-        # Storage for results
-        self.true_states: list[NDArray[np.float64]] = []
-        self.measurements: list[NDArray[np.float64] | float] = []
-        self.estimated_states: list[NDArray[np.float64]] = []
-        self.estimated_covariances: list[NDArray[np.float64]] = []
+        self.seed = seed
+        self.sink = sink
+
+        # Storage for results; histories are preallocated by run()
+        self.true_states: NDArray[np.float64] = np.empty((0, 6))
+        self.measurements: NDArray[np.float64] = np.empty(0)
+        self.estimated_states: NDArray[np.float64] = np.empty((0, 0))
+        self.estimated_covariances: NDArray[np.float64] = np.empty((0, 0, 0))
+
+        # Transition Jacobian scratch, rebuilt by run() for the current estimator
+        self._F_buf: NDArray[np.float64] = np.empty((0, 0))
+        # Legacy magnitude-measurement Jacobian, (1, n) with a zero velocity half
+        self._H_buf: NDArray[np.float64] = np.empty((0, 0))
+        # Legacy magnitude prediction h(x), shape (1,)
+        self._z_pred: NDArray[np.float64] = np.empty(1)
+        # Two alternating rows the prediction f(x, dt) writes into
+        self._x_pred: NDArray[np.float64] = np.empty((2, 0))
 
     def run(self) -> dict[str, NDArray[np.float64]]:
         """
         Run simulation.
 
         Returns:
-            Dictionary with results: 'true_states', 'measurements', 'estimated_states'
+            Dictionary with results: 'true_states', 'measurements',
+            'estimated_states', 'estimated_covariances'. With a sink, the
+            estimator histories are only in the sink. The arrays are the
+            runner's own history buffers, returned without a copy; each run()
+            allocates fresh ones, so earlier results stay valid
         """
         # Initialize
-        position = self.scenario.initial_position.copy()
-        velocity = self.scenario.initial_velocity.copy()
         dt = self.scenario.dt
-
-        # Clear storage
-        self.true_states.clear()
-        self.measurements.clear()
-        self.estimated_states.clear()
-        self.estimated_covariances.clear()
-
-        # Store initial state
-        state = np.concatenate([position, velocity])
-        self.true_states.append(state.copy())
-
-        # Initialize estimator if provided
+        n_steps = self.scenario.n_steps
+        n_dim = len(self.scenario.initial_position)
+
+        # The truth does not depend on sensors or the estimator, so the whole
+        # trajectory is propagated up front (row k holds the state after k steps).
+        # Legacy IMU runs also keep the integrator's acceleration at every state.
+        legacy_imu = self.measurement_model is None and self.imu is not None
+        true_accels = np.empty((n_steps + 1 if legacy_imu else 0, n_dim))
+        self.true_states = propagate_trajectory(
+            self.scenario.initial_position,
+            self.scenario.initial_velocity,
+            self.scenario.mu,
+            dt,
+            n_steps,
+            method=IntegrationMethod.RK4,
+            accel_out=true_accels if legacy_imu else None,
+        )
+        # (n_steps,) legacy magnitudes; model measurements are (n_steps, m)
+        self.measurements = np.empty(n_steps)
+
+        # Initialize estimator if provided. Without a sink the histories span
+        # the whole run; with one they are a block of rows written out when full
+        hist_rows = n_steps + 1 if self.sink is None else min(_SINK_CHUNK_ROWS, n_steps + 1)
         if self.estimator is not None:
-            self.estimated_states.append(self.estimator.state.copy())
-            self.estimated_covariances.append(self.estimator.covariance.copy())
+            n = len(self.estimator.state)
+            self.estimated_states = np.empty((hist_rows, n))
+            self.estimated_covariances = np.empty((hist_rows, n, n))
+            self.estimated_states[0] = self.estimator.state
+            self.estimated_covariances[0] = self.estimator.covariance
             # Get state dimension for measurement model
-            n_half = len(self.estimator.state) // 2
+            n_half = n // 2
+            # F = [[I, dt*I], [dt*d(accel)/d(pos), I]]: only the lower-left
+            # block changes between steps, the identity blocks are written once
+            self._F_buf = np.eye(n)
+            np.fill_diagonal(self._F_buf[:n_half, n_half:], dt)
+            self._H_buf = np.zeros((1, n))
+            self._z_pred = np.empty(1)
+            self._x_pred = np.empty((2, n))
         else:
-            n_half = len(position)  # Full 3D if no estimator
-
-        # Main loop
-        n_steps = self.scenario.get_n_steps()
+            n_half = n_dim  # Full 3D if no estimator
+
+        # Measurement-model noise for every step, drawn in one call. R is fixed,
+        # so diagonal R scales standard normals by σ and full R uses its
+        # Cholesky factor once instead of multivariate_normal per step.
+        noise_hist = np.empty((0, 0))
+        # Reused (position | velocity) buffer the measurement model is evaluated on
+        meas_state = np.empty(2 * n_half)
+        if self.measurement_model is not None:
+            noise_cov = self.measurement_model.measurement_noise_cov(2 * n_half)
+            noise_hist = _gaussian_noise(make_rng(self.seed), n_steps, noise_cov)
+            self.measurements = np.empty((n_steps, len(noise_cov)))
+        elif self.imu is not None:
+            # Legacy: the whole IMU magnitude series in one call
+            accels = true_accels[1:]
+            accel_mags = np.sqrt(np.einsum("ij,ij->i", accels, accels))
+            self.measurements = self.imu.measure_series(accel_mags, dt)
+
+        has_measurements = n_steps > 0 and (
+            self.measurement_model is not None or self.imu is not None
+        )
+        if self.sink is not None:
+            self._open_sink(n_steps, has_measurements)
+
+        # Main loop, on locals rather than attribute lookups
+        true_states = self.true_states
+        measurements = self.measurements
+        measurement_model = self.measurement_model
+        imu = self.imu
+        estimator = self.estimator
+        base = 0  # Run row held in row 0 of the estimator histories
         for step in range(n_steps):
-            # Propagate orbit
-            position, velocity = propagate_orbit(
-                position,
-                velocity,
-                self.scenario.mu,
-                dt,
-                method="rk4",
-            )
-
-            # Compute true acceleration
-            true_accel = total_acceleration(position, self.scenario.mu)
-            accel_magnitude = np.linalg.norm(true_accel)
-
             # Generate measurement
-            if self.measurement_model is not None:
+            if measurement_model is not None:
                 # Use measurement model - use state dimension, not full 3D position
                 # For 2D state, only use first 2 components of position
-                state_for_measurement = np.concatenate([position[:n_half], velocity[:n_half]])
-                true_measurement = self.measurement_model.predict_measurement(state_for_measurement)
-                # Add noise
-                noise_cov = self.measurement_model.measurement_noise_cov(len(state_for_measurement))
-                noise = np.random.multivariate_normal(np.zeros(len(true_measurement)), noise_cov)
-                measurement = true_measurement + noise
-                self.measurements.append(measurement.copy())
-            elif self.imu is not None:
-                # Legacy: IMU magnitude measurement
-                measurement = self.imu.measure(accel_magnitude, dt)
-                self.measurements.append(float(measurement))
+                meas_state[:n_half] = true_states[step + 1, :n_half]
+                meas_state[n_half:] = true_states[step + 1, n_dim : n_dim + n_half]
+                # Noisy measurement written straight into its history row
+                measurement = measurements[step]
+                np.add(
+                    measurement_model.predict_measurement(meas_state),
+                    noise_hist[step],
+                    out=measurement,
+                )
+            elif imu is not None:
+                measurement = measurements[step : step + 1]
 
             # Update estimator
-            if self.estimator is not None:
-                if self.measurement_model is not None:
+            if estimator is not None:
+                if measurement_model is not None:
                     self._update_estimator_with_model(measurement, dt)
-                elif self.imu is not None:
+                elif imu is not None:
                     self._update_estimator_legacy(measurement, dt)
+                row = step + 1 - base
+                if row == hist_rows:
+                    self._flush_estimates(base, hist_rows)
+                    base += hist_rows
+                    row = 0
+                self.estimated_states[row] = estimator.state
+                self.estimated_covariances[row] = estimator.covariance
 
-            # Store state
-            state = np.concatenate([position, velocity])
-            self.true_states.append(state.copy())
-
-            if self.estimator is not None:
-                self.estimated_states.append(self.estimator.state.copy())
-                self.estimated_covariances.append(self.estimator.covariance.copy())
-
-        # Convert to arrays
         results: dict[str, NDArray[np.float64]] = {
-            "true_states": np.array(self.true_states),
+            "true_states": self.true_states,
         }
-        if self.measurements:
-            # Convert measurements to array (handle mixed types)
-            if isinstance(self.measurements[0], np.ndarray):
-                results["measurements"] = np.array(self.measurements)
-            else:
-                results["measurements"] = np.array(self.measurements)
-        if self.estimated_states:
-            results["estimated_states"] = np.array(self.estimated_states)
-        if self.estimated_covariances:
-            results["estimated_covariances"] = np.array(self.estimated_covariances)
+        if has_measurements:
+            results["measurements"] = self.measurements
+        if self.sink is not None:
+            if self.estimator is not None:
+                self._flush_estimates(base, n_steps + 1 - base)
+            for key, history in results.items():
+                self.sink.write(key, 0, history)
+            self.sink.close()
+            return results
+        if self.estimator is not None:
+            results["estimated_states"] = self.estimated_states
+            results["estimated_covariances"] = self.estimated_covariances
 
         return results
 
-    def _update_estimator_with_model(
-        self,
-        measurement: NDArray[np.float64],
-        dt: float,
-    ) -> None:
-        """Update EKF using measurement model."""
-        if self.estimator is None or self.measurement_model is None:
+    def run_fleet(self, states: NDArray[np.float64]) -> NDArray[np.float64]:
+        """
+        Propagate a fleet of K craft through the scenario's truth model at once.
+
+        Every craft shares the scenario's mu, dt and duration; sensors and the
+        estimator are single-craft and are not run.
+
+        Args:
+            states: Initial [position, velocity] rows, shape (K, 2 * dim)
+
+        Returns:
+            (n_steps + 1, K, 2 * dim) true states; [k, i] is craft i after k steps
+        """
+        n_dim = states.shape[1] // 2
+        return propagate_trajectory_batch(
+            states[:, :n_dim],
+            states[:, n_dim:],
+            self.scenario.mu,
+            self.scenario.dt,
+            self.scenario.n_steps,
+            method=IntegrationMethod.RK4,
+        )
+
+    def _open_sink(self, n_steps: int, has_measurements: bool) -> None:
+        """Announce the full shape of every history the run will write."""
+        if self.sink is None:
+            return
+
+        shapes = {"true_states": self.true_states.shape}
+        if has_measurements:
+            shapes["measurements"] = self.measurements.shape
+        if self.estimator is not None:
+            n = len(self.estimator.state)
+            shapes["estimated_states"] = (n_steps + 1, n)
+            shapes["estimated_covariances"] = (n_steps + 1, n, n)
+        self.sink.open(shapes)
+
+    def _flush_estimates(self, start: int, count: int) -> None:
+        """Write the first count buffered estimator rows as run rows start onward."""
+        if self.sink is None:
             return
 
-        n = len(self.estimator.state)
-        n_half = n // 2
+        self.sink.write("estimated_states", start, self.estimated_states[:count])
+        self.sink.write("estimated_covariances", start, self.estimated_covariances[:count])
 
-        # Prediction: constant velocity model with gravitational acceleration
+    def _predict_estimator(self, dt: float) -> None:
+        """EKF prediction with the gravitational constant-velocity model."""
+        if self.estimator is None:
+            return
+
+        n_half = len(self.estimator.state) // 2
+
+        # Prediction: constant velocity model with gravitational acceleration,
+        # written into whichever prediction buffer does not hold x (predict()
+        # adopts the returned array as the new state)
         def f(x: NDArray[np.float64], _dt: float) -> NDArray[np.float64]:
             pos = x[:n_half]
             vel = x[n_half:]
             accel = total_acceleration(pos, self.scenario.mu)
-            new_pos = pos + vel * _dt
-            new_vel = vel + accel * _dt
-            return np.concatenate([new_pos, new_vel])
-
-        # Jacobian: F = [[I, dt*I], [d(accel)/d(pos), I]]
-        I_half = np.eye(n_half)
-        pos = self.estimator.state[:n_half]
-        r = np.linalg.norm(pos)
+            out: NDArray[np.float64] = (
+                self._x_pred[1] if np.may_share_memory(x, self._x_pred[0]) else self._x_pred[0]
+            )
+            np.multiply(vel, _dt, out=out[:n_half])
+            out[:n_half] += pos
+            np.multiply(accel, _dt, out=out[n_half:])
+            out[n_half:] += vel
+            return out
+
+        # Jacobian: F = [[I, dt*I], [d(accel)/d(pos), I]], filled in place. The
+        # EKF applies it densely: at these state sizes two matmuls beat a
+        # block-wise F P Fᵀ built from the identity and dt*I blocks
+        F = self._F_buf
+        daccel_block = F[n_half:, :n_half]
+        two_body_jacobian(self.estimator.state[:n_half], self.scenario.mu, out=daccel_block)
+        daccel_block *= dt
+        self.estimator.predict(f, F, dt)
 
-        if r > 1e-6:
-            mu = self.scenario.mu
-            r3 = r * r * r
-            r5 = r3 * r * r
-            daccel_dpos = -mu / r3 * I_half + 3 * mu / r5 * np.outer(pos, pos)
-        else:
-            daccel_dpos = np.zeros((n_half, n_half))
+    def _update_estimator_with_model(
+        self,
+        measurement: NDArray[np.float64],
+        dt: float,
+    ) -> None:
+        """Update EKF using measurement model."""
+        if self.estimator is None or self.measurement_model is None:
+            return
 
-        F = np.block([[I_half, dt * I_half], [dt * daccel_dpos, I_half]])
-        self.estimator.predict(f, F, dt)
+        self._predict_estimator(dt)
 
         # Update using measurement model
         def h(x: NDArray[np.float64]) -> NDArray[np.float64]:
@@ -182,77 +325,38 @@ class SimulationRunner:
 
         H = self.measurement_model.measurement_jacobian(self.estimator.state)
 
-        # Ensure measurement is column vector
-        if measurement.ndim == 1:
-            z = measurement.reshape(-1, 1)
-        else:
-            z = measurement
-
-        self.estimator.update(z, h, H)
+        self.estimator.update(measurement, h, H)
 
     def _update_estimator_legacy(
         self,
-        measurement: float,
+        measurement: NDArray[np.float64],
         dt: float,
     ) -> None:
-        """Update EKF with legacy acceleration magnitude measurement."""
+        """Update EKF with a legacy acceleration magnitude measurement, shape (1,)."""
         if self.estimator is None:
             return
 
-        n = len(self.estimator.state)
-        n_half = n // 2
-
-        # Prediction: constant velocity model with gravitational acceleration
-        def f(x: NDArray[np.float64], _dt: float) -> NDArray[np.float64]:
-            pos = x[:n_half]
-            vel = x[n_half:]
-            accel = total_acceleration(pos, self.scenario.mu)
-            new_pos = pos + vel * _dt
-            new_vel = vel + accel * _dt
-            return np.concatenate([new_pos, new_vel])
+        n_half = len(self.estimator.state) // 2
+        self._predict_estimator(dt)
 
-        # Jacobian: F = [[I, dt*I], [d(accel)/d(pos), I]]
-        I_half = np.eye(n_half)
-        pos = self.estimator.state[:n_half]
-        r = np.linalg.norm(pos)
-
-        if r > 1e-6:
-            mu = self.scenario.mu
-            r3 = r * r * r
-            r5 = r3 * r * r
-            daccel_dpos = -mu / r3 * I_half + 3 * mu / r5 * np.outer(pos, pos)
-        else:
-            daccel_dpos = np.zeros((n_half, n_half))
-
-        F = np.block([[I_half, dt * I_half], [dt * daccel_dpos, I_half]])
-        self.estimator.predict(f, F, dt)
-
-        # Update: measurement is acceleration magnitude
-        def h(x: NDArray[np.float64]) -> NDArray[np.float64]:
-            pos = x[:n_half]
-            accel = total_acceleration(pos, self.scenario.mu)
-            return np.array([np.linalg.norm(accel)])
-
-        # Jacobian of h
+        # Update: measurement is acceleration magnitude. The prediction and its
+        # Jacobian share one acceleration evaluation at the predicted state,
+        # which is also the state update() evaluates h at
         pos = self.estimator.state[:n_half]
         accel = total_acceleration(pos, self.scenario.mu)
-        accel_mag = np.linalg.norm(accel)
+        accel_mag = math.sqrt(accel @ accel)
+        z_pred = self._z_pred
+        z_pred[0] = accel_mag
 
-        if accel_mag > 1e-6:
-            r = np.linalg.norm(pos)
-            if r > 1e-6:
-                mu = self.scenario.mu
-                r3 = r * r * r
-                r5 = r3 * r * r
-                daccel_dpos = -mu / r3 * I_half + 3 * mu / r5 * np.outer(pos, pos)
-            else:
-                daccel_dpos = np.zeros((n_half, n_half))
+        def h(_x: NDArray[np.float64]) -> NDArray[np.float64]:
+            return z_pred
 
+        # H = [d|a|/d(pos), 0]: the velocity half of the template stays zero
+        H = self._H_buf
+        H[0, :n_half] = 0.0
+        if accel_mag > 1e-6:
+            daccel_dpos = two_body_jacobian(pos, self.scenario.mu)
             dnorm_daccel = accel / accel_mag
-            dnorm_dpos = dnorm_daccel @ daccel_dpos
-            H = np.concatenate([dnorm_dpos.reshape(1, -1), np.zeros((1, n_half))], axis=1)
-        else:
-            H = np.zeros((1, n))
+            np.matmul(dnorm_daccel, daccel_dpos, out=H[0, :n_half])
 
-        z = np.array([measurement])
-        self.estimator.update(z, h, H)
+        self.estimator.update(measurement, h, H)
@@ -38,6 +38,11 @@ class Scenario:
         self.dt = dt
         self.name = name
 
+    @property
+    def n_steps(self) -> int:
+        """Number of time steps."""
+        return int(self.duration / self.dt)
+
     def get_n_steps(self) -> int:
         """Get number of time steps."""
-        return int(self.duration / self.dt)
+        return self.n_steps
@@ -0,0 +1,87 @@
+"""Frame sinks: where SimulationRunner streams its histories."""
+
+from pathlib import Path
+from typing import Protocol
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class FrameSink(Protocol):
+    """
+    Destination for simulation histories written in row blocks.
+
+    open() receives the full shape of every history before the first write;
+    write() then delivers consecutive blocks of rows, so a sink never needs
+    the whole run in memory.
+    """
+
+    def open(self, shapes: dict[str, tuple[int, ...]]) -> None:
+        """Prepare storage for each named history of the given full shape."""
+        ...
+
+    def write(self, key: str, start: int, rows: NDArray[np.float64]) -> None:
+        """Store rows as history[key][start : start + len(rows)]."""
+        ...
+
+    def close(self) -> None:
+        """Flush and release storage once the run is complete."""
+        ...
+
+
+class InMemorySink:
+    """Sink holding every history as an in-memory array (the runner's default layout)."""
+
+    def __init__(self) -> None:
+        """Initialize an empty sink."""
+        self.arrays: dict[str, NDArray[np.float64]] = {}
+
+    def open(self, shapes: dict[str, tuple[int, ...]]) -> None:
+        """Allocate one array per history."""
+        self.arrays = {key: np.empty(shape) for key, shape in shapes.items()}
+
+    def write(self, key: str, start: int, rows: NDArray[np.float64]) -> None:
+        """Copy rows into the history array."""
+        self.arrays[key][start : start + len(rows)] = rows
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class NpyMemmapSink:
+    """
+    Sink writing each history to ``<directory>/<key>.npy`` through a memory map.
+
+    Rows go straight to the page cache, so runs whose covariance history
+    exceeds RAM stay bounded; the files load back with np.load(mmap_mode="r").
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            directory: Output directory (created if missing)
+        """
+        self.directory = Path(directory)
+        self.arrays: dict[str, np.memmap] = {}
+
+    def open(self, shapes: dict[str, tuple[int, ...]]) -> None:
+        """Create one .npy file per history."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.arrays = {
+            key: np.lib.format.open_memmap(
+                self.directory / f"{key}.npy", mode="w+", dtype=np.float64, shape=shape
+            )
+            for key, shape in shapes.items()
+        }
+
+    def write(self, key: str, start: int, rows: NDArray[np.float64]) -> None:
+        """Copy rows into the mapped file."""
+        self.arrays[key][start : start + len(rows)] = rows
+
+    def close(self) -> None:
+        """Flush every file and drop the maps."""
+        for array in self.arrays.values():
+            array.flush()
+        self.arrays = {}
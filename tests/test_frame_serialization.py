@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from outofthisworld.api_models import BodySnapshot, CraftSnapshot, Frame, SensorReading, frame_to_dict
+import numpy as np
+
+from outofthisworld.api_models import (
+    BodySnapshot,
+    CraftSnapshot,
+    Frame,
+    SensorReading,
+    euler_rpy_to_quat,
+    euler_rpy_to_quats,
+    frame_to_dict,
+)
 
 
 def test_frame_to_dict_shape():
@@ -44,3 +54,11 @@ def test_frame_to_dict_shape():
     assert craft["attitude_quat"] == [0.0, 0.0, 0.0, 1.0]
     assert craft["sensors"][0]["value"]["ax"] == 0.1
 
+
+def test_euler_rpy_to_quats_matches_single():
+    attitudes = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(8, 3))
+    quats = euler_rpy_to_quats(attitudes)
+
+    assert len(quats) == 8
+    for att, quat in zip(attitudes, quats, strict=True):
+        np.testing.assert_allclose(quat, euler_rpy_to_quat(att), rtol=0, atol=1e-15)
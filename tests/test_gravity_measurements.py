@@ -1,5 +1,7 @@
 """Tests for gravitational measurement models."""
 
+import math
+
 import numpy as np
 
 from outofthisworld.estimation.gravity_measurements import GravityMeasurementModel
@@ -7,6 +9,16 @@ from outofthisworld.estimation.measurement_types import MeasurementType
 from outofthisworld.physics.constants import J2_EARTH, M_EARTH, R_EARTH, G
 
 
+def _finite_difference_jacobian(
+    model: GravityMeasurementModel, state: np.ndarray, eps: float
+) -> np.ndarray:
+    """Central-difference Jacobian (m x n) from two batched predictions."""
+    steps = eps * np.eye(len(state))
+    h_plus = model.predict_measurement_batch(state + steps)
+    h_minus = model.predict_measurement_batch(state - steps)
+    return ((h_plus - h_minus) / (2 * eps)).T
+
+
 def test_gravity_magnitude_prediction() -> None:
     """Test gravity magnitude measurement prediction."""
     mu = G * M_EARTH
@@ -29,7 +41,7 @@ def test_gravity_magnitude_prediction() -> None:
     from outofthisworld.physics.orbital import total_acceleration
 
     true_accel = total_acceleration(position, mu)
-    expected = np.linalg.norm(true_accel)
+    expected = math.hypot(*true_accel)
     assert abs(measurement[0] - expected) < 1e-10
 
 
@@ -96,20 +108,9 @@ def test_measurement_jacobian_finite_difference() -> None:
     # Analytic Jacobian
     H_analytic = model.measurement_jacobian(state)
 
-    # Finite difference approximation
+    # Central differences, every state dimension perturbed in one batched call
     eps = 1e-6
-    n = len(state)
-    H_fd = np.zeros((2, n))
-
-    for i in range(n):
-        state_pert = state.copy()
-        state_pert[i] += eps
-        h_plus = model.predict_measurement(state_pert)
-
-        state_pert[i] -= 2 * eps
-        h_minus = model.predict_measurement(state_pert)
-
-        H_fd[:, i] = (h_plus - h_minus) / (2 * eps)
+    H_fd = _finite_difference_jacobian(model, state, eps)
 
     # Compare (allow some numerical error)
     assert np.allclose(H_analytic, H_fd, rtol=1e-4, atol=1e-6)
@@ -131,20 +132,9 @@ def test_measurement_jacobian_magnitude_finite_difference() -> None:
     # Analytic Jacobian
     H_analytic = model.measurement_jacobian(state)
 
-    # Finite difference approximation
+    # Central differences, every state dimension perturbed in one batched call
     eps = 1e-6
-    n = len(state)
-    H_fd = np.zeros((1, n))
-
-    for i in range(n):
-        state_pert = state.copy()
-        state_pert[i] += eps
-        h_plus = model.predict_measurement(state_pert)
-
-        state_pert[i] -= 2 * eps
-        h_minus = model.predict_measurement(state_pert)
-
-        H_fd[0, i] = (h_plus[0] - h_minus[0]) / (2 * eps)
+    H_fd = _finite_difference_jacobian(model, state, eps)
 
     # Compare (allow some numerical error)
     assert np.allclose(H_analytic, H_fd, rtol=1e-4, atol=1e-6)
@@ -210,3 +200,23 @@ def test_j2_regression() -> None:
 
     two_body = two_body_acceleration(position, mu)
     assert np.allclose(meas_no_j2, two_body, rtol=1e-10)
+
+
+def test_predict_measurement_batch_matches_single() -> None:
+    """Batched predictions should match predict_measurement row by row."""
+    mu = G * M_EARTH
+    rng = np.random.default_rng(5)
+    for measurement_type in (
+        MeasurementType.GRAVITY_MAGNITUDE,
+        MeasurementType.GRAVITY_VECTOR_INERTIAL,
+    ):
+        model = GravityMeasurementModel(
+            measurement_type=measurement_type, mu=mu, noise_std=1e-4, j2=J2_EARTH, r_eq=R_EARTH
+        )
+        for n_half in (2, 3):
+            states = np.hstack(
+                [rng.uniform(7e6, 4e7, (6, n_half)), rng.uniform(-7e3, 7e3, (6, n_half))]
+            )
+            batch = model.predict_measurement_batch(states)
+            single = np.array([model.predict_measurement(state) for state in states])
+            np.testing.assert_allclose(batch, single, rtol=1e-14)
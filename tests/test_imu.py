@@ -0,0 +1,31 @@
+"""Tests for scalar IMU sensor model."""
+
+import numpy as np
+
+from outofthisworld.sensors.imu import IMU
+
+
+class TestIMU:
+    """Tests for IMU."""
+
+    def test_measure_series_matches_loop(self) -> None:
+        """Vectorized series should reproduce per-step scalar measure() exactly."""
+        true_accel = np.linspace(9.0, 10.0, 40)
+        looped = IMU(seed=7)
+        batched = IMU(seed=7)
+
+        loop_results = [looped.measure(float(a), dt=0.5) for a in true_accel]
+        series = batched.measure_series(true_accel, dt=0.5)
+
+        np.testing.assert_array_equal(series, loop_results)
+        assert batched.get_bias() == looped.get_bias()
+
+    def test_measure_dispatches_to_typed_paths(self) -> None:
+        """measure() should match the scalar and array entry points."""
+        generic = IMU(seed=3)
+        typed = IMU(seed=3)
+
+        assert generic.measure(9.8, 0.5) == typed.measure_scalar(9.8, 0.5)
+        np.testing.assert_array_equal(
+            generic.measure(np.ones(3), 0.5), typed.measure_array(np.ones(3), 0.5)
+        )
@@ -116,6 +116,12 @@ class TestIMU6DOF:
         assert not np.allclose(meas_a, true_accel)
         assert not np.allclose(meas_w, true_omega)
 
+    def test_zero_dt_raises(self) -> None:
+        """A zero time step has no white-noise density and should not pass silently."""
+        imu = IMU6DOF(profile=CLASSICAL_IMU, seed=42)
+        with pytest.raises(ZeroDivisionError):
+            imu.measure(np.zeros(3), np.zeros(3), 0.0)
+
     def test_bias_drift(self) -> None:
         """Bias should change over time (random walk)."""
         imu = IMU6DOF(profile=CLASSICAL_IMU, seed=42)
@@ -157,19 +163,27 @@ class TestIMU6DOF:
         classical_imu = IMU6DOF(profile=CLASSICAL_IMU, seed=42)
         quantum_imu = IMU6DOF(profile=QUANTUM_IMU, seed=42)
 
-        classical_measurements = []
-        quantum_measurements = []
-
-        for _ in range(n_samples):
-            m, _ = classical_imu.measure(np.zeros(3), np.zeros(3), dt)
-            classical_measurements.append(m)
-
-        for _ in range(n_samples):
-            m, _ = quantum_imu.measure(np.zeros(3), np.zeros(3), dt)
-            quantum_measurements.append(m)
+        zeros = np.zeros((n_samples, 3))
+        classical_measurements, _ = classical_imu.measure_series(zeros, zeros, dt)
+        quantum_measurements, _ = quantum_imu.measure_series(zeros, zeros, dt)
 
         classical_std = np.std(classical_measurements)
         quantum_std = np.std(quantum_measurements)
 
         # Quantum should have lower std (less noise)
         assert quantum_std < classical_std
+
+    def test_measure_series_matches_loop(self) -> None:
+        """Vectorized series should reproduce per-step measure() exactly."""
+        rng = np.random.default_rng(0)
+        true_accel = rng.normal(0.0, 1.0, size=(50, 3))
+        true_omega = rng.normal(0.0, 1e-3, size=(50, 3))
+        looped = IMU6DOF(profile=CLASSICAL_IMU, seed=42)
+        batched = IMU6DOF(profile=CLASSICAL_IMU, seed=42)
+
+        loop_results = [looped.measure(a, w, 0.1) for a, w in zip(true_accel, true_omega)]
+        series_accel, series_omega = batched.measure_series(true_accel, true_omega, 0.1)
+
+        np.testing.assert_array_equal(series_accel, [a for a, _ in loop_results])
+        np.testing.assert_array_equal(series_omega, [w for _, w in loop_results])
+        np.testing.assert_array_equal(batched.get_gyro_bias(), looped.get_gyro_bias())
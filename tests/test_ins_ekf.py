@@ -3,9 +3,13 @@
 import numpy as np
 import pytest
 
+from outofthisworld.estimation import ins_ekf
 from outofthisworld.estimation.ins_ekf import (
     INSEKF,
+    VEL_IDX,
+    INSEKFBatch,
     INSState,
+    _cholesky_gain3,
     create_default_initial_covariance,
     rotation_matrix,
     skew,
@@ -33,6 +37,17 @@ class TestHelperFunctions:
 
         np.testing.assert_array_almost_equal(cross_direct, cross_skew)
 
+    def test_cholesky_gain_matches_solve(self) -> None:
+        """Closed-form 3x3 Cholesky gain should match a LAPACK solve on a strided P Hᵀ."""
+        A = np.random.default_rng(2).normal(size=(15, 15))
+        P = A @ A.T
+        PHt = P[:, 6:9]
+        S = PHt[6:9] + np.eye(3) * 1e-6
+
+        K = _cholesky_gain3(S, PHt, np.empty((15, 3)))
+
+        np.testing.assert_allclose(K, np.linalg.solve(S, PHt.T).T, rtol=1e-10, atol=1e-12)
+
     def test_rotation_matrix_identity(self) -> None:
         """Zero rotation should give identity matrix."""
         R = rotation_matrix(np.zeros(3))
@@ -46,6 +61,27 @@ class TestHelperFunctions:
         np.testing.assert_array_almost_equal(R @ R.T, np.eye(3))
         np.testing.assert_almost_equal(np.linalg.det(R), 1.0)
 
+    def test_rotation_matrix_small_angle_matches_rodrigues(self) -> None:
+        """Small-angle series should match the exact Rodrigues formula."""
+        for scale in (1e-6, 1e-3, 0.099):
+            theta = np.array([0.3, -0.5, 0.8]) * scale / np.linalg.norm([0.3, -0.5, 0.8])
+            angle = np.linalg.norm(theta)
+            K = skew(theta / angle)
+            expected = np.eye(3) + np.sin(angle) * K + (1 - np.cos(angle)) * (K @ K)
+
+            np.testing.assert_allclose(rotation_matrix(theta), expected, rtol=0, atol=1e-10)
+
+    def test_rotation_matrix_matches_skew_form_at_large_angles(self) -> None:
+        """Scalar-built matrix should equal I + a[θ×] + b[θ×]² beyond the series range."""
+        for theta in (np.array([0.4, -1.1, 0.7]), np.array([0.0, 0.0, 3.0])):
+            angle = np.linalg.norm(theta)
+            K = skew(theta)
+            a = np.sin(angle) / angle
+            b = (1 - np.cos(angle)) / angle**2
+            expected = np.eye(3) + a * K + b * (K @ K)
+
+            np.testing.assert_allclose(rotation_matrix(theta), expected, rtol=0, atol=1e-14)
+
 
 class TestINSState:
     """Tests for INS state container."""
@@ -65,6 +101,22 @@ class TestINSState:
         np.testing.assert_array_equal(vec[:3], [1.0, 2.0, 3.0])
         np.testing.assert_array_equal(vec[3:6], [4.0, 5.0, 6.0])
 
+    def test_to_vector_into_buffer(self) -> None:
+        """to_vector(out=...) should fill and return the given buffer."""
+        state = INSState(
+            position=np.array([1.0, 2.0, 3.0]),
+            velocity=np.array([4.0, 5.0, 6.0]),
+            attitude=np.array([0.1, 0.2, 0.3]),
+            accel_bias=np.array([1e-3, 2e-3, 3e-3]),
+            gyro_bias=np.array([1e-4, 2e-4, 3e-4]),
+        )
+        history = np.zeros((2, 15))
+
+        vec = state.to_vector(out=history[1])
+
+        assert np.shares_memory(vec, history)
+        np.testing.assert_array_equal(history[1], state.to_vector())
+
     def test_from_vector(self) -> None:
         """State should be reconstructable from vector."""
         original = INSState(
@@ -81,6 +133,27 @@ class TestINSState:
         np.testing.assert_array_equal(reconstructed.position, original.position)
         np.testing.assert_array_equal(reconstructed.velocity, original.velocity)
 
+    def test_fields_are_views_of_one_buffer(self) -> None:
+        """Fields should read and write slices of the single state buffer."""
+        state = INSState(
+            position=np.array([1.0, 2.0, 3.0]),
+            velocity=np.array([4.0, 5.0, 6.0]),
+            attitude=np.array([0.1, 0.2, 0.3]),
+            accel_bias=np.array([1e-3, 2e-3, 3e-3]),
+            gyro_bias=np.array([1e-4, 2e-4, 3e-4]),
+        )
+
+        assert np.shares_memory(state.position, state.vector)
+        assert np.shares_memory(state.gyro_bias, state.vector)
+        state.velocity = np.array([7.0, 8.0, 9.0])
+        np.testing.assert_array_equal(state.vector[VEL_IDX], [7.0, 8.0, 9.0])
+
+        vec = state.to_vector()
+        reconstructed = INSState.from_vector(vec)
+        vec[:] = 0.0
+        assert not np.shares_memory(reconstructed.vector, vec)
+        np.testing.assert_array_equal(reconstructed.velocity, [7.0, 8.0, 9.0])
+
 
 class TestINSEKF:
     """Tests for INS EKF."""
@@ -148,6 +221,62 @@ class TestINSEKF:
 
         assert att_var_after < att_var_before
 
+    @pytest.mark.parametrize(
+        ("method", "start", "noise_var"),
+        [("update_attitude", 6, 1e-9), ("update_position", 0, 1e-2)],
+    )
+    def test_update_matches_dense_kalman_form(
+        self, method: str, start: int, noise_var: float
+    ) -> None:
+        """Block-sliced updates should match the textbook H/inverse formulation."""
+        state = INSState(
+            position=np.zeros(3),
+            velocity=np.zeros(3),
+            attitude=np.array([1e-3, -2e-3, 5e-4]),
+            accel_bias=np.zeros(3),
+            gyro_bias=np.zeros(3),
+        )
+        ekf = INSEKF(state, create_default_initial_covariance(), CLASSICAL_IMU)
+        for _ in range(5):
+            ekf.predict(np.array([0.1, 0.0, 0.0]), np.array([1e-5, 0.0, 0.0]), dt=1.0)
+        x0 = ekf.get_state_vector()
+        P = ekf.covariance.copy()
+        R = np.eye(3) * noise_var
+        meas = np.array([2e-3, 0.0, -1e-3])
+
+        H = np.zeros((3, 15))
+        H[:, start : start + 3] = np.eye(3)
+        K = P @ H.T @ np.linalg.inv(H @ P @ H.T + R)
+        I_KH = np.eye(15) - K @ H
+        P_expected = I_KH @ P @ I_KH.T + K @ R @ K.T
+        x_expected = x0 + K @ (meas - x0[start : start + 3])
+
+        getattr(ekf, method)(meas, R)
+
+        np.testing.assert_allclose(ekf.get_state_vector(), x_expected, rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(
+            ekf.covariance, 0.5 * (P_expected + P_expected.T), rtol=1e-9, atol=1e-18
+        )
+
+    def test_get_sigmas_matches_per_block_getters(self) -> None:
+        """get_sigmas should agree with the position/velocity/attitude getters."""
+        state = INSState(
+            position=np.zeros(3),
+            velocity=np.zeros(3),
+            attitude=np.zeros(3),
+            accel_bias=np.zeros(3),
+            gyro_bias=np.zeros(3),
+        )
+        ekf = INSEKF(state, create_default_initial_covariance(), CLASSICAL_IMU)
+        ekf.predict(np.array([0.1, 0.0, 0.0]), np.zeros(3), dt=1.0)
+
+        sigmas = ekf.get_sigmas()
+
+        assert sigmas.shape == (15,)
+        np.testing.assert_array_equal(sigmas[0:3], ekf.get_position_uncertainty())
+        np.testing.assert_array_equal(sigmas[3:6], ekf.get_velocity_uncertainty())
+        np.testing.assert_array_equal(sigmas[6:9], ekf.get_attitude_uncertainty())
+
     def test_covariance_stays_symmetric(self) -> None:
         """Covariance should remain symmetric after operations."""
         state = INSState(
@@ -161,10 +290,11 @@ class TestINSEKF:
         ekf = INSEKF(state, P0, CLASSICAL_IMU)
 
         # Multiple predict/update cycles
+        R = np.eye(3) * 1e-6
         for i in range(10):
             ekf.predict(np.random.randn(3) * 1e-5, np.random.randn(3) * 1e-6, dt=1.0)
             if i % 3 == 0:
-                ekf.update_attitude(np.zeros(3), np.eye(3) * 1e-6)
+                ekf.update_attitude(np.zeros(3), R)
 
         # Check symmetry
         np.testing.assert_array_almost_equal(ekf.covariance, ekf.covariance.T)
@@ -202,6 +332,115 @@ class TestINSEKF:
 
         assert ekf.state.position[0] > 0
 
+    def test_float32_covariance_storage(self) -> None:
+        """float32 storage should track the float64 filter closely."""
+        P0 = create_default_initial_covariance()
+        filters = []
+        for dtype in (np.float64, np.float32):
+            state = INSState(
+                position=np.zeros(3),
+                velocity=np.zeros(3),
+                attitude=np.zeros(3),
+                accel_bias=np.zeros(3),
+                gyro_bias=np.zeros(3),
+            )
+            filters.append(INSEKF(state, P0, CLASSICAL_IMU, dtype=dtype))
+
+        R = np.eye(3) * 1e-8
+        for ekf in filters:
+            for i in range(20):
+                ekf.predict(np.array([0.1, 0.0, 0.0]), np.zeros(3), dt=1.0)
+                if i % 5 == 0:
+                    ekf.update_attitude(np.zeros(3), R)
+
+        ekf64, ekf32 = filters
+        assert ekf32.covariance.dtype == np.float32
+        np.testing.assert_allclose(
+            ekf32.get_position_uncertainty(), ekf64.get_position_uncertainty(), rtol=1e-4
+        )
+
+    def test_compiled_predict_matches_numpy_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The numba predict kernel should reproduce the NumPy mechanization."""
+        filters = []
+        for _ in range(2):
+            state = INSState(
+                position=np.array([1.0, -2.0, 3.0]),
+                velocity=np.array([10.0, 0.0, -1.0]),
+                attitude=np.array([0.2, -0.1, 0.3]),  # Above the small-angle threshold
+                accel_bias=np.array([1e-4, 0.0, -2e-4]),
+                gyro_bias=np.array([0.0, 1e-5, 0.0]),
+            )
+            filters.append(INSEKF(state, create_default_initial_covariance(), CLASSICAL_IMU))
+        compiled, reference = filters
+
+        rng = np.random.default_rng(4)
+        for _ in range(20):
+            accel = rng.normal(0.0, 1.0, size=3)
+            omega = rng.normal(0.0, 1e-2, size=3)
+            compiled.predict(accel, omega, dt=0.5)
+            with monkeypatch.context() as m:
+                m.setattr(ins_ekf, "HAS_NUMBA", False)
+                reference.predict(accel, omega, dt=0.5)
+
+        np.testing.assert_allclose(
+            compiled.get_state_vector(), reference.get_state_vector(), rtol=1e-12
+        )
+        np.testing.assert_allclose(compiled.covariance, reference.covariance, rtol=1e-10)
+        np.testing.assert_array_equal(compiled.covariance, compiled.covariance.T)
+
+    def test_predict_respecializes_on_dt_change(self) -> None:
+        """Changing dt mid-run should match a filter that has only seen the new dt."""
+        state = INSState(
+            position=np.zeros(3),
+            velocity=np.zeros(3),
+            attitude=np.array([0.01, -0.02, 0.03]),
+            accel_bias=np.zeros(3),
+            gyro_bias=np.zeros(3),
+        )
+        P0 = create_default_initial_covariance()
+        accel = np.array([0.1, 0.0, 0.0])
+        ekf = INSEKF(INSState.from_vector(state.to_vector()), P0, CLASSICAL_IMU)
+        ekf.predict(accel, np.zeros(3), dt=1.0)
+
+        fresh = INSEKF(INSState.from_vector(ekf.get_state_vector()), ekf.covariance, CLASSICAL_IMU)
+        ekf.predict(accel, np.zeros(3), dt=0.5)
+        fresh.predict(accel, np.zeros(3), dt=0.5)
+
+        np.testing.assert_array_equal(ekf.covariance, fresh.covariance)
+
+
+class TestINSEKFBatch:
+    """Tests for batched INS EKF bank."""
+
+    def test_matches_individual_filters(self) -> None:
+        """Each filter in the bank should match a standalone INSEKF."""
+        state = INSState(
+            position=np.zeros(3),
+            velocity=np.array([10.0, 0.0, 0.0]),
+            attitude=np.array([0.01, -0.02, 0.03]),
+            accel_bias=np.zeros(3),
+            gyro_bias=np.zeros(3),
+        )
+        P0 = create_default_initial_covariance()
+        bank = INSEKFBatch(state, P0, CLASSICAL_IMU, n_filters=2)
+        single = INSEKF(INSState.from_vector(state.to_vector()), P0, CLASSICAL_IMU)
+
+        rng = np.random.default_rng(0)
+        R = np.eye(3) * 1e-8
+        for i in range(10):
+            accel = rng.normal(0.0, 1e-3, size=3) + np.array([0.1, 0.0, 0.0])
+            omega = rng.normal(0.0, 1e-5, size=3)
+            bank.predict(accel, omega, dt=1.0)
+            single.predict(accel, omega, dt=1.0)
+            if i % 3 == 0:
+                # Only filter 0 receives updates
+                bank.update_attitude(np.zeros((2, 3)), R, mask=np.array([True, False]))
+                single.update_attitude(np.zeros(3), R)
+
+        np.testing.assert_allclose(bank.state[0], single.get_state_vector(), rtol=1e-10)
+        np.testing.assert_allclose(bank.covariance[0], single.covariance, rtol=1e-10)
+        assert np.trace(bank.covariance[1]) > np.trace(bank.covariance[0])
+
 
 class TestDefaultCovariance:
     """Tests for default covariance creation."""
@@ -219,8 +458,11 @@ class TestDefaultCovariance:
     def test_positive_definite(self) -> None:
         """Should be positive definite."""
         P = create_default_initial_covariance()
-        eigenvalues = np.linalg.eigvalsh(P)
-        assert np.all(eigenvalues > 0)
+        # Cholesky succeeds iff P is positive definite, without an eigensolve
+        try:
+            np.linalg.cholesky(P)
+        except np.linalg.LinAlgError:
+            pytest.fail("Default covariance is not positive definite")
 
     def test_custom_values(self) -> None:
         """Should accept custom sigma values."""
@@ -1,10 +1,20 @@
 """Integration tests for navigation experiments."""
 
+import dataclasses
+import threading
+
 import numpy as np
 import pytest
 
+from outofthisworld.estimation.ins_ekf import rotation_matrix
 from outofthisworld.sensors.imu_profiles import CLASSICAL_IMU, QUANTUM_IMU
 from outofthisworld.sim.experiments import (
+    ExperimentResults,
+    _precompute_truth_and_imu,
+    _run_experiment,
+    _run_experiment_batch,
+    _update_schedule,
+    _updates_config,
     run_cadence_sweep,
     run_coast_scenario,
     run_updates_scenario,
@@ -77,6 +87,68 @@ class TestCoastScenario:
             results2.pos_error,
         )
 
+    def test_error_norms_match_linalg(self) -> None:
+        """Cached per-step norms should agree with np.linalg.norm."""
+        results = run_coast_scenario(imu_profile=CLASSICAL_IMU, duration_s=60.0, seed=3)
+
+        for name in ("pos_error", "vel_error", "pos_sigma", "vel_sigma"):
+            np.testing.assert_allclose(
+                getattr(results, f"{name}_norm"),
+                np.linalg.norm(getattr(results, name), axis=1),
+                rtol=1e-15,
+            )
+        assert results.pos_error_norm is results.pos_error_norm
+        assert results.get_max_pos_error() == results.pos_error_norm.max()
+        assert results.to_dict()["pos_error_norm_m"] == results.pos_error_norm.tolist()
+
+    def test_truth_rotates_thrust_by_constant_attitude(self) -> None:
+        """Hoisted nav-frame thrust should use the (constant) true attitude."""
+        attitude = np.array([0.02, -0.4, 1.1])
+        config = dataclasses.replace(
+            _updates_config(CLASSICAL_IMU, 60.0, 20.0, 0.5, 1), initial_attitude=attitude
+        )
+        streams = _precompute_truth_and_imu(config)
+
+        accel_nav = rotation_matrix(attitude) @ np.array([0.1, 0.0, 0.0])
+        np.testing.assert_allclose(
+            np.diff(streams.true_velocity, axis=0), np.tile(accel_nav * 0.5, (40, 1)), atol=1e-10
+        )
+        np.testing.assert_array_equal(streams.true_attitude, np.tile(attitude, (41, 1)))
+
+    @pytest.mark.parametrize("batch", [False, True])
+    def test_float32_history_storage(self, batch: bool) -> None:
+        """float32 histories should be the float64 results rounded once; time stays float64."""
+        config = _updates_config(CLASSICAL_IMU, 60.0, 600.0, 1.0, 3)  # spans several blocks
+        compact_config = dataclasses.replace(config, history_dtype="float32")
+        if batch:
+            (results,) = _run_experiment_batch([config])
+            (compact,) = _run_experiment_batch([compact_config])
+        else:
+            results = _run_experiment(config)
+            compact = _run_experiment(compact_config)
+
+        assert compact.time.dtype == np.float64
+        for f in dataclasses.fields(ExperimentResults):
+            value = getattr(results, f.name)
+            if f.name == "time" or not isinstance(value, np.ndarray):
+                continue
+            assert value.dtype == np.float64
+            assert getattr(compact, f.name).dtype == np.float32
+            np.testing.assert_array_equal(getattr(compact, f.name), value.astype(np.float32))
+
+    def test_truth_follows_constant_thrust(self) -> None:
+        """True trajectory should match the closed form of the Euler recurrence."""
+        results = run_coast_scenario(imu_profile=CLASSICAL_IMU, duration_s=100.0, dt=0.5, seed=1)
+
+        n = np.arange(len(results.time))
+        dt = 0.5
+        accel = 0.1  # Body-frame thrust with zero attitude
+        np.testing.assert_allclose(results.true_velocity[:, 0], 1000.0 + accel * dt * n)
+        np.testing.assert_allclose(
+            results.true_position[:, 0], 1000.0 * dt * n + accel * dt * dt * n * (n + 1) / 2
+        )
+        np.testing.assert_array_equal(results.true_position[:, 1:], 0.0)
+
 
 class TestUpdatesScenario:
     """Integration tests for scenario with star tracker updates."""
@@ -132,6 +204,19 @@ class TestUpdatesScenario:
         # Faster cadence should result in more updates
         assert fast.n_updates > slow.n_updates
 
+    def test_update_schedule_matches_cadence_check(self) -> None:
+        """Precomputed schedule should reproduce the per-step cadence check."""
+        dt = 0.1
+        time_hist = np.arange(601, dtype=np.float64) * dt
+        for interval in (0.3, 1.0, 7.0, float("inf")):
+            expected = []
+            last = 0.0
+            for t in time_hist[1:]:
+                due = (t - last) >= interval
+                expected.append(due)
+                last = t if due else last
+            np.testing.assert_array_equal(_update_schedule(time_hist, interval), expected)
+
 
 class TestCadenceSweep:
     """Integration tests for cadence sweep."""
@@ -161,39 +246,92 @@ class TestCadenceSweep:
         # Error should generally increase (allow some tolerance for stochastic effects)
         assert errors[-1] > errors[0]
 
-
-class TestErrorBounds:
-    """Tests to verify error stays within reasonable bounds."""
-
-    def test_classical_coast_error_bounded(self) -> None:
-        """Classical coast error should be within expected range."""
-        results = run_coast_scenario(
+    def test_sweep_matches_individual_runs(self) -> None:
+        """Batched sweep should reproduce standalone updates scenarios."""
+        results = run_cadence_sweep(
             imu_profile=CLASSICAL_IMU,
-            duration_s=3600.0,  # 1 hour
-            dt=1.0,
+            intervals=[10.0, 60.0],
+            duration_s=120.0,
             seed=42,
         )
 
-        final_error = results.get_final_pos_error_rms()
+        for result in results:
+            single = run_updates_scenario(
+                imu_profile=CLASSICAL_IMU,
+                update_interval=result.config.star_tracker_interval,
+                duration_s=120.0,
+                seed=42,
+            )
+            assert result.n_updates == single.n_updates
+            np.testing.assert_allclose(result.pos_error, single.pos_error, rtol=1e-9, atol=1e-9)
+            np.testing.assert_allclose(result.att_sigma, single.att_sigma, rtol=1e-9)
+
+    @pytest.mark.parametrize("max_workers", [2, None])
+    def test_sweep_workers_match_serial(
+        self, max_workers: int | None, recwarn: pytest.WarningsRecorder
+    ) -> None:
+        """Splitting the sweep across spawned workers should not change results (or fork)."""
+        kwargs = {"intervals": [10.0, 30.0, 60.0], "duration_s": 120.0, "seed": 42}
+        serial = run_cadence_sweep(imu_profile=CLASSICAL_IMU, **kwargs)
+
+        # A live thread, like numba/BLAS pools, makes os.fork() warn about deadlocks
+        release = threading.Event()
+        helper = threading.Thread(target=release.wait)
+        helper.start()
+        try:
+            parallel = run_cadence_sweep(
+                imu_profile=CLASSICAL_IMU, max_workers=max_workers, **kwargs
+            )
+        finally:
+            release.set()
+            helper.join()
+        assert not [w for w in recwarn if "fork()" in str(w.message)]
+
+        assert [r.config.star_tracker_interval for r in parallel] == kwargs["intervals"]
+        for a, b in zip(serial, parallel, strict=True):
+            assert a.n_updates == b.n_updates
+            np.testing.assert_array_equal(a.pos_error, b.pos_error)
+            np.testing.assert_array_equal(a.att_sigma, b.att_sigma)
+
+
+@pytest.fixture(scope="module")
+def coast_1h() -> dict[str, ExperimentResults]:
+    """One-hour coast runs per IMU profile, shared by the error-bound tests."""
+    return {
+        profile.name: run_coast_scenario(imu_profile=profile, duration_s=3600.0, dt=1.0, seed=42)
+        for profile in (CLASSICAL_IMU, QUANTUM_IMU)
+    }
 
-        # Classical IMU over 1 hour should have km-scale errors
-        # but shouldn't be astronomically large
-        assert final_error > 100  # At least 100 m error expected
-        assert final_error < 1e8  # Sanity check: less than 100,000 km
 
-    def test_quantum_coast_error_bounded(self) -> None:
-        """Quantum coast error should be much smaller than classical."""
-        classical = run_coast_scenario(
-            imu_profile=CLASSICAL_IMU,
-            duration_s=3600.0,
-            seed=42,
-        )
+class TestErrorBounds:
+    """Tests to verify error stays within reasonable bounds."""
 
-        quantum = run_coast_scenario(
-            imu_profile=QUANTUM_IMU,
-            duration_s=3600.0,
-            seed=42,
-        )
+    @pytest.mark.parametrize(
+        ("profile_name", "min_error", "max_error"),
+        [
+            # Classical IMU over 1 hour should have km-scale errors
+            # but shouldn't be astronomically large
+            (CLASSICAL_IMU.name, 100.0, 1e8),
+            (QUANTUM_IMU.name, 1.0, 1e7),
+        ],
+    )
+    def test_coast_error_bounded(
+        self,
+        coast_1h: dict[str, ExperimentResults],
+        profile_name: str,
+        min_error: float,
+        max_error: float,
+    ) -> None:
+        """Coast error after one hour should be within the profile's expected range."""
+        final_error = coast_1h[profile_name].get_final_pos_error_rms()
+
+        assert final_error > min_error
+        assert final_error < max_error
+
+    def test_quantum_coast_error_smaller(self, coast_1h: dict[str, ExperimentResults]) -> None:
+        """Quantum coast error should be much smaller than classical."""
+        classical = coast_1h[CLASSICAL_IMU.name]
+        quantum = coast_1h[QUANTUM_IMU.name]
 
         # Quantum should be significantly better (at least 10x)
         ratio = classical.get_final_pos_error_rms() / quantum.get_final_pos_error_rms()
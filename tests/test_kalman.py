@@ -84,3 +84,39 @@ def test_ekf_predict() -> None:
 
     # State should update (position changes due to velocity)
     assert not np.allclose(ekf.state, x0)
+
+
+def test_ekf_update_accepts_flat_and_column_measurements() -> None:
+    """1-D and column measurements should give the same 1-D state update."""
+    x0 = np.array([1.0, 2.0])
+    P0 = np.eye(2)
+    Q = 0.1 * np.eye(2)
+    R = 0.5 * np.eye(2)
+    H = np.array([[1.0, 0.0], [0.5, 1.0]])
+
+    def h(x: np.ndarray) -> np.ndarray:
+        return H @ x
+
+    flat = ExtendedKalmanFilter(x0, P0, Q, R)
+    flat.update(np.array([1.5, 2.0]), h, H)
+    column = ExtendedKalmanFilter(x0, P0, Q, R)
+    column.update(np.array([[1.5], [2.0]]), h, H)
+
+    assert flat.state.shape == (2,)
+    np.testing.assert_array_equal(flat.state, column.state)
+    np.testing.assert_array_equal(flat.covariance, column.covariance)
+    assert flat.state[0] > x0[0]
+
+
+def test_ekf_update_keeps_covariance_symmetric() -> None:
+    """Repeated updates should leave the covariance exactly symmetric."""
+    rng = np.random.default_rng(5)
+    A = rng.normal(size=(4, 4))
+    ekf = ExtendedKalmanFilter(np.zeros(4), A @ A.T + np.eye(4), np.eye(4), 0.3 * np.eye(2))
+    H = rng.normal(size=(2, 4))
+
+    for _ in range(20):
+        ekf.update(rng.normal(size=2), lambda x: H @ x, H)
+
+    np.testing.assert_array_equal(ekf.covariance, ekf.covariance.T)
+    np.linalg.cholesky(ekf.covariance)
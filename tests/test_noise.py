@@ -1,8 +1,14 @@
 """Tests for noise generators."""
 
 import numpy as np
+import pytest
 
-from outofthisworld.sensors.noise import generate_random_walk, generate_white_noise
+from outofthisworld.sensors.noise import (
+    generate_random_walk,
+    generate_white_noise,
+    make_rng,
+    spawn_rngs,
+)
 
 
 def test_white_noise_shape() -> None:
@@ -18,6 +24,14 @@ def test_white_noise_statistics() -> None:
     assert abs(std - 2.0) < 0.1  # Allow some variance
 
 
+def test_white_noise_matches_seeded_normal() -> None:
+    """In-place fill should reproduce the seeded rng.normal stream."""
+    np.testing.assert_array_equal(
+        generate_white_noise((4, 3), 0.5, seed=11),
+        np.random.default_rng(11).normal(0.0, 0.5, size=(4, 3)),
+    )
+
+
 def test_random_walk_length() -> None:
     """Test random walk has correct length."""
     walk = generate_random_walk(100, 0.1, seed=42)
@@ -35,3 +49,33 @@ def test_random_walk_drift() -> None:
     walk = generate_random_walk(1000, 0.1, seed=42)
     # Random walk should drift away from zero
     assert abs(walk[-1]) > 0.01  # Very likely to be non-zero
+
+
+def test_random_walk_increments_match_steps() -> None:
+    """Increments should be the seeded step draws after the first."""
+    walk = generate_random_walk(50, 0.1, initial_value=2.0, seed=7)
+    steps = np.random.default_rng(7).normal(0.0, 0.1, size=50)
+
+    np.testing.assert_allclose(np.diff(walk), steps[1:], rtol=0, atol=1e-12)
+
+
+def test_make_rng_pcg64_matches_default_rng() -> None:
+    """The default bit generator should reproduce np.random.default_rng streams."""
+    np.testing.assert_array_equal(
+        make_rng(42).standard_normal(8),
+        np.random.default_rng(42).standard_normal(8),
+    )
+
+
+def test_make_rng_invalid_bit_generator() -> None:
+    """Unknown bit generator names should raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown bit generator"):
+        make_rng(42, "mt19937")  # type: ignore[arg-type]
+
+
+def test_spawn_rngs_independent_and_reproducible() -> None:
+    """Spawned streams should differ from each other and repeat for a seed."""
+    first = [rng.standard_normal(4) for rng in spawn_rngs(7, 3, "sfc64")]
+    second = [rng.standard_normal(4) for rng in spawn_rngs(7, 3, "sfc64")]
+    np.testing.assert_array_equal(first, second)
+    assert not np.array_equal(first[0], first[1])
@@ -3,8 +3,22 @@
 import numpy as np
 import pytest
 
-from outofthisworld.physics.constants import M_EARTH, R_EARTH, G
-from outofthisworld.physics.orbital import propagate_orbit, two_body_acceleration
+from outofthisworld.physics.constants import J2_EARTH, M_EARTH, R_EARTH, G
+from outofthisworld.physics.orbital import (
+    IntegrationMethod,
+    _euler_step,
+    _rk4_step,
+    propagate_many_orbits,
+    propagate_orbit,
+    propagate_orbit_adaptive,
+    propagate_orbit_batch,
+    propagate_trajectory,
+    propagate_trajectory_batch,
+    total_acceleration,
+    total_acceleration_batch,
+    two_body_acceleration,
+    two_body_jacobian,
+)
 
 
 def test_two_body_acceleration_magnitude() -> None:
@@ -31,6 +45,40 @@ def test_two_body_acceleration_direction() -> None:
     assert dot_product < 0
 
 
+def test_two_body_jacobian_matches_finite_difference() -> None:
+    """Gravity gradient should match central differences of the acceleration."""
+    position = np.array([7.0e6, -1.2e6, 2.5e6])
+    mu = G * M_EARTH
+    step = 1.0
+    numeric = np.column_stack(
+        [
+            (
+                two_body_acceleration(position + step * e, mu)
+                - two_body_acceleration(position - step * e, mu)
+            )
+            / (2 * step)
+            for e in np.eye(3)
+        ]
+    )
+    np.testing.assert_allclose(two_body_jacobian(position, mu), numeric, rtol=1e-6, atol=1e-14)
+    np.testing.assert_array_equal(two_body_jacobian(np.zeros(2), mu), np.zeros((2, 2)))
+
+
+def test_two_body_jacobian_writes_into_view() -> None:
+    """Passing out should fill a strided view with the same values."""
+    position = np.array([7.0e6, -1.2e6, 2.5e6])
+    mu = G * M_EARTH
+    block = np.full((6, 6), np.nan)
+
+    result = two_body_jacobian(position, mu, out=block[3:, :3])
+
+    assert np.shares_memory(result, block)
+    np.testing.assert_array_equal(block[3:, :3], two_body_jacobian(position, mu))
+    assert np.isnan(block[:3]).all()
+    two_body_jacobian(np.zeros(3), mu, out=block[3:, :3])
+    np.testing.assert_array_equal(block[3:, :3], 0.0)
+
+
 def test_two_body_acceleration_zero_position() -> None:
     """Test acceleration handles zero position gracefully."""
     position = np.array([0.0, 0.0, 0.0])
@@ -39,6 +87,15 @@ def test_two_body_acceleration_zero_position() -> None:
     assert np.allclose(accel, 0.0)
 
 
+def test_two_body_acceleration_2d() -> None:
+    """2D positions should give 2D accelerations, including at the origin."""
+    mu = G * M_EARTH
+    accel = two_body_acceleration(np.array([7e6, 0.0]), mu)
+
+    np.testing.assert_allclose(accel, [-mu / 7e6**2, 0.0], rtol=1e-14)
+    assert two_body_acceleration(np.zeros(2), mu).shape == (2,)
+
+
 def test_propagate_orbit_conserves_energy() -> None:
     """Test orbit propagation approximately conserves energy."""
     # Circular orbit
@@ -56,10 +113,7 @@ def test_propagate_orbit_conserves_energy() -> None:
     dt = T / 100  # Small steps
     n_steps = 100
 
-    pos = position.copy()
-    vel = velocity.copy()
-    for _ in range(n_steps):
-        pos, vel = propagate_orbit(pos, vel, mu, dt, method="rk4")
+    pos, vel = propagate_orbit(position, velocity, mu, dt, method="rk4", n_steps=n_steps)
 
     # Final energy
     Ef = 0.5 * np.dot(vel, vel) - mu / np.linalg.norm(pos)
@@ -68,6 +122,27 @@ def test_propagate_orbit_conserves_energy() -> None:
     assert abs(Ef - E0) / abs(E0) < 0.01
 
 
+@pytest.mark.parametrize("method", ["euler", "rk4", "saba2"])
+@pytest.mark.parametrize("n_dim", [2, 3])
+def test_propagate_orbit_n_steps_matches_stepping(method: str, n_dim: int) -> None:
+    """n_steps should give the same state as calling propagate_orbit in a loop."""
+    position = np.array([7e6, -1.2e6, 3.4e5])[:n_dim]
+    velocity = np.array([1.1e3, 7.4e3, -2.0e2])[:n_dim]
+    mu = G * M_EARTH
+
+    pos, vel = propagate_orbit(
+        position, velocity, mu, 10.0, method=method, j2=J2_EARTH, r_eq=R_EARTH, n_steps=20
+    )
+
+    expected_pos, expected_vel = position, velocity
+    for _ in range(20):
+        expected_pos, expected_vel = propagate_orbit(
+            expected_pos, expected_vel, mu, 10.0, method=method, j2=J2_EARTH, r_eq=R_EARTH
+        )
+    np.testing.assert_array_equal(pos, expected_pos)
+    np.testing.assert_array_equal(vel, expected_vel)
+
+
 def test_propagate_orbit_invalid_method() -> None:
     """Test propagate_orbit raises error for invalid method."""
     position = np.array([7e6, 0.0, 0.0])
@@ -76,3 +151,235 @@ def test_propagate_orbit_invalid_method() -> None:
 
     with pytest.raises(ValueError, match="Unknown integration method"):
         propagate_orbit(position, velocity, mu, 1.0, method="invalid")
+
+
+@pytest.mark.parametrize("method", ["euler", "rk4"])
+@pytest.mark.parametrize("j2", [None, 0.0, J2_EARTH])
+def test_scalar_step_matches_array_path(method: str, j2: float | None) -> None:
+    """Scalar kernels (two-body and J2) should match the generic array path."""
+    position = np.array([7e6, -1.2e6, 3.4e5])
+    velocity = np.array([1.1e3, 7.4e3, -2.0e2])
+    mu = G * M_EARTH
+
+    pos_scalar, vel_scalar = propagate_orbit(
+        position, velocity, mu, 10.0, method=method, j2=j2, r_eq=R_EARTH
+    )
+    step = _euler_step if method == "euler" else _rk4_step
+    pos_array, vel_array = step(
+        position, velocity, 10.0, lambda p: total_acceleration(p, mu, j2, R_EARTH)
+    )
+
+    np.testing.assert_allclose(pos_scalar, pos_array, rtol=1e-14)
+    np.testing.assert_allclose(vel_scalar, vel_array, rtol=1e-14)
+
+
+@pytest.mark.parametrize("method", ["euler", "rk4", "leapfrog", "saba2"])
+@pytest.mark.parametrize("j2", [None, J2_EARTH])
+def test_propagate_orbit_batch_matches_single(method: str, j2: float | None) -> None:
+    """Batched propagation should match per-state propagate_orbit calls."""
+    rng = np.random.default_rng(7)
+    positions = rng.normal(0.0, 7e6, size=(5, 3))
+    velocities = rng.normal(0.0, 7e3, size=(5, 3))
+    mu = G * M_EARTH
+
+    new_pos, new_vel = propagate_orbit_batch(
+        positions, velocities, mu, 10.0, method=method, j2=j2, r_eq=R_EARTH
+    )
+
+    assert new_pos.shape == (5, 3)
+    for i in range(5):
+        pos, vel = propagate_orbit(
+            positions[i], velocities[i], mu, 10.0, method=method, j2=j2, r_eq=R_EARTH
+        )
+        np.testing.assert_allclose(new_pos[i], pos, rtol=1e-13)
+        np.testing.assert_allclose(new_vel[i], vel, rtol=1e-13)
+
+
+def test_propagate_orbit_batch_zero_position() -> None:
+    """A state at rest at the origin should stay put without producing NaNs."""
+    positions = np.array([[0.0, 0.0, 0.0], [7e6, 0.0, 0.0]])
+    velocities = np.array([[0.0, 0.0, 0.0], [0.0, 7500.0, 0.0]])
+
+    new_pos, new_vel = propagate_orbit_batch(positions, velocities, G * M_EARTH, 1.0)
+
+    assert np.all(np.isfinite(new_pos))
+    np.testing.assert_array_equal(new_vel[0], velocities[0])
+
+
+@pytest.mark.parametrize("method", ["leapfrog", "saba2"])
+def test_symplectic_methods_bound_energy_error(method: str) -> None:
+    """Symplectic integrators should keep energy error bounded over many orbits."""
+    r = 7e6
+    mu = G * M_EARTH
+    position = np.array([r, 0.0, 0.0])
+    velocity = np.array([0.0, 1.1 * np.sqrt(mu / r), 0.0])  # Mildly eccentric
+    E0 = 0.5 * np.dot(velocity, velocity) - mu / np.linalg.norm(position)
+
+    T = 2 * np.pi * np.sqrt(r**3 / mu)
+    dt = T / 200
+    pos, vel = position.copy(), velocity.copy()
+    for _ in range(10 * 200):
+        pos, vel = propagate_orbit(pos, vel, mu, dt, method=method)
+
+    Ef = 0.5 * np.dot(vel, vel) - mu / np.linalg.norm(pos)
+    assert abs(Ef - E0) / abs(E0) < 1e-3
+
+
+def test_propagate_many_orbits_matches_batch() -> None:
+    """Tiled propagation should reproduce stepping propagate_orbit_batch exactly."""
+    rng = np.random.default_rng(3)
+    radius = rng.uniform(7e6, 4e7, size=11)  # Not a multiple of the tile width
+    angle = rng.uniform(0.0, 2 * np.pi, size=11)
+    mu = G * M_EARTH
+    positions = np.column_stack([radius * np.cos(angle), radius * np.sin(angle), np.zeros(11)])
+    speed = np.sqrt(mu / radius)
+    velocities = np.column_stack([-speed * np.sin(angle), speed * np.cos(angle), np.zeros(11)])
+
+    new_pos, new_vel = propagate_many_orbits(positions, velocities, mu, 10.0, n_steps=5)
+
+    ref_pos, ref_vel = positions, velocities
+    for _ in range(5):
+        ref_pos, ref_vel = propagate_orbit_batch(ref_pos, ref_vel, mu, 10.0)
+    np.testing.assert_array_equal(new_pos, ref_pos)
+    np.testing.assert_array_equal(new_vel, ref_vel)
+
+
+@pytest.mark.parametrize("method", ["euler", "rk4", "leapfrog", "saba2"])
+@pytest.mark.parametrize("n_dim", [2, 3])
+def test_propagate_trajectory_batch_matches_stepping(method: str, n_dim: int) -> None:
+    """Fleet trajectories should hold every state of stepping propagate_orbit_batch."""
+    rng = np.random.default_rng(5)
+    positions = rng.normal(0.0, 7e6, size=(4, n_dim))
+    velocities = rng.normal(0.0, 7e3, size=(4, n_dim))
+    mu = G * M_EARTH
+
+    states = propagate_trajectory_batch(
+        positions, velocities, mu, 10.0, 3, method=method, j2=J2_EARTH, r_eq=R_EARTH
+    )
+
+    assert states.shape == (4, 4, 2 * n_dim)
+    pos, vel = positions, velocities
+    for k in range(4):
+        np.testing.assert_array_equal(states[k, :, :n_dim], pos)
+        np.testing.assert_array_equal(states[k, :, n_dim:], vel)
+        pos, vel = propagate_orbit_batch(
+            pos, vel, mu, 10.0, method=method, j2=J2_EARTH, r_eq=R_EARTH
+        )
+
+
+def test_adaptive_closes_circular_orbit() -> None:
+    """Adaptive DOPRI5 should return to the start after one period with long steps."""
+    r = 7e6
+    mu = G * M_EARTH
+    position = np.array([r, 0.0, 0.0])
+    velocity = np.array([0.0, np.sqrt(mu / r), 0.0])
+    T = 2 * np.pi * np.sqrt(r**3 / mu)
+
+    pos, vel = propagate_orbit_adaptive(position, velocity, mu, 600.0, T, rtol=1e-12)
+
+    assert np.linalg.norm(pos - position) < 1e-3
+    assert np.linalg.norm(vel - velocity) < 1e-6
+
+
+def test_adaptive_matches_fine_rk4_with_j2() -> None:
+    """Adaptive J2 propagation should agree with small fixed RK4 steps."""
+    mu = G * M_EARTH
+    position = np.array([7e6, 0.0, 0.0])
+    speed = np.sqrt(mu / 7e6)
+    velocity = np.array([0.0, 0.7 * speed, 0.7 * speed])
+
+    pos, vel = propagate_orbit_adaptive(
+        position, velocity, mu, 600.0, 1000.0, rtol=1e-12, j2=J2_EARTH, r_eq=R_EARTH
+    )
+
+    ref_pos, ref_vel = position, velocity
+    for _ in range(1000):
+        ref_pos, ref_vel = propagate_orbit(ref_pos, ref_vel, mu, 1.0, j2=J2_EARTH, r_eq=R_EARTH)
+    np.testing.assert_allclose(pos, ref_pos, atol=1e-3)
+    np.testing.assert_allclose(vel, ref_vel, atol=1e-6)
+
+
+def test_adaptive_planar_matches_equatorial() -> None:
+    """A 2D state should follow the 3D orbit in the z = 0 plane."""
+    mu = G * M_EARTH
+    speed = np.sqrt(mu / 7e6)
+
+    pos2, vel2 = propagate_orbit_adaptive(
+        np.array([7e6, 0.0]), np.array([0.0, speed]), mu, 600.0, 3000.0, rtol=1e-12
+    )
+    pos3, vel3 = propagate_orbit_adaptive(
+        np.array([7e6, 0.0, 0.0]), np.array([0.0, speed, 0.0]), mu, 600.0, 3000.0, rtol=1e-12
+    )
+    np.testing.assert_allclose(pos2, pos3[:2], atol=1e-3)
+    np.testing.assert_allclose(vel2, vel3[:2], atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    ("dt_max", "t_final", "match"),
+    [(0.0, 10.0, "dt_max"), (60.0, -10.0, "t_final")],
+)
+def test_adaptive_invalid_arguments(dt_max: float, t_final: float, match: str) -> None:
+    """A non-positive maximum step or negative end time should raise ValueError."""
+    with pytest.raises(ValueError, match=match):
+        propagate_orbit_adaptive(
+            np.array([7e6, 0.0, 0.0]), np.zeros(3), G * M_EARTH, dt_max, t_final
+        )
+
+
+@pytest.mark.parametrize("method", list(IntegrationMethod))
+def test_integration_method_enum_matches_name(method: IntegrationMethod) -> None:
+    """Passing the enum should dispatch to the same integrator as its name."""
+    position = np.array([7e6, 1e5, -2e5])
+    velocity = np.array([0.0, 7.5e3, 100.0])
+    mu = G * M_EARTH
+
+    by_enum = propagate_orbit(position, velocity, mu, 10.0, method=method)
+    by_name = propagate_orbit(position, velocity, mu, 10.0, method=method.name.lower())
+    np.testing.assert_array_equal(by_enum[0], by_name[0])
+    np.testing.assert_array_equal(by_enum[1], by_name[1])
+
+
+@pytest.mark.parametrize("method", ["verlet", 7])
+def test_unknown_integration_method(method: str | int) -> None:
+    """Unknown names and out-of-range indices should raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown integration method"):
+        propagate_orbit(np.array([7e6, 0.0, 0.0]), np.zeros(3), G * M_EARTH, 1.0, method=method)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("method", "j2"),
+    [("rk4", None), ("rk4", J2_EARTH), ("leapfrog", None)],
+)
+def test_propagate_trajectory_matches_stepping(method: str, j2: float | None) -> None:
+    """Every trajectory row should equal stepping propagate_orbit from the start."""
+    mu = G * M_EARTH
+    r_eq = R_EARTH if j2 is not None else None
+    position = np.array([R_EARTH + 700e3, 0.0, 1e5])
+    velocity = np.array([0.0, 7.5e3, 1e2])
+
+    accels = np.empty((7, 3))
+    states = propagate_trajectory(
+        position, velocity, mu, 10.0, 6, method=method, j2=j2, r_eq=r_eq, accel_out=accels
+    )
+
+    assert states.shape == (7, 6)
+    np.testing.assert_array_equal(states[0], np.concatenate([position, velocity]))
+    for row in states[1:]:
+        position, velocity = propagate_orbit(position, velocity, mu, 10.0, method, j2, r_eq)
+        np.testing.assert_array_equal(row, np.concatenate([position, velocity]))
+    for row, accel in zip(states, accels, strict=True):
+        np.testing.assert_array_equal(accel, total_acceleration(row[:3], mu, j2, r_eq))
+
+
+@pytest.mark.parametrize("n_dim", [2, 3])
+@pytest.mark.parametrize("j2", [None, J2_EARTH])
+def test_total_acceleration_batch_matches_single(n_dim: int, j2: float | None) -> None:
+    """Batched accelerations should match total_acceleration row by row."""
+    mu = G * M_EARTH
+    r_eq = R_EARTH if j2 is not None else None
+    positions = np.random.default_rng(4).uniform(-4e7, 4e7, (9, n_dim))
+
+    batch = total_acceleration_batch(positions, mu, j2, r_eq)
+
+    expected = np.array([total_acceleration(p, mu, j2, r_eq) for p in positions])
+    np.testing.assert_allclose(batch, expected, rtol=1e-14)
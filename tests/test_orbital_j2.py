@@ -1,9 +1,14 @@
 """Tests for J2 orbital perturbations."""
 
 import numpy as np
+import pytest
 
 from outofthisworld.physics.constants import J2_EARTH, M_EARTH, R_EARTH, G
-from outofthisworld.physics.orbital import j2_acceleration, total_acceleration
+from outofthisworld.physics.orbital import (
+    j2_acceleration,
+    total_acceleration,
+    two_body_acceleration,
+)
 
 
 def test_j2_acceleration_magnitude() -> None:
@@ -64,3 +69,20 @@ def test_total_acceleration_without_j2() -> None:
     accel_total = total_acceleration(position, mu)
 
     assert np.allclose(accel_2body, accel_total)
+
+
+@pytest.mark.parametrize(
+    "position",
+    [np.array([R_EARTH * 1.1, -R_EARTH * 0.4]), np.array([R_EARTH, R_EARTH * 0.3, -R_EARTH * 0.7])],
+)
+def test_total_acceleration_matches_sum_of_terms(position: np.ndarray) -> None:
+    """Fused two-body + J2 should equal the separately computed terms (2D and 3D)."""
+    mu = G * M_EARTH
+
+    expected = two_body_acceleration(position, mu) + j2_acceleration(
+        position, mu, J2_EARTH, R_EARTH
+    )
+
+    np.testing.assert_allclose(
+        total_acceleration(position, mu, J2_EARTH, R_EARTH), expected, rtol=1e-13
+    )
@@ -0,0 +1,60 @@
+"""Tests for relativistic corrections."""
+
+import pytest
+
+from outofthisworld.physics.constants import M_EARTH, M_SUN, C, G
+from outofthisworld.physics.relativity import gravitational_redshift, schwarzschild_radius
+
+MU_SUN = 1.32712440018e20
+R_SUN = 6.957e8
+AU = 1.495978707e11
+
+
+@pytest.mark.parametrize(
+    ("r1", "r2", "mu"),
+    [
+        (6.378e6, 4.2164e7, G * M_EARTH),  # Earth surface to GEO
+        (4.2164e7, 6.378e6, G * M_EARTH),  # GEO down to the surface
+        (R_SUN, AU, MU_SUN),  # Solar surface to 1 AU
+    ],
+)
+def test_redshift_series_matches_exact(r1: float, r2: float, mu: float) -> None:
+    """Weak-field series should agree with the closed form to double precision."""
+    series = gravitational_redshift(r1, r2, mu)
+    exact = gravitational_redshift(r1, r2, mu, exact=True)
+    assert series == pytest.approx(exact, rel=1e-15, abs=0.0)
+
+
+def test_redshift_strong_field_uses_closed_form() -> None:
+    """Outside the weak-field limit the default path matches exact=True."""
+    mu = 1.4 * G * M_SUN  # Neutron star surface to 1 AU
+    default = gravitational_redshift(12e3, AU, mu)
+    exact = gravitational_redshift(12e3, AU, mu, exact=True)
+    assert default == exact
+    assert default > 1.2
+
+
+def test_redshift_inside_horizon_raises() -> None:
+    """A radius inside the Schwarzschild radius has no static observer."""
+    mu = G * M_SUN
+    r_s = schwarzschild_radius(M_SUN)
+    with pytest.raises(ValueError, match="inside the horizon"):
+        gravitational_redshift(0.5 * r_s, AU, mu)
+    with pytest.raises(ValueError, match="inside the horizon"):
+        gravitational_redshift(0.5 * r_s, AU, mu, exact=True)
+
+
+def test_redshift_reciprocal_and_degenerate() -> None:
+    """Swapping the radii inverts the ratio; a zero radius gives no shift."""
+    mu = G * M_EARTH
+    up = gravitational_redshift(6.378e6, 4.2164e7, mu)
+    down = gravitational_redshift(4.2164e7, 6.378e6, mu)
+    assert up * down == pytest.approx(1.0, abs=1e-15)
+    assert gravitational_redshift(0.0, 4.2164e7, mu) == 1.0
+
+
+def test_schwarzschild_radius_earth() -> None:
+    """Earth's Schwarzschild radius is 2GM/c^2, about 8.87 mm."""
+    r_s = schwarzschild_radius(M_EARTH)
+    assert r_s == pytest.approx(2 * G * M_EARTH / C**2, rel=1e-15)
+    assert r_s == pytest.approx(8.87e-3, rel=1e-3)
@@ -0,0 +1,64 @@
+"""Tests for report generation and data export."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from outofthisworld.output.reports import save_results_csv, save_results_parquet
+from outofthisworld.sensors.imu_profiles import QUANTUM_IMU
+from outofthisworld.sim.experiments import ExperimentResults, run_coast_scenario
+
+
+@pytest.fixture(scope="module")
+def results() -> ExperimentResults:
+    """Short coast run shared by the export tests."""
+    return run_coast_scenario(imu_profile=QUANTUM_IMU, duration_s=30.0, dt=1.0, seed=42)
+
+
+class TestSaveResultsCsv:
+    """Tests for CSV export."""
+
+    def test_csv_columns_and_formatting(self, results: ExperimentResults, tmp_path: Path) -> None:
+        """CSV should hold one formatted row per step with the expected header."""
+        path = tmp_path / "results.csv"
+        save_results_csv(results, path)
+
+        data = path.read_bytes()
+        assert b"\r\r" not in data  # no text-mode translation of the line endings
+        lines = data.split(b"\r\n")
+        assert lines[0] == b"time_s,pos_error_m,vel_error_m_s,pos_3sigma_m,vel_3sigma_m_s"
+        assert len(lines) == len(results.time) + 2  # header + rows + trailing newline
+
+        row = lines[-2].decode().split(",")
+        assert row[0] == f"{results.time[-1]:.2f}"
+        assert row[1] == f"{np.linalg.norm(results.pos_error[-1]):.6e}"
+        assert row[3] == f"{3.0 * np.linalg.norm(results.pos_sigma[-1]):.6e}"
+
+
+class TestSaveResultsParquet:
+    """Tests for Parquet export."""
+
+    def test_parquet_round_trip(self, results: ExperimentResults, tmp_path: Path) -> None:
+        """Parquet columns should round-trip at full precision."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "results.parquet"
+        save_results_parquet(results, path)
+
+        table = pq.read_table(path)
+        assert table.column_names[0] == "time_s"
+        np.testing.assert_array_equal(table.column("time_s").to_numpy(), results.time)
+        np.testing.assert_array_equal(
+            table.column("pos_error_m").to_numpy(),
+            results.pos_error_norm,
+        )
+
+    def test_parquet_without_pyarrow_raises(
+        self, results: ExperimentResults, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A missing pyarrow should surface only when Parquet export is requested."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+        with pytest.raises(ImportError, match="requires pyarrow"):
+            save_results_parquet(results, tmp_path / "results.parquet")
@@ -0,0 +1,193 @@
+"""Tests for the simulation runner."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from outofthisworld.estimation.gravity_measurements import GravityMeasurementModel
+from outofthisworld.estimation.kalman import ExtendedKalmanFilter
+from outofthisworld.estimation.measurement_types import MeasurementType
+from outofthisworld.physics.constants import M_EARTH, R_EARTH, G
+from outofthisworld.physics.orbital import propagate_orbit, two_body_jacobian
+from outofthisworld.sensors.imu import IMU
+from outofthisworld.sim import runner as runner_module
+from outofthisworld.sim.runner import SimulationRunner, _gaussian_noise
+from outofthisworld.sim.scenario import Scenario
+from outofthisworld.sim.sinks import InMemorySink, NpyMemmapSink
+
+MU = G * M_EARTH
+R0 = R_EARTH + 700e3
+P0 = np.array([R0, 0.0, 0.0])
+V0 = np.array([0.0, np.sqrt(MU / R0), 0.0])
+
+
+def _make_runner(
+    duration: float = 100.0, dt: float = 10.0, sink: InMemorySink | NpyMemmapSink | None = None
+) -> SimulationRunner:
+    """Runner with a 2D gravity-vector EKF on a circular LEO orbit."""
+    model = GravityMeasurementModel(
+        measurement_type=MeasurementType.GRAVITY_VECTOR_INERTIAL,
+        mu=MU,
+        noise_std=1e-4,
+    )
+    ekf = ExtendedKalmanFilter(
+        initial_state=np.concatenate([P0[:2], V0[:2]]),
+        initial_covariance=np.diag([1e6, 1e6, 100.0, 100.0]),
+        process_noise=np.diag([10.0, 10.0, 1.0, 1.0]),
+        measurement_noise=model.measurement_noise_cov(4),
+    )
+    scenario = Scenario(P0, V0, MU, duration, dt=dt)
+    return SimulationRunner(scenario, estimator=ekf, measurement_model=model, seed=0, sink=sink)
+
+
+def test_run_history_shapes() -> None:
+    """Histories should hold one row per step plus the initial state."""
+    results = _make_runner(duration=100.0, dt=10.0).run()
+
+    assert results["true_states"].shape == (11, 6)
+    assert results["estimated_states"].shape == (11, 4)
+    assert results["estimated_covariances"].shape == (11, 4, 4)
+    assert results["measurements"].shape == (10, 2)
+    np.testing.assert_array_equal(results["true_states"][0], np.concatenate([P0, V0]))
+    np.testing.assert_array_equal(results["estimated_states"][0, :2], P0[:2])
+
+
+def test_run_legacy_imu_measurements() -> None:
+    """Legacy IMU runs should store one scalar magnitude per step."""
+    scenario = Scenario(P0, V0, MU, 50.0, dt=10.0)
+    results = SimulationRunner(scenario, imu=IMU(noise_std=0.0, bias=0.0, seed=1)).run()
+
+    assert results["measurements"].shape == (5,)
+    assert "estimated_states" not in results
+    positions = results["true_states"][1:, :3]
+    expected = MU / np.sum(positions**2, axis=1)  # |a| = mu / r^2
+    np.testing.assert_allclose(results["measurements"], expected, rtol=1e-6)
+
+
+def test_run_true_states_follow_propagator() -> None:
+    """Stored truth should match stepping propagate_orbit directly."""
+    results = _make_runner(duration=50.0, dt=10.0).run()
+
+    position, velocity = P0.copy(), V0.copy()
+    for step in range(5):
+        position, velocity = propagate_orbit(position, velocity, MU, 10.0, method="rk4")
+        np.testing.assert_array_equal(results["true_states"][step + 1, :3], position)
+        np.testing.assert_array_equal(results["true_states"][step + 1, 3:], velocity)
+
+
+def test_run_is_repeatable() -> None:
+    """Running twice should reset the histories and the noise stream."""
+    runner = _make_runner(duration=30.0, dt=10.0)
+    first = {k: v.copy() for k, v in runner.run().items()}
+    runner.estimator = _make_runner().estimator
+    second = runner.run()
+
+    for key, value in first.items():
+        np.testing.assert_array_equal(second[key], value)
+
+
+def test_run_returns_history_buffers_without_copy() -> None:
+    """Results should be the runner's histories, and a rerun should not overwrite them."""
+    runner = _make_runner(duration=30.0, dt=10.0)
+    first = runner.run()
+
+    assert first["true_states"] is runner.true_states
+    assert first["estimated_states"] is runner.estimated_states
+    snapshot = first["estimated_states"].copy()
+    runner.run()
+    np.testing.assert_array_equal(first["estimated_states"], snapshot)
+
+
+def test_transition_jacobian_matches_block_form(monkeypatch: pytest.MonkeyPatch) -> None:
+    """In-place transition Jacobian should equal the np.block construction."""
+    runner = _make_runner(duration=20.0, dt=10.0)
+    ekf = runner.estimator
+    assert ekf is not None
+    captured = []
+    predict = ekf.predict
+
+    def spy(f: Callable[..., NDArray[np.float64]], F: NDArray[np.float64], dt: float) -> None:
+        captured.append((ekf.state[:2].copy(), F.copy()))
+        predict(f, F, dt)
+
+    monkeypatch.setattr(ekf, "predict", spy)
+    runner.run()
+
+    eye = np.eye(2)
+    assert len(captured) == 2
+    for pos, F in captured:
+        daccel_dpos = two_body_jacobian(pos, MU)
+        np.testing.assert_array_equal(F, np.block([[eye, 10.0 * eye], [10.0 * daccel_dpos, eye]]))
+
+
+def test_gaussian_noise_diagonal_and_full_covariance() -> None:
+    """Diagonal R should scale the normal stream; full R should match its covariance."""
+    diag_cov = np.diag([4.0, 0.25])
+    np.testing.assert_array_equal(
+        _gaussian_noise(np.random.default_rng(3), 5, diag_cov),
+        np.random.default_rng(3).standard_normal((5, 2)) * np.array([2.0, 0.5]),
+    )
+
+    full_cov = np.array([[2.0, 0.8], [0.8, 1.0]])
+    samples = _gaussian_noise(np.random.default_rng(3), 200_000, full_cov)
+    np.testing.assert_allclose(np.cov(samples.T), full_cov, atol=0.02)
+
+
+def test_back_to_back_predictions_do_not_alias() -> None:
+    """Predicting from a state held in the prediction buffer should still be exact."""
+    runner = _make_runner(duration=10.0, dt=10.0)
+    runner.run()
+    ekf = runner.estimator
+    assert ekf is not None
+    ekf.state = np.concatenate([P0[:2], V0[:2]])
+
+    expected = ekf.state.copy()
+    for _ in range(2):
+        accel = -MU * expected[:2] / np.linalg.norm(expected[:2]) ** 3
+        expected = np.concatenate([expected[:2] + 10.0 * expected[2:], expected[2:] + 10.0 * accel])
+        runner._predict_estimator(10.0)
+        np.testing.assert_allclose(ekf.state, expected, rtol=1e-14)
+
+
+def test_sink_streams_histories_in_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Chunked sink writes should reproduce the in-memory histories exactly."""
+    monkeypatch.setattr(runner_module, "_SINK_CHUNK_ROWS", 4)
+    expected = _make_runner(duration=100.0, dt=10.0).run()
+    sink = InMemorySink()
+    results = _make_runner(duration=100.0, dt=10.0, sink=sink).run()
+
+    assert "estimated_covariances" not in results
+    assert sink.arrays.keys() == expected.keys()
+    for key, value in expected.items():
+        np.testing.assert_array_equal(sink.arrays[key], value)
+
+
+def test_npy_memmap_sink_round_trip(tmp_path: Path) -> None:
+    """Memory-mapped sink files should load back as the run's histories."""
+    expected = _make_runner(duration=50.0, dt=10.0).run()
+    _make_runner(duration=50.0, dt=10.0, sink=NpyMemmapSink(tmp_path)).run()
+
+    for key, value in expected.items():
+        np.testing.assert_array_equal(np.load(tmp_path / f"{key}.npy"), value)
+
+
+def test_run_fleet_matches_single_craft_runs() -> None:
+    """Each fleet member should follow the same truth as a single-craft run."""
+    v_circ = np.sqrt(MU / R0)
+    states = np.array(
+        [
+            np.concatenate([P0, V0]),
+            [0.0, R0, 0.0, -v_circ, 0.0, 0.0],
+            [R0, 0.0, 0.0, 0.0, 0.7 * v_circ, 0.7 * v_circ],
+        ]
+    )
+    fleet = _make_runner(duration=50.0, dt=10.0).run_fleet(states)
+
+    assert fleet.shape == (6, 3, 6)
+    for i, state in enumerate(states):
+        scenario = Scenario(state[:3], state[3:], MU, 50.0, dt=10.0)
+        expected = SimulationRunner(scenario).run()["true_states"]
+        np.testing.assert_array_equal(fleet[:, i], expected)
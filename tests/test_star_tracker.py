@@ -39,6 +39,15 @@ class TestStarTrackerConfig:
         # 1 arcsec ≈ 4.848e-6 rad
         assert abs(config.accuracy_rad - 4.848136811095360e-6) < 1e-12
 
+    def test_noise_cov_cached_and_read_only(self) -> None:
+        """Noise covariance should be built once per config and not writable."""
+        cov = STANDARD_STAR_TRACKER.noise_cov
+
+        assert StarTracker(config=STANDARD_STAR_TRACKER).get_measurement_noise_cov() is cov
+        assert not cov.flags.writeable
+        with pytest.raises(ValueError):
+            cov[0, 0] = 1.0
+
     def test_get_config_standard(self) -> None:
         """get_star_tracker_config should return standard config."""
         config = get_star_tracker_config("standard")
@@ -70,6 +79,43 @@ class TestStarTracker:
 
         np.testing.assert_array_equal(meas1, meas2)
 
+    def test_force_measure_series_matches_loop(self) -> None:
+        """Batched measurements should reproduce consecutive force_measure calls."""
+        true_att = np.array([[0.1, 0.2, 0.3], [0.0, -0.1, 0.2], [0.3, 0.0, 0.0]])
+
+        batched = StarTracker(seed=7).force_measure_series(true_att)
+        st = StarTracker(seed=7)
+        looped = np.array([st.force_measure(att) for att in true_att])
+
+        np.testing.assert_array_equal(batched, looped)
+
+    def test_buffered_noise_keeps_stream_order(self) -> None:
+        """Interleaved single and batched measurements should read one noise stream."""
+        st = StarTracker(seed=7)
+        acc = st.config.accuracy_rad
+        expected = np.random.default_rng(7).standard_normal((4100, 3)) * acc
+        zeros = np.zeros(3)
+
+        first = st.force_measure(zeros)
+        middle = st.force_measure_series(np.zeros((4096, 3)))
+        last = st.measure(zeros, time=0.0)
+
+        np.testing.assert_array_equal(first, expected[0])
+        np.testing.assert_array_equal(middle, expected[1:4097])
+        np.testing.assert_array_equal(last, expected[4097])
+        assert st.force_measure_series(np.zeros((2, 3))).shape == (2, 3)
+
+    def test_bit_generator_selects_stream(self) -> None:
+        """SFC64 trackers should be reproducible but differ from the PCG64 stream."""
+        true_att = np.zeros(3)
+
+        sfc1 = StarTracker(seed=42, bit_generator="sfc64").force_measure(true_att)
+        sfc2 = StarTracker(seed=42, bit_generator="sfc64").force_measure(true_att)
+        pcg = StarTracker(seed=42).force_measure(true_att)
+
+        np.testing.assert_array_equal(sfc1, sfc2)
+        assert not np.array_equal(sfc1, pcg)
+
     def test_measurement_adds_noise(self) -> None:
         """Measurement should differ from true attitude."""
         st = StarTracker(seed=42)
@@ -84,13 +130,8 @@ class TestStarTracker:
         st = StarTracker(config=STANDARD_STAR_TRACKER, seed=42)
 
         n_samples = 1000
-        errors = []
-
-        for _ in range(n_samples):
-            st.reset(seed=None)  # New seed each time
-            true_att = np.zeros(3)
-            meas = st.force_measure(true_att)
-            errors.append(np.linalg.norm(meas))
+        meas = st.force_measure_series(np.zeros((n_samples, 3)))
+        errors = np.linalg.norm(meas, axis=1)
 
         std_error = np.std(errors)
 
@@ -151,3 +192,19 @@ class TestStarTracker:
 
         # Should be available immediately again
         assert st.is_available(0.0)
+
+    def test_reset_replays_seeded_stream(self) -> None:
+        """Reset should rewind a seeded tracker's noise without a new generator."""
+        st = StarTracker(seed=42)
+        rng = st._rng
+        first = st.force_measure(np.zeros(3))
+        st.force_measure(np.zeros(3))
+
+        st.reset()
+
+        assert st._rng is rng
+        np.testing.assert_array_equal(st.force_measure(np.zeros(3)), first)
+        st.reset(seed=7)
+        np.testing.assert_array_equal(
+            st.force_measure(np.zeros(3)), StarTracker(seed=7).force_measure(np.zeros(3))
+        )
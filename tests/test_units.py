@@ -33,3 +33,14 @@ def test_convert_unsupported() -> None:
     """Test unsupported conversion raises error."""
     with pytest.raises(ValueError, match="Unsupported unit conversion"):
         convert_units(1.0, "invalid", "m")
+
+
+@pytest.mark.parametrize(
+    ("from_unit", "to_unit"),
+    [("km", "m"), ("au", "m"), ("deg", "rad"), ("hour", "s"), ("day", "s")],
+)
+def test_convert_round_trip(from_unit: str, to_unit: str) -> None:
+    """Forward and reverse conversions should invert each other."""
+    value = 123.456
+    back = convert_units(convert_units(value, from_unit, to_unit), to_unit, from_unit)
+    assert back == pytest.approx(value, rel=1e-15)